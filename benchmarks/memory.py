@@ -0,0 +1,218 @@
+"""Measure the memory used by bindings with tracemalloc and check that disposed ViewModels are garbage collected.
+
+For each framework (Trame, PyQt6, Panel) many ViewModels are created, each with one binding connected to the View,
+and the memory allocated is reported per binding and per connected attribute. The ViewModels are then disposed
+(their bindings are disconnected) and dropped: the memory still allocated and the number of ViewModels that were
+not collected are reported. For Trame the retained memory includes the state variables, which Trame keeps.
+
+Run from the repository root with ``python -m benchmarks.memory``. With ``--history memory.json`` the results are
+appended to a JSON file with the version of nova-mvvm and compared with the previous entry, to track them over
+releases. ``--check`` exits with an error if a disposed ViewModel was not collected.
+"""
+
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import os
+import platform
+import sys
+import tracemalloc
+import weakref
+from importlib.metadata import version
+from typing import Any, Callable, Dict, List, Optional, cast
+
+import param
+
+from nova.mvvm.interface import BindingInterface
+from tests.model import User
+
+# number of attributes connected in addition to the first one to measure the cost of an attribute
+ATTRIBUTES = 20
+METRICS = ("binding_bytes", "attribute_bytes", "retained_bytes", "not_collected")
+
+_names = itertools.count()
+
+
+class Attributes:
+    """Plain object with numbered attributes, connected attribute by attribute."""
+
+    def __init__(self, count: int) -> None:
+        for i in range(count):
+            setattr(self, f"value_{i}", i)
+
+
+class Widget(param.Parameterized):
+    """Minimal Panel widget."""
+
+    value = param.Integer(default=0)
+
+
+class ViewModel:
+    """ViewModel with one binding, its callback keeps a reference to the ViewModel as in applications."""
+
+    def __init__(self, binding: BindingInterface, attributes: int) -> None:
+        self.model: Any = Attributes(attributes) if attributes else User()
+        self.attributes = list(vars(self.model)) if attributes else None
+        self.binding = binding.new_bind(self.model, self.attributes, self.on_update)
+
+    def on_update(self, _results: Dict[str, Any]) -> None:
+        pass
+
+    def dispose(self) -> None:
+        self.binding.disconnect()
+
+
+def ignore(*_args: Any) -> None:
+    pass
+
+
+def trame_factory() -> Callable[[int], ViewModel]:
+    from trame.app import get_server
+
+    from nova.mvvm.trame_binding import TrameBinding
+
+    binding = TrameBinding(get_server("nova_mvvm_memory").state)
+
+    def create(attributes: int) -> ViewModel:
+        view_model = ViewModel(binding, attributes)
+        view_model.binding.connect(f"view_model_{next(_names)}")
+        return view_model
+
+    return create
+
+
+def pyqt_factory() -> Callable[[int], ViewModel]:
+    from PyQt6.QtCore import QCoreApplication
+
+    from nova.mvvm._internal.pyqt_communicator import PyQtCommunicator
+    from nova.mvvm.pyqt6_binding import PyQt6Binding
+
+    QCoreApplication.instance() or QCoreApplication(sys.argv[:1])
+    binding = PyQt6Binding()
+
+    def create(attributes: int) -> ViewModel:
+        view_model = ViewModel(binding, attributes)
+        view_model.binding.connect(f"view_model_{next(_names)}", ignore)
+        for attribute in view_model.attributes or []:
+            cast(PyQtCommunicator, view_model.binding).connect_field(attribute, ignore)
+        return view_model
+
+    return create
+
+
+def panel_factory() -> Callable[[int], ViewModel]:
+    from nova.mvvm.panel_binding import PanelBinding
+
+    binding = PanelBinding()
+    # the View outlives the ViewModels, its widgets are not measured
+    widgets = [Widget() for _ in range(ATTRIBUTES + 1)]
+
+    def create(attributes: int) -> ViewModel:
+        view_model = ViewModel(binding, attributes)
+        if view_model.attributes:
+            view_model.binding.connect(
+                {
+                    attribute: (widget, "value")
+                    for attribute, widget in zip(view_model.attributes, widgets, strict=False)
+                }
+            )
+        else:
+            view_model.binding.connect(ignore)
+        return view_model
+
+    return create
+
+
+FACTORIES = {"trame": trame_factory, "pyqt6": pyqt_factory, "panel": panel_factory}
+
+
+def allocated() -> int:
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0]
+
+
+def measure(create: Callable[[int], ViewModel], count: int, attributes: int) -> Dict[str, float]:
+    """Create and dispose ViewModels, return the memory used and retained per ViewModel."""
+    start = allocated()
+    view_models = [create(attributes) for _ in range(count)]
+    used = allocated() - start
+    references = [weakref.ref(view_model) for view_model in view_models]
+    while view_models:
+        view_models.pop().dispose()
+    gc.collect()
+    not_collected = sum(reference() is not None for reference in references)
+    del references
+    return {"used": used / count, "retained": (allocated() - start) / count, "not_collected": not_collected}
+
+
+def run(frameworks: List[str], count: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    tracemalloc.start()
+    try:
+        for framework in frameworks:
+            create = FACTORIES[framework]()
+            measure(create, 10, 1)  # warm up caches (validators, imports)
+            model = measure(create, count, 0)
+            one = measure(create, count, 1)
+            many = measure(create, count, ATTRIBUTES + 1)
+            results[framework] = {
+                "binding_bytes": model["used"],
+                "attribute_bytes": (many["used"] - one["used"]) / ATTRIBUTES,
+                "retained_bytes": model["retained"],
+                "not_collected": model["not_collected"] + one["not_collected"] + many["not_collected"],
+            }
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def update_history(path: str, results: Dict[str, Dict[str, float]]) -> Optional[Dict[str, Any]]:
+    """Append the results to the history file, return the previous entry."""
+    history = []
+    if os.path.exists(path):
+        with open(path) as file:
+            history = json.load(file)
+    previous = history[-1] if history else None
+    history.append(
+        {
+            "version": version("nova-mvvm"),
+            "python": platform.python_version(),
+            "date": datetime.date.today().isoformat(),
+            "results": results,
+        }
+    )
+    with open(path, "w") as file:
+        json.dump(history, file, indent=2)
+    return previous
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--frameworks", nargs="+", choices=list(FACTORIES), default=list(FACTORIES))
+    parser.add_argument("--count", type=int, default=200, help="number of ViewModels created per measurement")
+    parser.add_argument("--history", help="JSON file the results are appended to")
+    parser.add_argument("--check", action="store_true", help="fail if a disposed ViewModel was not collected")
+    args = parser.parse_args(argv)
+
+    results = run(args.frameworks, args.count)
+    previous = update_history(args.history, results) if args.history else None
+
+    print(f"{'framework':<12}{'per binding, B':>16}{'per attribute, B':>18}{'retained, B':>13}{'not collected':>15}")
+    for framework, result in results.items():
+        print(
+            f"{framework:<12}{result['binding_bytes']:>16.0f}{result['attribute_bytes']:>18.0f}"
+            f"{result['retained_bytes']:>13.0f}{result['not_collected']:>15}"
+        )
+        before = previous["results"].get(framework) if previous else None
+        if before:
+            changes = ", ".join(f"{metric} {result[metric] - before.get(metric, 0):+.0f}" for metric in METRICS)
+            print(f"{'':<12}since {previous['version']}: {changes}")  # type: ignore[index]
+
+    if args.check and any(result["not_collected"] for result in results.values()):
+        sys.exit("disposed ViewModels were not collected")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Compare Trame state serializers: encoded size and CPU time.
+
+Run from the repository root with ``python -m benchmarks.serializers``.
+"""
+
+import timeit
+from functools import partial
+from typing import Any, Callable, List, Tuple
+
+import msgpack
+import numpy as np
+from pydantic import BaseModel
+
+from nova.mvvm.trame_binding import DefaultSerializer, MsgpackSerializer, OrjsonSerializer, StateSerializer
+from tests.model import Range, User
+from tests.ndarray_model import Spectrum
+
+
+def time_call(func: Callable[[], Any]) -> float:
+    """Return the average duration of a call in milliseconds."""
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=3, number=number)) / number * 1000
+
+
+def wire_size(value: Any) -> int:
+    # Trame sends the state with msgpack (via wslink), memoryviews are packed as binary data
+    return len(msgpack.packb(value))
+
+
+def benchmark_models() -> List[Tuple[str, BaseModel]]:
+    return [
+        ("User", User()),
+        ("User (10k ranges)", User(ranges=[Range(min_value=i, max_value=i + 1) for i in range(10_000)])),
+        ("Spectrum (1M points)", Spectrum(counts=np.random.default_rng(0).random(1_000_000))),
+    ]
+
+
+def main() -> None:
+    serializers: List[Tuple[str, StateSerializer]] = [
+        ("default", DefaultSerializer()),
+        ("orjson", OrjsonSerializer()),
+        ("msgpack", MsgpackSerializer()),
+    ]
+    print(f"{'model':<22}{'serializer':<12}{'size, bytes':>14}{'dump, ms':>12}{'validate, ms':>14}")
+    for model_name, model in benchmark_models():
+        for serializer_name, serializer in serializers:
+            value = serializer.dump_model(model)
+            size = wire_size(value)
+            dump_time = time_call(partial(serializer.dump_model, model))
+            validate_time = time_call(partial(serializer.validate_model, type(model), value))
+            print(f"{model_name:<22}{serializer_name:<12}{size:>14}{dump_time:>12.3f}{validate_time:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Load test of Trame bindings with concurrent websocket clients: throughput, latency and server resources.
+
+A Trame server with one bound model per client runs in a subprocess. Each simulated client connects to it with
+the wslink protocol used by the browser, edits its model through ``trame.state.update`` as fast as possible and
+waits until ``callback_after_update`` has acknowledged the edit through another bound model pushed to the client.
+The test is repeated for an increasing number of clients, server CPU and memory are read from ``/proc`` (Linux).
+
+Run from the repository root with ``python -m benchmarks.trame_load``, e.g.
+``python -m benchmarks.trame_load --clients 1 4 16 --duration 5 --values 1000``.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+import msgpack
+from pydantic import BaseModel, Field
+from wslink.chunking import UnChunker, generate_chunks
+
+SECRET = "wslink-secret"
+# widths of the columns of the results
+WIDTHS = (8, 12, 10, 10, 10, 9, 10)
+
+
+class Edit(BaseModel):
+    """Model edited by a client."""
+
+    seq: int = 0
+    label: str = ""
+    values: List[float] = Field(default_factory=list)
+
+
+class Ack(BaseModel):
+    """Last edit processed by the ViewModel."""
+
+    seq: int = 0
+
+
+def serve(clients: int, port: int) -> None:
+    """Run a Trame server with an edit and an ack binding per client, prints READY when it accepts clients."""
+    from trame.app import get_server
+
+    from nova.mvvm.trame_binding import TrameBinding
+
+    server = get_server("nova_mvvm_load_test")
+    binding = TrameBinding(server.state)
+    for i in range(clients):
+        edit, ack = Edit(), Ack()
+        ack_binding = binding.new_bind(ack)
+        ack_binding.connect(f"ack_{i}")
+
+        def acknowledge(
+            _results: Dict[str, Any], edit: Edit = edit, ack: Ack = ack, ack_binding: Any = ack_binding
+        ) -> None:
+            ack.seq = edit.seq
+            ack_binding.update_in_view(ack)
+
+        binding.new_bind(edit, callback_after_update=acknowledge).connect(f"edit_{i}")
+
+    server.controller.on_server_ready.add(lambda **_: print("READY", flush=True))
+    server.start(port=port, open_browser=False, show_connection_info=False, disable_logging=True)
+
+
+class Client:
+    """Simulated browser: sends state updates and waits for their acknowledgement."""
+
+    def __init__(self, index: int, values: int) -> None:
+        self.index = index
+        self.values = [float(v) for v in range(values)]
+        self.latencies: List[float] = []
+        self._unchunker = UnChunker()
+        self._unchunker.set_max_message_size(1 << 32)
+        self._rpc = 0
+
+    async def _send(self, ws: aiohttp.ClientWebSocketResponse, method: str, args: List[Any], rpc: str = "rpc") -> str:
+        self._rpc += 1
+        rpc_id = f"{rpc}:c{self.index}:{self._rpc}"
+        message = msgpack.packb({"wslink": "1.0", "id": rpc_id, "method": method, "args": args, "kwargs": {}})
+        for chunk in generate_chunks(message, 0):
+            await ws.send_bytes(chunk)
+        return rpc_id
+
+    async def _receive(self, ws: aiohttp.ClientWebSocketResponse) -> Dict[str, Any]:
+        while True:
+            message = await ws.receive()
+            if message.type != aiohttp.WSMsgType.BINARY:
+                raise ConnectionError(f"unexpected message {message.type}")
+            content = self._unchunker.process_chunk(message.data)
+            if content is not None:
+                return content
+
+    async def run(self, session: aiohttp.ClientSession, url: str, duration: float) -> None:
+        async with session.ws_connect(url, max_msg_size=0) as ws:
+            hello = await self._send(ws, "wslink.hello", [{"secret": SECRET}], rpc="system")
+            while (await self._receive(ws)).get("id") != hello:
+                pass
+            seq = 0
+            deadline = time.perf_counter() + duration
+            while time.perf_counter() < deadline:
+                seq += 1
+                value = {"seq": seq, "label": f"edit {seq}", "values": self.values}
+                start = time.perf_counter()
+                await self._send(ws, "trame.state.update", [[{"key": f"edit_{self.index}", "value": value}]])
+                while not self._is_ack(await self._receive(ws), seq):
+                    pass
+                self.latencies.append(time.perf_counter() - start)
+
+    def _is_ack(self, message: Dict[str, Any], seq: int) -> bool:
+        if not str(message.get("id", "")).startswith("publish:"):
+            return False
+        ack = (message.get("result") or {}).get(f"ack_{self.index}")
+        return isinstance(ack, dict) and ack.get("seq") == seq
+
+
+def process_usage(pid: int) -> Tuple[float, int]:
+    """Return the CPU time (seconds) and the resident memory (bytes) of a process."""
+    with open(f"/proc/{pid}/stat") as file:
+        fields = file.read().rsplit(")", 1)[1].split()
+    cpu = (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    with open(f"/proc/{pid}/statm") as file:
+        rss = int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    return cpu, rss
+
+
+def percentile(values: List[float], p: float) -> float:
+    values = sorted(values)
+    return values[min(int(p * len(values)), len(values) - 1)] if values else float("nan")
+
+
+async def run_level(port: int, clients: int, duration: float, values: int, pid: int) -> Dict[str, float]:
+    url = f"ws://127.0.0.1:{port}/ws"
+    simulated = [Client(i, values) for i in range(clients)]
+    cpu_start, _ = process_usage(pid)
+    start = time.perf_counter()
+    async with aiohttp.ClientSession() as session:
+        await asyncio.gather(*(client.run(session, url, duration) for client in simulated))
+    elapsed = time.perf_counter() - start
+    cpu_end, rss = process_usage(pid)
+    latencies = [latency for client in simulated for latency in client.latencies]
+    return {
+        "throughput": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.5) * 1000,
+        "p95": percentile(latencies, 0.95) * 1000,
+        "p99": percentile(latencies, 0.99) * 1000,
+        "cpu": (cpu_end - cpu_start) / elapsed * 100,
+        "rss": rss / 2**20,
+    }
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(clients: int, port: int) -> subprocess.Popen:
+    command = [sys.executable, "-m", "benchmarks.trame_load", "--serve", "--clients", str(clients), "--port", str(port)]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    for line in server.stdout or []:
+        if line.strip() == "READY":
+            return server
+    raise RuntimeError("the server did not start")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 2, 4, 8, 16], help="numbers of clients")
+    parser.add_argument("--duration", type=float, default=5.0, help="duration of each level, in seconds")
+    parser.add_argument("--values", type=int, default=100, help="length of the list in the edited model")
+    parser.add_argument("--port", type=int, default=0, help="port of the server, a free port if 0")
+    parser.add_argument("--serve", action="store_true", help="only run the server")
+    args = parser.parse_args(argv)
+
+    port = args.port or free_port()
+    if args.serve:
+        serve(max(args.clients), port)
+        return
+
+    server = start_server(max(args.clients), port)
+    try:
+        print(
+            f"{'clients':>8}{'updates/s':>12}{'p50, ms':>10}{'p95, ms':>10}{'p99, ms':>10}{'CPU, %':>9}{'RSS, MB':>10}"
+        )
+        for clients in args.clients:
+            result = asyncio.run(run_level(port, clients, args.duration, args.values, server.pid))
+            print(
+                f"{clients:>8}{result['throughput']:>12.1f}{result['p50']:>10.2f}{result['p95']:>10.2f}"
+                f"{result['p99']:>10.2f}{result['cpu']:>9.1f}{result['rss']:>10.1f}"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
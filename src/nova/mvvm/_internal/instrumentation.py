@@ -0,0 +1,206 @@
+"""Hooks reporting what bindings and workers do, e.g. for metrics.
+
+Instrumentation is disabled until a sink is added. Call sites check ``enabled`` (or use ``span``, which returns
+a shared no-op context manager) before building anything, so that the overhead is negligible when disabled.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# value received from the View (state variable or key in ``fields``, value in ``value``), e.g. for recording
+VIEW_INPUT = "view_input"
+# update of the ViewModel by the View
+VIEW_UPDATE = "view_update"
+# update of the View by the ViewModel
+MODEL_UPDATE = "model_update"
+VALIDATE = "validate"
+DIFF = "diff"
+SERIALIZE = "serialize"
+# size of the values sent to the View
+PAYLOAD = "payload"
+VALIDATION_ERROR = "validation_error"
+# time between the start of a worker and the start of its task
+WORKER_QUEUE = "worker_queue"
+WORKER_RUN = "worker_run"
+# lifecycle of workers, reported when the callbacks are called
+WORKER_START = "worker_start"
+WORKER_PROGRESS = "worker_progress"
+WORKER_RESULT = "worker_result"
+WORKER_ERROR = "worker_error"
+WORKER_FINISHED = "worker_finished"
+
+
+class Event:
+    """Something a binding or a worker did.
+
+    Parameters
+    ----------
+    kind : str
+        Kind of the event, one of the constants of this module.
+    binding : str
+        Name of the binding (or of the task of a worker).
+    start : float
+        Time of the event (``time.perf_counter``).
+    duration : float, optional
+        Duration in seconds, for events that take time.
+    fields : list[str], optional
+        Paths of the fields concerned.
+    size : int, optional
+        Size in bytes, for payloads.
+    value : Any, optional
+        Value reported, e.g. the progress of a worker.
+    """
+
+    __slots__ = ("kind", "binding", "start", "duration", "thread", "thread_id", "fields", "size", "value")
+
+    def __init__(
+        self,
+        kind: str,
+        binding: str,
+        start: float,
+        duration: Optional[float] = None,
+        fields: Optional[List[str]] = None,
+        size: Optional[int] = None,
+        value: Any = None,
+    ) -> None:
+        self.kind = kind
+        self.binding = binding
+        self.start = start
+        self.duration = duration
+        self.thread = threading.current_thread().name
+        self.thread_id = threading.get_ident()
+        self.fields = fields
+        self.size = size
+        self.value = value
+
+
+Sink = Callable[[Event], None]
+
+_sinks: List[Sink] = []
+_sinks_lock = threading.Lock()
+enabled = False
+
+
+def add_sink(sink: Sink) -> None:
+    """Call the sink with every event from now on, from the thread of the event."""
+    global enabled
+    with _sinks_lock:
+        if sink not in _sinks:
+            _sinks.append(sink)
+        enabled = True
+
+
+def remove_sink(sink: Sink) -> None:
+    global enabled
+    with _sinks_lock:
+        if sink in _sinks:
+            _sinks.remove(sink)
+        enabled = bool(_sinks)
+
+
+def has_sink(sink: Sink) -> bool:
+    return sink in _sinks
+
+
+def emit(
+    kind: str,
+    binding: str,
+    start: Optional[float] = None,
+    duration: Optional[float] = None,
+    fields: Optional[List[str]] = None,
+    size: Optional[int] = None,
+    value: Any = None,
+) -> None:
+    if not enabled:
+        return
+    event = Event(kind, binding, time.perf_counter() if start is None else start, duration, fields, size, value)
+    for sink in list(_sinks):
+        try:
+            sink(event)
+        except Exception:
+            logger.exception("instrumentation sink failed")
+
+
+class _Span:
+    __slots__ = ("kind", "binding", "fields", "start", "discarded")
+
+    def __init__(self, kind: str, binding: str, fields: Optional[List[str]]) -> None:
+        self.kind = kind
+        self.binding = binding
+        self.fields = fields
+        self.start = 0.0
+        self.discarded = False
+
+    def __enter__(self) -> "_Span":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        if not self.discarded:
+            emit(self.kind, self.binding, self.start, time.perf_counter() - self.start, self.fields)
+
+    def discard(self) -> None:
+        """Do not emit the event, e.g. when the block turned out to do nothing."""
+        self.discarded = True
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> "_NoSpan":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        pass
+
+    def discard(self) -> None:
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(kind: str, binding: str, fields: Optional[List[str]] = None) -> Any:
+    """Return a context manager emitting an event with the duration of the block."""
+    if not enabled:
+        return _NO_SPAN
+    return _Span(kind, binding, fields)
+
+
+def run_span(name: str, queued_at: float) -> Any:
+    """Emit the time a task of a worker has waited since it was started, return a span for running it."""
+    if not enabled:
+        return _NO_SPAN
+    emit(WORKER_QUEUE, name, queued_at, time.perf_counter() - queued_at)
+    return _Span(WORKER_RUN, name, None)
+
+
+def binding_name(linked_object: Any, name: Optional[str] = None) -> str:
+    """Name of a binding in events: the name it is connected with, or the type of the linked object."""
+    if name:
+        return name
+    if callable(linked_object) and hasattr(linked_object, "__name__"):
+        return linked_object.__name__
+    return type(linked_object).__name__
+
+
+def payload_size(value: Any) -> int:
+    """Approximate size in bytes of a value sent to the View."""
+    if isinstance(value, (bytes, bytearray)):
+        return len(value)
+    if isinstance(value, memoryview):
+        return value.nbytes
+    if isinstance(value, str):
+        return len(value.encode())
+    if isinstance(value, dict):
+        return sum(payload_size(k) + payload_size(v) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        return sum(payload_size(v) for v in value)
+    nbytes = getattr(value, "nbytes", None)  # e.g. NumPy arrays
+    if isinstance(nbytes, int):
+        return nbytes
+    return 8
@@ -0,0 +1,279 @@
+"""Internal helpers for NumPy arrays.
+
+NumPy is an optional dependency, so everything here degrades to a no-op when it is not installed.
+"""
+
+import copy
+import functools
+import typing
+from typing import Any, List, Sequence, Set
+
+from pydantic import BaseModel
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional
+    np = None  # type: ignore
+
+# key used to mark a typed array in Trame state
+NDARRAY_MARKER = "__ndarray__"
+# key used to mark a list of models stored as columns in Trame state
+COLUMNS_MARKER = "__columns__"
+
+
+def is_ndarray(value: Any) -> bool:
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def is_encoded_ndarray(value: Any) -> bool:
+    return isinstance(value, dict) and NDARRAY_MARKER in value
+
+
+def readonly_view(value: Any) -> Any:
+    """Return a read-only view sharing the buffer of the given array."""
+    view = value.view()
+    view.flags.writeable = False
+    return view
+
+
+def _annotation_may_hold_ndarrays(annotation: Any, seen: Set[type]) -> bool:
+    if annotation is Any or annotation is object:
+        return True
+    if isinstance(annotation, type):
+        if issubclass(annotation, np.ndarray):
+            return True
+        if issubclass(annotation, BaseModel) and annotation not in seen:
+            seen.add(annotation)
+            return any(_annotation_may_hold_ndarrays(f.annotation, seen) for f in annotation.model_fields.values())
+        return False
+    origin = typing.get_origin(annotation)
+    if origin is not None and _annotation_may_hold_ndarrays(origin, seen):
+        return True
+    return any(_annotation_may_hold_ndarrays(arg, seen) for arg in typing.get_args(annotation))
+
+
+@functools.lru_cache(maxsize=None)
+def _model_may_hold_ndarrays(model_type: type) -> bool:
+    # from the annotations of the fields, so that models without arrays are not walked
+    return _annotation_may_hold_ndarrays(model_type, set())
+
+
+def readonly_ndarrays(value: Any) -> Any:
+    """Return the value with NumPy arrays replaced by read-only views, also in fields of models and containers.
+
+    Models and containers holding arrays are shallow copied, other values are returned as they are.
+    """
+    if np is None:
+        return value
+    if isinstance(value, np.ndarray):
+        return readonly_view(value)
+    if isinstance(value, BaseModel):
+        if not _model_may_hold_ndarrays(type(value)):
+            return value
+        update = {}
+        for name, field_value in value.__dict__.items():
+            new_value = readonly_ndarrays(field_value)
+            if new_value is not field_value:
+                update[name] = new_value
+        return value.model_copy(update=update) if update else value
+    if isinstance(value, (list, tuple)):
+        items = [readonly_ndarrays(item) for item in value]
+        if all(new is old for new, old in zip(items, value, strict=True)):
+            return value
+        if isinstance(value, list):
+            return items
+        return type(value)(*items) if hasattr(value, "_fields") else tuple(items)  # named tuples
+    if isinstance(value, dict):
+        values = {key: readonly_ndarrays(item) for key, item in value.items()}
+        if all(values[key] is item for key, item in value.items()):
+            return value
+        return values
+    return value
+
+
+def ndarray_equal(a: Any, b: Any) -> bool:
+    if not (is_ndarray(a) and is_ndarray(b)):
+        return False
+    if a is b:
+        return True
+    return a.shape == b.shape and a.dtype == b.dtype and bool(np.array_equal(a, b))
+
+
+def encode_ndarray(value: Any) -> dict[str, Any]:
+    """Encode an array as a typed-array descriptor, the data is passed as a memoryview without copying."""
+    array = np.ascontiguousarray(value)
+    return {NDARRAY_MARKER: array.dtype.str, "shape": list(array.shape), "data": array.data.cast("B")}
+
+
+def decode_ndarray(value: dict[str, Any]) -> Any:
+    """Create an array from a typed-array descriptor, sharing the received buffer."""
+    array = np.frombuffer(value["data"], dtype=np.dtype(value[NDARRAY_MARKER]))
+    return array.reshape(value["shape"])
+
+
+def encode_ndarrays(value: Any) -> Any:
+    """Replace NumPy arrays in a (nested) dict/list with typed-array descriptors.
+
+    Containers are always copied (also without NumPy), since the bindings compare the values they keep
+    with the ones the View modifies in place.
+    """
+    if np is not None and isinstance(value, np.ndarray):
+        return encode_ndarray(value)
+    if isinstance(value, dict):
+        return {k: encode_ndarrays(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_ndarrays(v) for v in value]
+    return value
+
+
+def decode_ndarrays(value: Any) -> Any:
+    """Replace typed-array descriptors in a (nested) dict/list with NumPy arrays."""
+    if np is None:
+        return value
+    if isinstance(value, dict):
+        if NDARRAY_MARKER in value:
+            return decode_ndarray(value)
+        return {k: decode_ndarrays(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [decode_ndarrays(v) for v in value]
+    return value
+
+
+def contains_encoded_ndarrays(value: Any) -> bool:
+    if np is None:
+        return False
+    if isinstance(value, dict):
+        return NDARRAY_MARKER in value or any(contains_encoded_ndarrays(v) for v in value.values())
+    if isinstance(value, list):
+        return any(contains_encoded_ndarrays(v) for v in value)
+    return False
+
+
+def contains_ndarrays(value: Any) -> bool:
+    if np is None:
+        return False
+    if isinstance(value, np.ndarray):
+        return True
+    if isinstance(value, dict):
+        return any(contains_ndarrays(v) for v in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(contains_ndarrays(v) for v in value)
+    return False
+
+
+def state_values_equal(a: Any, b: Any) -> bool:
+    """Compare values sent to the View.
+
+    Values holding arrays are never equal, since an array can be modified in place after it was sent.
+    """
+    if contains_ndarrays(a) or contains_ndarrays(b):
+        return False
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def _collect_ndarrays(value: Any, memo: dict[int, Any]) -> None:
+    if isinstance(value, (np.ndarray, memoryview)):
+        memo[id(value)] = value
+    elif isinstance(value, BaseModel):
+        for v in value.__dict__.values():
+            _collect_ndarrays(v, memo)
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            _collect_ndarrays(v, memo)
+    elif isinstance(value, dict):
+        for v in value.values():
+            _collect_ndarrays(v, memo)
+
+
+def deepcopy_sharing_ndarrays(value: Any) -> Any:
+    """Deep copy an object, but keep references to NumPy arrays (and buffers of encoded arrays) instead of copying them.
+
+    Arrays in bound models are replaced rather than modified in place by the bindings, so sharing them is safe.
+    """
+    memo: dict[int, Any] = {}
+    if np is not None:
+        _collect_ndarrays(value, memo)
+    return copy.deepcopy(value, memo)
+
+
+def snapshot_value(value: Any) -> Any:
+    """Return a value to compare with later, containers are copied since they can be modified in place."""
+    if isinstance(value, (list, dict, set)):
+        return deepcopy_sharing_ndarrays(value)
+    return value
+
+
+def is_columnar(value: Any) -> bool:
+    return isinstance(value, dict) and COLUMNS_MARKER in value
+
+
+def _column(values: List[Any]) -> Any:
+    # numeric values are stored as an array, other values as a list
+    try:
+        array = np.asarray(values)
+    except (ValueError, TypeError):  # e.g. lists of different lengths
+        array = None
+    if array is not None and array.dtype.kind in "biuf":
+        return array
+    return [v.model_dump() if isinstance(v, BaseModel) else v for v in values]
+
+
+def models_to_columns(items: Sequence[Any], fields: Sequence[str]) -> dict[str, Any]:
+    """Store the given fields of a list of models as one array (or list for non-numeric values) per field."""
+    columns = {field: _column([getattr(item, field) for item in items]) for field in fields}
+    return {COLUMNS_MARKER: columns, "length": len(items)}
+
+
+def _column_equal(a: Any, b: Any) -> bool:
+    if is_ndarray(a) or is_ndarray(b):
+        a, b = np.asarray(a), np.asarray(b)
+        return a.shape == b.shape and bool(np.array_equal(a, b))
+    try:
+        return bool(a == b)
+    except ValueError:
+        return False
+
+
+def columns_equal(a: Any, b: Any) -> bool:
+    """Compare columnar values column by column with vectorized equality."""
+    if not (is_columnar(a) and is_columnar(b)) or a["length"] != b["length"]:
+        return False
+    if a[COLUMNS_MARKER].keys() != b[COLUMNS_MARKER].keys():
+        return False
+    return all(_column_equal(column, b[COLUMNS_MARKER][name]) for name, column in a[COLUMNS_MARKER].items())
+
+
+def _column_changes(a: Any, b: Any, length: int) -> Any:
+    if is_ndarray(a) or is_ndarray(b):
+        try:
+            a, b = np.asarray(a[:length]), np.asarray(b[:length])
+        except (ValueError, TypeError):
+            pass
+        else:
+            if a.shape == b.shape:
+                return (a != b).reshape(length, -1).any(axis=1)
+    pairs = zip(a[:length], b[:length], strict=True)
+    return np.fromiter((not state_values_equal(x, y) for x, y in pairs), dtype=bool, count=length)
+
+
+def changed_rows(old: dict[str, Any], new: dict[str, Any]) -> List[int]:
+    """Return the indices of the rows present in both columnar values that differ."""
+    length = min(old["length"], new["length"])
+    if length == 0:
+        return []
+    changed = np.zeros(length, dtype=bool)
+    for name, column in new[COLUMNS_MARKER].items():
+        if name not in old[COLUMNS_MARKER]:
+            return list(range(length))
+        changed |= _column_changes(old[COLUMNS_MARKER][name], column, length)
+    return np.flatnonzero(changed).tolist()
+
+
+def take_rows(column: Any, rows: List[int]) -> List[Any]:
+    """Return the values of a column at the given rows as Python objects."""
+    if is_ndarray(column):
+        return column[rows].tolist()
+    return [column[row] for row in rows]
@@ -0,0 +1,119 @@
+"""Rate limiting of the progress reported by tasks, shared by the workers of all frameworks."""
+
+import threading
+import time
+from typing import Callable, Optional, Tuple, cast
+
+# minimum time between two delivered progress reports, in seconds
+MIN_INTERVAL = 0.05
+# minimum change of the progress value between two delivered reports
+MIN_DELTA = 1
+
+ProgressReport = Tuple[str, int]
+
+
+class ProgressThrottle:
+    """Decides which progress reports of a task are delivered to the View.
+
+    A report is delivered if at least ``min_interval`` seconds have passed since the last delivered report and
+    its message has changed or its value has changed by at least ``min_delta``. The first report and reports
+    with a value of 100 or more are always delivered. A report skipped only because it came too early is
+    delivered once the interval has elapsed: by ``deliver`` from a timer thread if it is given, otherwise when
+    ``due`` is polled. The last report that was not delivered is kept and returned by ``flush`` when the task
+    ends, so the final progress is always delivered. Reports can come from any thread.
+
+    Parameters
+    ----------
+    min_interval : float
+        Minimum time between two delivered reports, in seconds.
+    min_delta : int
+        Minimum change of the value between two delivered reports with the same message.
+    deliver : Callable[[str, int], None], optional
+        Called with the message and value of a skipped report once the interval has elapsed.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = MIN_INTERVAL,
+        min_delta: int = MIN_DELTA,
+        deliver: Optional[Callable[[str, int], None]] = None,
+    ) -> None:
+        if min_interval < 0 or min_delta < 0:
+            raise ValueError("min_interval and min_delta must not be negative")
+        self.min_interval = min_interval
+        self.min_delta = min_delta
+        self.deliver = deliver
+        self.skipped = 0
+        # reentrant, deliver is called with the lock held and can report progress
+        self._lock = threading.RLock()
+        self._last: Optional[ProgressReport] = None
+        self._last_time = 0.0
+        self._pending: Optional[ProgressReport] = None
+        # the pending report has only been skipped because of the interval
+        self._pending_due = False
+        self._timer: Optional[threading.Timer] = None
+
+    def report(self, message: str, value: int) -> bool:
+        """Record a report, returns True if it has to be delivered now."""
+        now = time.monotonic()
+        with self._lock:
+            last = self._last
+            if last is not None and value < 100:
+                changed = message != last[0] or abs(value - last[1]) >= self.min_delta
+                if not changed or now - self._last_time < self.min_interval:
+                    self.skipped += 1
+                    self._pending = (message, value) if (message, value) != last else None
+                    self._pending_due = changed
+                    if changed:
+                        self._schedule(self.min_interval - (now - self._last_time))
+                    return False
+            self._last = (message, value)
+            self._last_time = now
+            self._pending = None
+            return True
+
+    def due(self) -> Optional[ProgressReport]:
+        """Return the report skipped because it came too early if the interval has elapsed, consider it delivered."""
+        with self._lock:
+            return self._take_due(time.monotonic())
+
+    def flush(self) -> Optional[ProgressReport]:
+        """Return the last report that has not been delivered, if any, and consider it delivered."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            pending = self._pending
+            if pending is not None:
+                self._last = pending
+                self._last_time = time.monotonic()
+                self._pending = None
+            return pending
+
+    def _take_due(self, now: float) -> Optional[ProgressReport]:
+        pending = self._pending
+        if pending is None or not self._pending_due or now - self._last_time < self.min_interval:
+            return None
+        self._last = pending
+        self._last_time = now
+        self._pending = None
+        return pending
+
+    def _schedule(self, delay: float) -> None:
+        if self.deliver is None or self._timer is not None:
+            return
+        self._timer = threading.Timer(max(delay, 0.0), self._deliver_due)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _deliver_due(self) -> None:
+        with self._lock:
+            self._timer = None
+            now = time.monotonic()
+            pending = self._take_due(now)
+            if pending is not None:
+                # delivered with the lock held, so that a newer report cannot be delivered before it
+                cast(Callable[[str, int], None], self.deliver)(*pending)
+            elif self._pending is not None and self._pending_due:
+                # a report was delivered in the meantime, the pending one is due later
+                self._schedule(self.min_interval - (now - self._last_time))
@@ -2,14 +2,32 @@
 
 import logging
 import re
-from typing import Any, Tuple
+import typing
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, Union
 
 from deepdiff import DeepDiff
-from pydantic import BaseModel, ValidationError
+from deepdiff.operator import BaseOperator
+from pydantic import BaseModel, TypeAdapter, ValidationError
 from pydantic.fields import FieldInfo
 
+from .ndarray_utils import (
+    COLUMNS_MARKER,
+    changed_rows,
+    deepcopy_sharing_ndarrays,
+    is_ndarray,
+    ndarray_equal,
+    np,
+    state_values_equal,
+    take_rows,
+)
+
 logger = logging.getLogger(__name__)
 
+# TypeAdapters by annotation, building the validator of a type is much slower than using it
+_type_adapters: Dict[Any, TypeAdapter] = {}
+# validation context of models sharing field values with a bound model, observable models do not take them over
+DETACHED_CONTEXT = {"nova_detached": True}
+
 
 def _format_field_name_from_tuple(input_tuple: Tuple) -> str:
     res = ""
@@ -46,14 +64,38 @@ def _remove_brackets_suffix(s: str) -> str:
     return re.sub(r"\[\d+\]$", "", s)
 
 
-def get_updated_fields(old: BaseModel, new: BaseModel) -> list[str]:
+class NDArrayOperator(BaseOperator):
+    """DeepDiff operator that compares NumPy arrays as a whole using vectorized equality."""
+
+    def match(self, level: Any) -> bool:
+        return is_ndarray(level.t1) or is_ndarray(level.t2)
+
+    def give_up_diffing(self, level: Any, diff_instance: Any) -> bool:
+        if not ndarray_equal(level.t1, level.t2):
+            diff_instance.custom_report_result("values_changed", level)
+        return True
+
+
+def get_updated_fields(old: BaseModel, new: BaseModel, exclude: Iterable[str] = ()) -> list[str]:
     """
     Get a list of Pydantic model fields that were updated.
 
     Uses DeepDiff package to compare new and old models and
     then processed the results to build lists in a format we want.
+    NumPy arrays are compared as a whole, so a changed array is reported by its field name.
+    Fields in ``exclude`` are not compared. Lists of models are compared item by item, skipping the items
+    that are the same objects in both models.
     """
-    diff = DeepDiff(old, new)
+    model_lists = [
+        name
+        for name in type(old).model_fields
+        if name not in exclude and _is_model_list(getattr(old, name)) and _is_model_list(getattr(new, name, None))
+    ]
+    exclude_paths = [f"root.{field}" for field in [*exclude, *model_lists]]
+    if np is not None:
+        diff = DeepDiff(old, new, custom_operators=[NDArrayOperator()], exclude_paths=exclude_paths)
+    else:
+        diff = DeepDiff(old, new, exclude_paths=exclude_paths)
     updates = set()
     if "values_changed" in diff:
         # DeepDiff adds .root to the root object, we don't need that
@@ -64,10 +106,53 @@ def get_updated_fields(old: BaseModel, new: BaseModel) -> list[str]:
         # for added/removed items DeepDiff adds its index, we don't need that as well
         if item in diff:
             updates |= {_remove_brackets_suffix(k.removeprefix("root.")) for k in diff[item].keys()}
+    for name in model_lists:
+        updates.update(_get_updated_items(name, getattr(old, name), getattr(new, name)))
 
     return list(updates)
 
 
+def _is_model_list(value: Any) -> bool:
+    return isinstance(value, list) and bool(value) and all(isinstance(item, BaseModel) for item in value)
+
+
+def _get_updated_items(path: str, old: List[BaseModel], new: List[BaseModel]) -> List[str]:
+    updates = [path] if len(old) != len(new) else []
+    for index, (old_item, new_item) in enumerate(zip(old, new, strict=False)):
+        if old_item is new_item:
+            continue
+        if type(old_item) is not type(new_item):
+            updates.append(f"{path}[{index}]")
+            continue
+        updates += [f"{path}[{index}].{field}" for field in get_updated_fields(old_item, new_item)]
+    return updates
+
+
+def models_equal(a: BaseModel, b: BaseModel) -> bool:
+    """Compare two models, also when they contain NumPy arrays."""
+    try:
+        return a == b
+    except ValueError:
+        # Pydantic compares fields with ==, which is ambiguous for NumPy arrays
+        return not get_updated_fields(a, b)
+
+
+def copy_model(model: BaseModel) -> BaseModel:
+    """Deep copy a model without duplicating the buffers of NumPy arrays it holds."""
+    return deepcopy_sharing_ndarrays(model)
+
+
+def snapshot_model(model: BaseModel) -> BaseModel:
+    """Shallow copy a model and its lists, so that it can be read in another thread while the model is changed.
+
+    Fields assigned and items added to or removed from lists of the model do not affect the copy, the values
+    themselves (e.g. items of lists) are shared.
+    """
+    return model.model_copy(
+        update={name: list(value) for name, value in model.__dict__.items() if isinstance(value, list)}
+    )
+
+
 def get_nested_pydantic_field(model: BaseModel, field_path: str) -> FieldInfo:
     """Retrieve a nested field's metadata from a Pydantic model using a dot-separated path."""
     fields = field_path.split(".")
@@ -86,3 +171,236 @@ def get_nested_pydantic_field(model: BaseModel, field_path: str) -> FieldInfo:
             return current_model.model_fields[field]
 
     raise Exception(f"Cannot find field {field_path}")
+
+
+def get_list_item_type(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Return the model type of the items of a list annotation, e.g. Range for Optional[List[Range]]."""
+    for arg in typing.get_args(annotation):
+        if isinstance(arg, type) and issubclass(arg, BaseModel):
+            return arg
+        item_type = get_list_item_type(arg)
+        if item_type:
+            return item_type
+    return None
+
+
+def update_rows_from_columns(
+    items: List[BaseModel], item_type: Type[BaseModel], current: dict, received: dict, path: str
+) -> Tuple[List[BaseModel], List[str], List[str], Optional[ValidationError]]:
+    """Apply the columns received from the View to a list of models.
+
+    Only the rows that differ from the current columns (found with vectorized comparison) and the added rows
+    are validated, the other items are kept as they are.
+
+    Returns
+    -------
+    tuple
+        The new list, the updated fields, the errored fields and the last validation error.
+    """
+    length = received["length"]
+    rows = changed_rows(current, received) + list(range(len(items), length))
+    values = {name: take_rows(column, rows) for name, column in received[COLUMNS_MARKER].items()}
+    new_items = list(items[:length])
+    updates: List[str] = [path] if length != len(items) else []
+    errors: List[str] = []
+    error = None
+    for position, row in enumerate(rows):
+        data = {name: row_values[position] for name, row_values in values.items()}
+        old_item = items[row] if row < len(items) else None
+        try:
+            item = item_type.model_validate({**old_item.__dict__, **data} if old_item is not None else data)
+        except ValidationError as e:
+            row_path = f"{path}[{row}]"
+            errors += [
+                f"{row_path}.{field}" if field else row_path for field in get_errored_fields_from_validation_error(e)
+            ]
+            error = e
+            continue
+        if old_item is None:
+            new_items.append(item)
+            continue
+        new_items[row] = item
+        updates += [
+            f"{path}[{row}].{name}"
+            for name in data
+            if not state_values_equal(getattr(old_item, name), getattr(item, name))
+        ]
+    return new_items, updates, errors, error
+
+
+def get_type_adapter(annotation: Any) -> TypeAdapter:
+    """Return a TypeAdapter for the annotation, created once per annotation."""
+    try:
+        adapter = _type_adapters.get(annotation)
+    except TypeError:  # unhashable annotation
+        return TypeAdapter(annotation)
+    if adapter is None:
+        adapter = _type_adapters[annotation] = TypeAdapter(annotation)
+    return adapter
+
+
+def _item_changed(received: Any, current: Any) -> bool:
+    try:
+        return bool(received != current)
+    except ValueError:  # e.g. NumPy arrays
+        return True
+
+
+def validate_list_items(item_type: Type[BaseModel], items: List[BaseModel], received: List[Any]) -> List[BaseModel]:
+    """Validate the items of a list of models received from the View.
+
+    The received items are compared with the dumped current items, the current items are kept where they are equal
+    and only the other items are validated, together with a cached TypeAdapter.
+
+    Raises
+    ------
+    ValidationError
+        If a changed item does not pass validation, locations refer to the list of changed items.
+    """
+    adapter = get_type_adapter(List[item_type])  # type: ignore[valid-type]
+    current = adapter.dump_python(items[: len(received)])
+    changed = [
+        index
+        for index, value in enumerate(received)
+        if index >= len(current) or not isinstance(value, dict) or _item_changed(value, current[index])
+    ]
+    result: List[Any] = list(items[: len(received)])
+    result += [None] * (len(received) - len(result))
+    for index, item in zip(changed, adapter.validate_python([received[index] for index in changed]), strict=True):
+        result[index] = item
+    return result
+
+
+_PATH_TOKEN = re.compile(r"([^.\[\]]+)|\[(\d+)\]")
+
+
+def _set_validated(value: Any, tokens: List[Union[str, int]], new_value: Any) -> Any:
+    if not tokens:
+        return new_value
+    token, rest = tokens[0], tokens[1:]
+    if isinstance(value, BaseModel) and isinstance(token, str) and token in type(value).model_fields:
+        data = {name: getattr(value, name) for name in type(value).model_fields}
+        data[token] = _set_validated(data[token], rest, new_value)
+        return type(value).model_validate(data, context=DETACHED_CONTEXT)
+    if isinstance(value, list) and isinstance(token, int):
+        items = list(value)
+        items[token] = _set_validated(items[token], rest, new_value)
+        return items
+    if isinstance(value, dict):
+        entries = dict(value)
+        entries[token] = _set_validated(entries[token], rest, new_value)
+        return entries
+    raise ValueError(f"cannot validate {token} separately")
+
+
+def set_validated(model: BaseModel, path: str, value: Any) -> BaseModel:
+    """Return a validated copy of the model with the field at ``path`` (e.g. ``ranges[1].min_value``) set to value.
+
+    Only the models on the path are validated, from the innermost one. The other fields hold the same
+    (already validated) objects as the original model, e.g. the other items of a list, so the cost does not
+    depend on the size of the model. The original model is not modified.
+
+    Raises
+    ------
+    ValidationError
+        If a model on the path does not pass validation, locations refer to that model.
+    ValueError
+        If the path does not lead through models, lists and dicts.
+    """
+    tokens: List[Union[str, int]] = [name if name else int(index) for name, index in _PATH_TOKEN.findall(path)]
+    if not tokens:
+        raise ValueError("path is empty")
+    return _set_validated(model, tokens, value)
+
+
+def _get_item(value: Any, token: Union[str, int]) -> Any:
+    if isinstance(token, int) or isinstance(value, dict):
+        return value[token]
+    return getattr(value, token)
+
+
+def _set_item(value: Any, token: Union[str, int], new_value: Any) -> None:
+    if isinstance(token, int) or isinstance(value, dict):
+        value[token] = new_value
+    else:
+        setattr(value, token, new_value)
+
+
+def apply_validated(model: BaseModel, before: BaseModel, validated: BaseModel, path: str = "") -> list[str]:
+    """Set in the model the fields that differ between the model before validation and its validated copy.
+
+    The copy was validated with the value at ``path`` changed, the fields changed by validators (e.g. a
+    ``model_validator`` normalizing other fields) are set too. Values that are the same objects in both are
+    skipped without comparing them, and only the models and lists on the path are compared field by field,
+    so the cost does not depend on the size of the model when the copy shares its unchanged values.
+    Fields changed in the model since ``before`` was taken and not changed by the validation are kept.
+    Returns the paths of the updated fields in the format of ``get_updated_fields``.
+
+    Raises
+    ------
+    LookupError, AttributeError
+        If a changed field does not exist in the model anymore.
+    """
+    tokens: List[Union[str, int]] = [name if name else int(index) for name, index in _PATH_TOKEN.findall(path)]
+    changes: List[Tuple[List[Union[str, int]], Any, List[str]]] = []
+    _collect_changes(before, validated, tokens, [], "", changes)
+    # the containers are looked up before anything is set, so that the model is not partially updated
+    targets = []
+    for location, _new_value, _changed in changes:
+        target: Any = model
+        for token in location[:-1]:
+            target = _get_item(target, token)
+        _get_item(target, location[-1])
+        targets.append(target)
+    updates: List[str] = []
+    for target, (location, new_value, changed) in zip(targets, changes, strict=True):
+        _set_item(target, location[-1], new_value)
+        updates += changed
+    return updates
+
+
+def _collect_changes(
+    old: Any,
+    new: Any,
+    tokens: List[Union[str, int]],
+    location: List[Union[str, int]],
+    path: str,
+    changes: List[Tuple[List[Union[str, int]], Any, List[str]]],
+) -> None:
+    entries: Iterable[Tuple[Union[str, int], str, Any, Any]]
+    # the models and lists on the edited path are compared one level deeper, the other values as a whole
+    if (tokens or not location) and isinstance(old, BaseModel) and type(old) is type(new):
+        entries = (
+            (name, f"{path}.{name}" if path else name, getattr(old, name), getattr(new, name))
+            for name in type(old).model_fields
+        )
+    elif (
+        tokens
+        and isinstance(tokens[0], int)
+        and isinstance(old, list)
+        and isinstance(new, list)
+        and len(old) == len(new)
+    ):
+        entries = ((index, f"{path}[{index}]", *items) for index, items in enumerate(zip(old, new, strict=True)))
+    else:
+        changed = _changed_paths(old, new, path)
+        if changed:
+            changes.append((location, new, changed))
+        return
+    for token, sub_path, old_value, new_value in entries:
+        if old_value is new_value:
+            continue
+        if tokens and tokens[0] == token:
+            _collect_changes(old_value, new_value, tokens[1:], [*location, token], sub_path, changes)
+        else:
+            changed = _changed_paths(old_value, new_value, sub_path)
+            if changed:
+                changes.append(([*location, token], new_value, changed))
+
+
+def _changed_paths(old: Any, new: Any, path: str) -> List[str]:
+    if isinstance(old, BaseModel) and type(old) is type(new):
+        return [f"{path}.{field}" for field in get_updated_fields(old, new)]
+    if is_ndarray(old) or is_ndarray(new):
+        return [] if ndarray_equal(old, new) else [path]
+    return [] if state_values_equal(old, new) else [path]
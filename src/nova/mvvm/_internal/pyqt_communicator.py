@@ -1,21 +1,51 @@
 """Common communicator module for PyQt bindings."""
 
 import inspect
-from typing import Any, Optional
+from concurrent.futures import Executor, Future
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
 
 from pydantic import BaseModel, ValidationError
 from typing_extensions import override
 
-from .._internal.pydantic_utils import get_errored_fields_from_validation_error, get_updated_fields
-from .._internal.utils import check_binding, rsetattr
+from .._internal import instrumentation
+from .._internal.ndarray_utils import (
+    readonly_ndarrays,
+    snapshot_value,
+    state_values_equal,
+)
+from .._internal.pydantic_utils import (
+    apply_validated,
+    copy_model,
+    get_errored_fields_from_validation_error,
+    get_updated_fields,
+    models_equal,
+    set_validated,
+    snapshot_model,
+)
+from .._internal.utils import check_binding, is_path_affected, rgetattr, rsetattr
 from ..bindings_map import bindings_map
-from ..interface import Communicator, ConnectCallbackType
+from ..interface import Communicator, ConnectCallbackType, ViewWindow
+from ..pydantic_utils import ObservableModel, untracked
+
+# marks fields that have not been sent to the View yet
+_NOT_SENT = object()
 
 
 def is_callable(var: Any) -> bool:
     return inspect.isfunction(var) or inspect.ismethod(var)
 
 
+def _call_with_blocked_signals(slot: Callable[[Any], None], widget: Any, value: Any) -> None:
+    # same as QSignalBlocker, but does not depend on the PyQt version
+    blocked = widget.blockSignals(True) if widget is not None else False
+    try:
+        slot(value)
+    finally:
+        if widget is not None:
+            widget.blockSignals(blocked)
+
+
 class PyQtCommunicator(Communicator):
     """Communicator class, that provides methods required for binding to communicate between ViewModel and View."""
 
@@ -25,36 +55,186 @@ class PyQtCommunicator(Communicator):
         viewmodel_linked_object: Any = None,
         linked_object_attributes: Any = None,
         callback_after_update: Any = None,
+        validation_executor: Optional[Executor] = None,
     ) -> None:
         super().__init__()
+        self.pyqtobject_class = pyqtobject
         self.pyqtobject = pyqtobject()
         self.viewmodel_linked_object = viewmodel_linked_object
         self.linked_object_attributes = linked_object_attributes
         self.callback_after_update = callback_after_update
         self.prefix = ""
+        # number of updates not sent to the View because it has just sent the same value
+        self.suppressed_echoes = 0
+        # last field set by the View: path, value as received and the state of the model after the update
+        # (version of observable models, field values of other models), None after it is sent to the View
+        self._from_view: Optional[Tuple[str, Any, Any]] = None
+        # signals of the fields connected with connect_field and the values last emitted through them
+        self._field_signals: Dict[str, Any] = {}
+        self._field_values: Dict[str, Any] = {}
+        # functions called with the changed field paths (None if not known) when the linked object is updated
+        self._update_listeners: List[Callable[[Optional[list[str]]], None]] = []
+        # changes from the View are validated in order in the executor, results are delivered through a signal
+        self.validation_executor = validation_executor
+        self._pending_validations: List[Tuple[Optional[str], Any]] = []
+        self._validation_snapshot: Any = None
+        self._validated = pyqtobject()
+        self._validated.signal.connect(self._on_validated)
+        if isinstance(viewmodel_linked_object, ObservableModel):
+            viewmodel_linked_object.add_communicator(self)
+
+    @property
+    def name(self) -> str:
+        """Name of the binding in instrumentation events."""
+        return instrumentation.binding_name(self.viewmodel_linked_object, self.prefix)
+
+    def _validate(
+        self, key: Optional[str], value: Any, linked_model: BaseModel
+    ) -> Tuple[Optional[BaseModel], list[str], Any]:
+        with instrumentation.span(instrumentation.VALIDATE, self.name, [key] if key else None):
+            return self._validate_change(key, value, linked_model)
+
+    def _validate_change(
+        self, key: Optional[str], value: Any, linked_model: BaseModel
+    ) -> Tuple[Optional[BaseModel], list[str], Any]:
+        """Validate the linked model (or a snapshot of it) with the value set by the View.
+
+        Returns the new model (None if the model has not changed), the errored fields and the error.
+        Can be called from another thread, the given model is not modified.
+        """
+        if key:
+            try:
+                # only the models on the path are validated, e.g. one item of a long list
+                new_model = set_validated(linked_model, key, value)
+            except (ValueError, LookupError, AttributeError):
+                pass  # validated below as a whole, which also reports errors with their paths in the model
+            else:
+                return (None if models_equal(new_model, linked_model) else new_model), [], None
+        model = copy_model(linked_model)
+        rsetattr(model, key or "", value)
+        if isinstance(model, ObservableModel) and not model.version:
+            # the copy records its changes, so an unchanged model is detected without comparing it
+            return None, [], None
+        try:
+            new_model = model.__class__(**model.model_dump(warnings=False))
+        except ValidationError as e:
+            return None, get_errored_fields_from_validation_error(e), e
+        return (None if models_equal(new_model, linked_model) else new_model), [], None
+
+    def _update_model(self, key: Optional[str], before: BaseModel, new_model: BaseModel) -> list[str]:
+        linked_model = self.viewmodel_linked_object
+        # only the fields changed by the validation (the edited one and the ones set by validators) are taken from
+        # the validated copy, changes made to the model meanwhile (e.g. while validating in a thread) are kept
+        try:
+            with instrumentation.span(instrumentation.DIFF, self.name), untracked(linked_model):
+                return apply_validated(linked_model, before, new_model, key or "")
+        except (LookupError, AttributeError):
+            pass  # a changed field has been removed meanwhile, the whole model is updated
+        with instrumentation.span(instrumentation.DIFF, self.name):
+            updates = get_updated_fields(linked_model, new_model)
+        with untracked(linked_model):
+            for field, value in new_model:
+                setattr(linked_model, field, value)
+        return updates
+
+    def _model_state(self) -> Any:
+        model = self.viewmodel_linked_object
+        if isinstance(model, ObservableModel):
+            return model.version
+        # fields replaced since are detected in O(number of fields), without dumping the model
+        return tuple(model.__dict__.values())
+
+    def _receive(self, key: Optional[str], value: Any, errors: list[str]) -> None:
+        # remember what the View shows to avoid sending it back, the View has to be updated after an error
+        if key and not errors:
+            self._from_view = (key, snapshot_value(value), self._model_state())
+        else:
+            self._from_view = None
+
+    def _apply_validation(
+        self,
+        key: Optional[str],
+        value: Any,
+        before: BaseModel,
+        new_model: Optional[BaseModel],
+        errors: list[str],
+        error: Any,
+    ) -> None:
+        updates: list[str] = []
+        if errors:
+            instrumentation.emit(instrumentation.VALIDATION_ERROR, self.name, fields=errors)
+        if new_model is not None:
+            updates = self._update_model(key, before, new_model)
+        self._receive(key, value, errors)
+        if updates:
+            self.notify_view_update(updates)
+        if (new_model is not None or errors) and self.callback_after_update:
+            self.callback_after_update({"updated": updates, "errored": errors, "error": error})
+
+    def _start_validation(self) -> None:
+        key, value = self._pending_validations[0]
+        # the model can change while the thread validates, the thread reads a snapshot taken here
+        self._validation_snapshot = snapshot_model(self.viewmodel_linked_object)
+        future = cast(Executor, self.validation_executor).submit(self._validate, key, value, self._validation_snapshot)
+        # the signal delivers the result in the thread of the communicator
+        future.add_done_callback(self._validated.signal.emit)
+
+    def _on_validated(self, future: Future) -> None:
+        key, value = self._pending_validations.pop(0)
+        try:
+            self._apply_validation(key, value, self._validation_snapshot, *future.result())
+        finally:
+            # the next change is validated against the model updated with this one
+            if self._pending_validations:
+                self._start_validation()
+
+    def _is_echo(self, value: Any) -> bool:
+        if self._from_view is None or value is not self.viewmodel_linked_object:
+            return False
+        key, received, model_state = self._from_view
+        if isinstance(value, ObservableModel):
+            if value.version != model_state:
+                return False
+        elif any(a is not b for a, b in zip(value.__dict__.values(), model_state, strict=False)):
+            return False
+        try:
+            current = rgetattr(value, key)
+        except (AttributeError, LookupError):
+            return False
+        # values normalized by validators are sent back
+        return state_values_equal(current, received)
 
     def _update_viewmodel_callback(self, key: Optional[str] = None, value: Any = None) -> None:
+        with instrumentation.span(instrumentation.VIEW_UPDATE, self.name, [key] if key else None):
+            instrumentation.emit(instrumentation.VIEW_INPUT, self.name, fields=[key] if key else [], value=value)
+            self._update_viewmodel(key, value)
+
+    def _update_viewmodel(self, key: Optional[str], value: Any) -> None:
+        updates: list[str] = []
+        errors: list[str] = []
+        error: Any = None
+        updated = True
         if issubclass(type(self.viewmodel_linked_object), BaseModel):
-            updates: list[str] = []
-            errors: list[str] = []
-            error: Any = None
-            updated = True
-            model = self.viewmodel_linked_object.model_copy(deep=True)
             if self.prefix and key:
                 key = key.removeprefix(f"{self.prefix}.")
-            rsetattr(model, key or "", value)
-            try:
-                new_model = model.__class__(**model.model_dump(warnings=False))
-                if new_model != self.viewmodel_linked_object:
-                    updates = get_updated_fields(self.viewmodel_linked_object, new_model)
-                    for field, value in new_model:
-                        setattr(self.viewmodel_linked_object, field, value)
-                else:
-                    updated = False
-            except ValidationError as e:
-                errors = get_errored_fields_from_validation_error(e)
-                error = e
-                updated = True
+            if self.validation_executor is None:
+                model = self.viewmodel_linked_object
+                self._apply_validation(key, value, model, *self._validate(key, value, model))
+            else:
+                self._pending_validations.append((key, value))
+                if len(self._pending_validations) == 1:
+                    self._start_validation()
+            return
+        elif isinstance(self.viewmodel_linked_object, ViewWindow):
+            # the View requests another part, e.g. visible range on zoom or page
+            if self.prefix and key:
+                key = key.removeprefix(f"{self.prefix}.")
+            request = {key: value} if key else value
+            if self.viewmodel_linked_object.request_view(request):
+                self._update_in_view(self.viewmodel_linked_object)
+                updates = list(request)
+            else:
+                updated = False
         elif isinstance(self.viewmodel_linked_object, dict):
             self.viewmodel_linked_object.update({key: value})
         elif is_callable(self.viewmodel_linked_object):
@@ -83,7 +263,108 @@ class PyQtCommunicator(Communicator):
         else:
             return None
 
+    @override
+    def disconnect(self) -> None:
+        """Disconnect the slots of the View and remove the binding from ``bindings_map``.
+
+        Callbacks returned by ``connect`` still update the linked object if the View calls them.
+        """
+        if self.prefix and bindings_map.get(self.prefix) is self:
+            del bindings_map[self.prefix]
+        for pyqtobject in [self.pyqtobject, *self._field_signals.values()]:
+            try:
+                pyqtobject.signal.disconnect()
+            except TypeError:
+                pass  # nothing connected
+        self._field_signals.clear()
+        self._field_values.clear()
+        self._update_listeners.clear()
+
+    def connect_field(self, path: str, slot: Callable[[Any], None], widget: Any = None) -> None:
+        """Connect a slot to a single field of the linked object.
+
+        The slot is called with the value of the field only when it has changed, either by
+        :code:`update_in_view` or by another widget. Signals of the widget are blocked while
+        the slot runs, so updating the widget does not send the value back to the ViewModel.
+
+        Parameters
+        ----------
+        path : str
+            Path of the field (e.g. ``ranges[1].max_value``), can be prefixed with the binding name.
+        slot : Callable
+            Function called with the new value of the field.
+        widget : QObject, optional
+            Widget updated by the slot.
+        """
+        if not callable(slot):
+            raise ValueError("slot should be a callable type")
+        if self.prefix:
+            path = path.removeprefix(f"{self.prefix}.")
+        rgetattr(self.viewmodel_linked_object, path)  # raises if the field does not exist
+        if path not in self._field_signals:
+            self._field_signals[path] = self.pyqtobject_class()
+            self._field_values[path] = _NOT_SENT
+        self._field_signals[path].signal.connect(partial(_call_with_blocked_signals, slot, widget))
+
+    def connect_updates(self, listener: Callable[[Optional[list[str]]], None]) -> None:
+        """Register a function called when the linked object is updated in the View or by the View.
+
+        The function is called with the paths of the changed fields, or None if they are not known
+        (e.g. after :code:`update_in_view`). Used by item models to send minimal change notifications.
+        """
+        self._update_listeners.append(listener)
+
+    def notify_view_update(self, updates: list[str], source: Any = None) -> None:
+        """Notify the subscribers of the fields changed by the View, except the listener that made the change."""
+        # other widgets connected to the changed fields have to show the new values
+        self._emit_fields(self.viewmodel_linked_object, updates)
+        for listener in self._update_listeners:
+            if listener != source:
+                listener(updates)
+
+    def _emit_fields(self, value: Any, paths: Optional[list[str]] = None) -> None:
+        for path, pyqtobject in self._field_signals.items():
+            if paths is not None and not is_path_affected(path, paths):
+                continue
+            field_value = rgetattr(value, path)
+            last_value = self._field_values[path]
+            if last_value is not _NOT_SENT and state_values_equal(last_value, field_value):
+                continue
+            self._field_values[path] = snapshot_value(field_value)
+            pyqtobject.signal.emit(readonly_ndarrays(field_value))
+
+    @override
+    def update_fields_in_view(self, value: Any, fields: list[str]) -> None:
+        self._update_in_view(value, fields)
+
     @override
     def update_in_view(self, value: Any) -> Any:
-        """Update a View (GUI) when called by a ViewModel."""
+        """Update a View (GUI) when called by a ViewModel.
+
+        The value is passed by reference, NumPy arrays are passed as read-only views of the same buffer.
+        The linked model is not sent if it has not changed since the View updated it. Slots connected with
+        :code:`connect_field` are only called for the fields that have changed.
+        """
+        if isinstance(value, ViewWindow):
+            value.refresh()
+        return self._update_in_view(value)
+
+    def _update_in_view(self, value: Any, fields: Optional[list[str]] = None) -> Any:
+        with instrumentation.span(instrumentation.MODEL_UPDATE, self.name, fields):
+            return self._send_to_view(value, fields)
+
+    def _send_to_view(self, value: Any, fields: Optional[list[str]]) -> Any:
+        if self._field_signals and value is self.viewmodel_linked_object:
+            self._emit_fields(value, fields)
+        if self._is_echo(value):
+            self.suppressed_echoes += 1
+            return None
+        self._from_view = None
+        if value is self.viewmodel_linked_object:
+            for listener in self._update_listeners:
+                listener(fields)
+        if isinstance(value, ViewWindow):
+            value = value.to_view()
+        else:
+            value = readonly_ndarrays(value)
         return self.pyqtobject.signal.emit(value)
@@ -0,0 +1,180 @@
+"""Common logic of the Qt item models for lists of Pydantic models."""
+
+import re
+from typing import Any, Callable, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from ..pydantic_utils import untracked
+from .ndarray_utils import state_values_equal
+from .pydantic_utils import (
+    get_errored_fields_from_validation_error,
+    get_list_item_type,
+    get_nested_pydantic_field,
+)
+from .utils import is_path_affected, rgetattr
+
+# reset the whole model instead of sending notifications when more rows than that have changed
+RESET_RATIO = 0.5
+
+
+class ListChanges:
+    """Changes of a bound list since the item model was last synchronized."""
+
+    def __init__(self) -> None:
+        self.reset = False
+        self.inserted: Optional[Tuple[int, int]] = None
+        self.removed: Optional[Tuple[int, int]] = None
+        # ranges of rows (first, last) with changed values
+        self.changed: List[Tuple[int, int]] = []
+
+
+class PydanticListAdapter:
+    """Maps a list of Pydantic models in a bound model to rows and columns, independent of the PyQt version.
+
+    The adapter keeps references to the rows and their values shown in the View, so that changes of the list
+    can be translated into minimal notifications (changed rows, rows inserted or removed at the end).
+    """
+
+    def __init__(
+        self,
+        communicator: Any,
+        field: str,
+        apply_changes: Callable[[ListChanges], None],
+        columns: Optional[List[str]] = None,
+    ) -> None:
+        self.communicator = communicator
+        self.apply_changes = apply_changes
+        if communicator.prefix:
+            field = field.removeprefix(f"{communicator.prefix}.")
+        self.field = field
+        field_info = get_nested_pydantic_field(communicator.viewmodel_linked_object, field)
+        self.item_type = get_list_item_type(field_info.annotation)
+        if self.item_type is None:
+            raise ValueError(f"{field} is not a list of Pydantic models")
+        self.columns = columns or list(self.item_type.model_fields)
+        self.rows: List[Any] = []
+        self._values: List[Tuple] = []
+        self._pending: Optional[List[int]] = None
+        self.sync()
+        communicator.connect_updates(self._on_updates)
+
+    def _on_updates(self, fields: Optional[List[str]]) -> None:
+        self.apply_changes(self.changes(fields))
+
+    @property
+    def items(self) -> List[Any]:
+        return rgetattr(self.communicator.viewmodel_linked_object, self.field) or []
+
+    def _row_values(self, item: Any) -> Tuple:
+        return tuple(getattr(item, column, None) for column in self.columns)
+
+    def _row_changed(self, index: int, item: Any) -> bool:
+        if item is not self.rows[index]:
+            return True
+        try:
+            return bool(self._row_values(item) != self._values[index])
+        except ValueError:  # e.g. NumPy arrays
+            return True
+
+    def header(self, column: int) -> str:
+        name = self.columns[column]
+        field_info = self.item_type.model_fields.get(name) if self.item_type else None
+        return field_info.title if field_info and field_info.title else name
+
+    def value(self, row: int, column: int) -> Any:
+        return getattr(self.rows[row], self.columns[column], None)
+
+    def is_editable(self, column: int) -> bool:
+        return self.item_type is not None and self.columns[column] in self.item_type.model_fields
+
+    def _get_changed_rows(self, fields: List[str]) -> Optional[List[int]]:
+        # returns None if the list itself (not only its items) might have changed
+        rows = set()
+        for path in fields:
+            if not is_path_affected(self.field, [path]):
+                continue
+            match = re.match(r"\[(\d+)\]", path[len(self.field) :]) if path.startswith(self.field) else None
+            if not match:
+                return None
+            rows.add(int(match.group(1)))
+        return sorted(rows)
+
+    def changes(self, fields: Optional[List[str]] = None) -> ListChanges:
+        """Compare the bound list with the rows shown in the View.
+
+        Parameters
+        ----------
+        fields : list[str], optional
+            Paths of the changed fields (e.g. from ``get_updated_fields``), if known. Only these rows are compared.
+        """
+        items = self.items
+        result = ListChanges()
+        rows = self._get_changed_rows(fields) if fields is not None else None
+        if rows is not None and len(items) == len(self.rows) and all(row < len(items) for row in rows):
+            candidates = rows
+        else:
+            candidates = list(range(min(len(items), len(self.rows))))
+            if len(items) > len(self.rows):
+                result.inserted = (len(self.rows), len(items) - 1)
+            elif len(items) < len(self.rows):
+                result.removed = (len(items), len(self.rows) - 1)
+        changed = [row for row in candidates if self._row_changed(row, items[row])]
+        if len(changed) > RESET_RATIO * max(len(items), 1) and len(changed) > 1:
+            result.reset = True
+            self._pending = None
+            return result
+        for row in changed:
+            if result.changed and result.changed[-1][1] == row - 1:
+                result.changed[-1] = (result.changed[-1][0], row)
+            else:
+                result.changed.append((row, row))
+        self._pending = changed
+        return result
+
+    def sync(self) -> None:
+        """Update the rows shown in the View with the values of the bound list."""
+        items = self.items
+        if self._pending is None:
+            self.rows = list(items)
+            self._values = [self._row_values(item) for item in items]
+        else:
+            old_count = len(self.rows)
+            # references are cheap to copy, the items might have been replaced by equal ones
+            self.rows = list(items)
+            del self._values[len(items) :]
+            self._values.extend(self._row_values(item) for item in items[old_count:])
+            for row in self._pending:
+                self._values[row] = self._row_values(items[row])
+        self._pending = None
+
+    def set_value(self, row: int, column: int, value: Any) -> bool:
+        """Validate the row with the new value and replace it in the bound list.
+
+        Returns
+        -------
+        bool
+            True if the value has been accepted.
+        """
+        item = self.rows[row]
+        name = self.columns[column]
+        path = f"{self.field}[{row}]"
+        communicator = self.communicator
+        try:
+            new_item = type(item).model_validate({**item.__dict__, name: value})
+        except ValidationError as e:
+            errors = [f"{path}.{error}" if error else path for error in get_errored_fields_from_validation_error(e)]
+            if communicator.callback_after_update:
+                communicator.callback_after_update({"updated": [], "errored": errors, "error": e})
+            return False
+        if state_values_equal(getattr(item, name), getattr(new_item, name)):
+            return True
+        with untracked(communicator.viewmodel_linked_object):
+            self.items[row] = new_item
+        self.rows[row] = new_item
+        self._values[row] = self._row_values(new_item)
+        updates = [f"{path}.{name}"]
+        communicator.notify_view_update(updates, source=self._on_updates)
+        if communicator.callback_after_update:
+            communicator.callback_after_update({"updated": updates, "errored": [], "error": None})
+        return True
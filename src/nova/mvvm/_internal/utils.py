@@ -1,7 +1,7 @@
 """Internal common functions tp be used within the package."""
 
 import re
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from nova.mvvm import bindings_map
 from nova.mvvm.interface import LinkedObjectType
@@ -20,6 +20,17 @@ def list_has_objects(v: list) -> bool:
     return False
 
 
+def is_path_affected(path: str, changed_paths: List[str]) -> bool:
+    """Check if a field path is changed by a change of any of the given paths (parents, children or the path itself)."""
+    for changed in changed_paths:
+        if changed == path:
+            return True
+        shorter, longer = sorted((changed, path), key=len)
+        if longer.startswith(shorter) and longer[len(shorter)] in ".[":
+            return True
+    return False
+
+
 def rget_list_of_fields(obj: Any, prefix: str = "") -> Any:
     if not hasattr(obj, "__dict__"):
         return [prefix]
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Callable, Coroutine, Optional, Union
 
+from ._internal.progress import MIN_DELTA, MIN_INTERVAL, ProgressThrottle
+
 LinkedObjectType = Optional[Any]
 LinkedObjectAttributesType = Optional[list[str]]
 ConnectCallbackType = Union[None, Callable[[Any, Optional[str]], None]]
@@ -15,8 +17,24 @@ class Worker:
     """Abstract worker class.
 
     Provides methods required to run tasks in backend.
+    Progress reported by the task is rate limited (see ``throttle_progress``), the final progress is always delivered.
     """
 
+    progress_throttle: ProgressThrottle
+
+    def throttle_progress(self, min_interval: float = MIN_INTERVAL, min_delta: int = MIN_DELTA) -> None:
+        """
+        Set how often the progress callbacks are called, should be called before starting the task.
+
+        Args:
+            min_interval (float): Minimum time between two progress updates, in seconds. 0 to disable the limit.
+            min_delta (int): Minimum change of the progress value between two updates with the same message.
+        """
+        # subclasses outside of this package may not create a throttle in their __init__
+        current = getattr(self, "progress_throttle", None)
+        deliver = current.deliver if current is not None else None
+        self.progress_throttle = ProgressThrottle(min_interval, min_delta, deliver)
+
     @abstractmethod
     def start(self) -> None:
         """Start running the task in a background thread."""
@@ -63,6 +81,42 @@ class Worker:
         raise NotImplementedError("connect_progress() must be implemented in a subclass")
 
 
+class ViewWindow(ABC):
+    """Abstract class for values of which only the part shown in the View is sent to the View.
+
+    The View requests the part it shows (e.g. visible range or page) by changing the parameters
+    listed in ``view_parameters`` and the binding sends ``to_view()`` again if the part has changed.
+    """
+
+    view_parameters: tuple[str, ...] = ()
+
+    @abstractmethod
+    def set_view(self, *args: Any, **kwargs: Any) -> bool:
+        """
+        Set the parameters requested by the View.
+
+        Returns
+        -------
+        bool
+            True if the part shown in the View has changed and has to be sent again.
+        """
+        raise NotImplementedError("set_view() must be implemented in a subclass")
+
+    @abstractmethod
+    def to_view(self) -> dict[str, Any]:
+        """Return the representation of the part shown in the View."""
+        raise NotImplementedError("to_view() must be implemented in a subclass")
+
+    def refresh(self) -> None:  # noqa: B027
+        """Discard cached data, called when the ViewModel updates the View after changing the underlying data."""
+
+    def request_view(self, request: Any) -> bool:
+        """Call set_view with the parameters found in the value sent by the View."""
+        if not isinstance(request, dict):
+            return False
+        return self.set_view(**{key: request[key] for key in self.view_parameters if key in request})
+
+
 class Communicator(ABC):
     """Abstract communicator class.
 
@@ -109,6 +163,43 @@ class Communicator(ABC):
         """
         raise Exception("Please implement in a concrete class")
 
+    def update_fields_in_view(self, value: Any, fields: list[str]) -> None:
+        """
+        Update UI component(s) with the provided value, only the given fields have changed.
+
+        Called by :code:`ObservableModel.flush()`. Implementations can use the list of fields to send only
+        the changed parts of the value, by default the whole value is updated.
+
+        Parameters
+        ----------
+        value : Any
+            The new value to be reflected in the view.
+        fields : list[str]
+            Paths of the changed fields (e.g. ``ranges[1].min_value``).
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+        self.update_in_view(value)
+
+    def disconnect(self) -> None:
+        """
+        Disconnect the binding from the View, e.g. when the ViewModel is disposed.
+
+        Removes the binding from :code:`bindings_map` and the references the framework keeps to it (state change
+        handlers, signal connections, watchers), so that the binding and its linked object can be garbage
+        collected once the ViewModel is no longer referenced. The binding does not update the View
+        or the linked object afterwards.
+
+        Returns
+        -------
+        None
+            This method does not return a value.
+        """
+        raise Exception("Please implement in a concrete class")
+
 
 class BindingInterface(ABC):
     """Abstract binding interface."""
@@ -0,0 +1,137 @@
+"""Module for sending large lists to the View one page at a time."""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+from .interface import ViewWindow
+
+
+class ListWindow(ViewWindow):
+    """List that is sent to the View one page at a time.
+
+    Only the rows of the page shown in the View are serialized and sent, so the size of the state update does not
+    depend on the length of the list. The View requests another page, page size, sorting or filter by changing
+    ``page``, ``page_size``, ``sort_by``, ``descending`` or ``filter`` and only the new page is sent.
+    The window keeps a reference to the list, after modifying it the ViewModel calls ``update_in_view`` with the
+    window, which is then sent again only if the rows of the shown page have changed.
+
+    Parameters
+    ----------
+    items : list
+        Items of the list, e.g. Pydantic models or dicts.
+    page_size : int
+        Number of rows in a page.
+    filter_fields : list[str], optional
+        Fields searched by the filter. All fields of the shown rows are searched if not provided.
+    """
+
+    view_parameters = ("page", "page_size", "sort_by", "descending", "filter")
+
+    def __init__(self, items: List[Any], page_size: int = 50, filter_fields: Optional[Sequence[str]] = None) -> None:
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        self.items = items
+        self.page = 0
+        self.page_size = page_size
+        self.sort_by: Optional[str] = None
+        self.descending = False
+        self.filter = ""
+        self.filter_fields = list(filter_fields) if filter_fields is not None else None
+        self._indices: Optional[List[int]] = None
+
+    @staticmethod
+    def _row(item: Any) -> Dict[str, Any]:
+        if isinstance(item, BaseModel):
+            return item.model_dump()
+        if isinstance(item, dict):
+            return item
+        return {"value": item}
+
+    @staticmethod
+    def _field(item: Any, name: str) -> Any:
+        if isinstance(item, dict):
+            return item.get(name)
+        return getattr(item, name, None)
+
+    def _matches(self, item: Any, text: str) -> bool:
+        fields = self.filter_fields if self.filter_fields is not None else list(self._row(item))
+        return any(text in str(self._field(item, name)).lower() for name in fields)
+
+    @property
+    def indices(self) -> List[int]:
+        """Indices of the items that pass the filter, in the requested order."""
+        if self._indices is None:
+            indices = list(range(len(self.items)))
+            if self.filter:
+                text = self.filter.lower()
+                indices = [i for i in indices if self._matches(self.items[i], text)]
+            if self.sort_by:
+                values = {i: self._field(self.items[i], self.sort_by) for i in indices}
+                # None values go last, whatever the direction of sorting
+                missing = [i for i in indices if values[i] is None]
+                indices = [i for i in indices if values[i] is not None]
+                indices.sort(key=values.__getitem__, reverse=self.descending)
+                indices += missing
+            self._indices = indices
+        return self._indices
+
+    @property
+    def total(self) -> int:
+        """Number of items that pass the filter."""
+        return len(self.indices)
+
+    @property
+    def page_count(self) -> int:
+        return max((self.total + self.page_size - 1) // self.page_size, 1)
+
+    def set_view(
+        self,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        sort_by: Optional[str] = None,
+        descending: Optional[bool] = None,
+        filter: Optional[str] = None,  # noqa: A002
+    ) -> bool:
+        """Set the page, sorting and filter requested by the View.
+
+        Returns
+        -------
+        bool
+            True if the shown page has changed.
+        """
+        old = (self.page, self.page_size, self.sort_by, self.descending, self.filter)
+        if page_size is not None and page_size > 0:
+            self.page_size = int(page_size)
+        if sort_by is not None:
+            self.sort_by = sort_by or None  # an empty string from the View resets sorting
+        if descending is not None:
+            self.descending = bool(descending)
+        if filter is not None:
+            self.filter = filter
+        if (self.sort_by, self.descending, self.filter) != old[2:]:
+            self._indices = None
+        if page is not None:
+            self.page = int(page)
+        self.page = min(max(self.page, 0), self.page_count - 1)
+        return (self.page, self.page_size, self.sort_by, self.descending, self.filter) != old
+
+    def refresh(self) -> None:
+        """Sort and filter the list again on the next update, called after the items have been changed."""
+        self._indices = None
+        self.page = min(self.page, self.page_count - 1)
+
+    def to_view(self) -> Dict[str, Any]:
+        """Return the rows of the shown page with their indices in the list and the state of the window."""
+        start = self.page * self.page_size
+        indices = self.indices[start : start + self.page_size]
+        return {
+            "rows": [self._row(self.items[i]) for i in indices],
+            "indices": indices,
+            "page": self.page,
+            "page_size": self.page_size,
+            "total": self.total,
+            "sort_by": self.sort_by,
+            "descending": self.descending,
+            "filter": self.filter,
+        }
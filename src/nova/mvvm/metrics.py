@@ -0,0 +1,180 @@
+"""Module for measuring what bindings and workers do.
+
+Metrics are recorded per binding name (the state variable or the name given to ``connect``, the type of the linked
+object otherwise) and per task for workers. Recording is opt-in: nothing is measured until ``Metrics.enable``
+is called, and the bindings only check a flag while it is disabled.
+
+Example
+-------
+>>> metrics = Metrics()
+>>> metrics.enable()
+>>> ...
+>>> print(metrics.to_prometheus())
+"""
+
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+from ._internal import instrumentation
+from ._internal.instrumentation import Event
+
+# upper bounds of the buckets of the duration histograms, in seconds
+DURATION_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# events counted as updates, by direction
+_DIRECTIONS = {instrumentation.VIEW_UPDATE: "view_to_model", instrumentation.MODEL_UPDATE: "model_to_view"}
+
+
+class Histogram:
+    """Cumulative histogram of durations, as in Prometheus.
+
+    Parameters
+    ----------
+    buckets : Sequence[float]
+        Increasing upper bounds of the buckets, in seconds.
+    """
+
+    def __init__(self, buckets: Sequence[float] = DURATION_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        # the last count is for values above the last bucket
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative_counts(self) -> List[int]:
+        """Number of values lower or equal to each bucket bound, the last count is for +Inf."""
+        result = []
+        total = 0
+        for count in self.counts:
+            total += count
+            result.append(total)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        buckets = {**dict(zip(self.buckets, self.counts[:-1], strict=True)), float("inf"): self.counts[-1]}
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class BindingMetrics:
+    """Metrics of one binding or worker task."""
+
+    def __init__(self) -> None:
+        # number of updates by direction (view_to_model or model_to_view)
+        self.updates: Dict[str, int] = {}
+        # durations by operation (view_update, model_update, validate, diff, serialize, worker_queue, worker_run)
+        self.durations: Dict[str, Histogram] = {}
+        self.payload_bytes = 0
+        self.validation_errors = 0
+
+    def record(self, event: Event) -> None:
+        direction = _DIRECTIONS.get(event.kind)
+        if direction:
+            self.updates[direction] = self.updates.get(direction, 0) + 1
+        if event.duration is not None:
+            histogram = self.durations.get(event.kind)
+            if histogram is None:
+                histogram = self.durations[event.kind] = Histogram()
+            histogram.observe(event.duration)
+        if event.kind == instrumentation.PAYLOAD and event.size:
+            self.payload_bytes += event.size
+        elif event.kind == instrumentation.VALIDATION_ERROR:
+            self.validation_errors += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "updates": dict(self.updates),
+            "durations": {kind: histogram.to_dict() for kind, histogram in self.durations.items()},
+            "payload_bytes": self.payload_bytes,
+            "validation_errors": self.validation_errors,
+        }
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class Metrics:
+    """Records counts, durations and payload sizes of the updates made by all bindings and of worker tasks.
+
+    Recorded per binding:
+
+    - number of updates of the ViewModel by the View (``view_to_model``) and of the View by the ViewModel
+      (``model_to_view``),
+    - histograms of the durations of updates, validation, comparison (``diff``) and serialization,
+    - bytes sent to the View (Trame only, approximate size of the state values) and number of validation errors,
+    - for worker tasks: histograms of the time waited before running (``worker_queue``) and of the run time.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._bindings: Dict[str, BindingMetrics] = {}
+
+    def __call__(self, event: Event) -> None:
+        """Record an event, called by the bindings while enabled."""
+        with self._lock:
+            metrics = self._bindings.get(event.binding)
+            if metrics is None:
+                metrics = self._bindings[event.binding] = BindingMetrics()
+            metrics.record(event)
+
+    def enable(self) -> None:
+        """Start recording."""
+        instrumentation.add_sink(self)
+
+    def disable(self) -> None:
+        """Stop recording, recorded metrics are kept."""
+        instrumentation.remove_sink(self)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._bindings.clear()
+
+    def get(self, binding: Optional[str] = None) -> Dict[str, Any]:
+        """Return the metrics of all bindings by name, or of the given binding, as dicts."""
+        with self._lock:
+            if binding is not None:
+                metrics = self._bindings.get(binding)
+                return metrics.to_dict() if metrics else BindingMetrics().to_dict()
+            return {name: metrics.to_dict() for name, metrics in self._bindings.items()}
+
+    def to_prometheus(self) -> str:
+        """Return the metrics in the Prometheus text exposition format."""
+        updates = [
+            "# HELP nova_mvvm_updates_total Number of updates by binding and direction.",
+            "# TYPE nova_mvvm_updates_total counter",
+        ]
+        durations = [
+            "# HELP nova_mvvm_duration_seconds Duration of operations by binding.",
+            "# TYPE nova_mvvm_duration_seconds histogram",
+        ]
+        payload = [
+            "# HELP nova_mvvm_payload_bytes_total Bytes sent to the View by binding.",
+            "# TYPE nova_mvvm_payload_bytes_total counter",
+        ]
+        errors = [
+            "# HELP nova_mvvm_validation_errors_total Number of values from the View that failed validation.",
+            "# TYPE nova_mvvm_validation_errors_total counter",
+        ]
+        with self._lock:
+            for name, metrics in sorted(self._bindings.items()):
+                binding = f'binding="{_label(name)}"'
+                for direction, count in sorted(metrics.updates.items()):
+                    updates.append(f'nova_mvvm_updates_total{{{binding},direction="{direction}"}} {count}')
+                for operation, histogram in sorted(metrics.durations.items()):
+                    labels = f'{binding},operation="{operation}"'
+                    bounds = [*(repr(bound) for bound in histogram.buckets), "+Inf"]
+                    for bound, count in zip(bounds, histogram.cumulative_counts(), strict=True):
+                        durations.append(f'nova_mvvm_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                    durations.append(f"nova_mvvm_duration_seconds_sum{{{labels}}} {histogram.sum!r}")
+                    durations.append(f"nova_mvvm_duration_seconds_count{{{labels}}} {histogram.count}")
+                if metrics.payload_bytes:
+                    payload.append(f"nova_mvvm_payload_bytes_total{{{binding}}} {metrics.payload_bytes}")
+                if metrics.validation_errors:
+                    errors.append(f"nova_mvvm_validation_errors_total{{{binding}}} {metrics.validation_errors}")
+        return "\n".join([*updates, *durations, *payload, *errors]) + "\n"
@@ -0,0 +1,162 @@
+"""Module for NumPy array support in bindings.
+
+Requires NumPy to be installed (``pip install nova-mvvm[numpy]``).
+"""
+
+from typing import Annotated, Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+from ._internal.ndarray_utils import decode_ndarray, is_encoded_ndarray
+from .interface import ViewWindow
+
+
+def _validate_ndarray(value: Any) -> np.ndarray:
+    if isinstance(value, np.ndarray):
+        return value
+    if is_encoded_ndarray(value):
+        return decode_ndarray(value)
+    return np.asarray(value)
+
+
+class _NDArrayPydanticAnnotation:
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source_type: Any, _handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        # arrays are kept as-is in Python mode (no copies) and converted to lists for JSON only
+        return core_schema.no_info_plain_validator_function(
+            _validate_ndarray,
+            serialization=core_schema.plain_serializer_function_ser_schema(lambda v: v.tolist(), when_used="json"),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, _core_schema: core_schema.CoreSchema, _handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        return {"type": "array", "items": {}}
+
+
+NDArray = Annotated[np.ndarray, _NDArrayPydanticAnnotation]
+"""Pydantic field type for NumPy arrays.
+
+Arrays assigned to the field are stored without copying, lists are converted with ``numpy.asarray``.
+Bindings transport these fields as typed arrays and compare them with vectorized equality.
+
+Example
+-------
+>>> class Detector(BaseModel):
+...     image: NDArray = Field(default_factory=lambda: np.zeros((512, 512)))
+"""
+
+
+class DecimatedSeries(ViewWindow):
+    """Numeric series that is sent to the View as a min/max decimated representation.
+
+    Only the visible range of the series is decimated to about ``2 * resolution`` points (the minimum and the
+    maximum of each bucket), so that plotting a long series does not require sending all points to the View.
+    The View can request another visible range or resolution (e.g. on zoom) and only that range is decimated again.
+    The data is accessed by slicing, so ``numpy.memmap`` arrays can be used and are never fully loaded into memory.
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Series values, can be a ``numpy.memmap``.
+    x : numpy.ndarray, optional
+        Monotonically increasing coordinates of the values. Indices are used if not provided.
+    resolution : int
+        Number of buckets (usually the width of the plot in pixels).
+    chunk_size : int
+        Maximum number of points read from the source at once.
+    """
+
+    view_parameters = ("x_range", "resolution")
+
+    def __init__(
+        self, y: np.ndarray, x: Optional[np.ndarray] = None, resolution: int = 1500, chunk_size: int = 1 << 20
+    ) -> None:
+        if x is not None and len(x) != len(y):
+            raise ValueError("x and y must have the same length")
+        self.y = y
+        self.x = x
+        self.resolution = resolution
+        self.chunk_size = chunk_size
+        self.x_range: Optional[Tuple[float, float]] = None
+
+    def set_view(self, x_range: Optional[Sequence[float]] = None, resolution: Optional[int] = None) -> bool:
+        """Set the visible range and/or the resolution requested by the View.
+
+        Returns
+        -------
+        bool
+            True if the view has changed and the series has to be decimated again.
+        """
+        changed = False
+        if x_range is not None:
+            new_range = (float(x_range[0]), float(x_range[1]))
+            if new_range != self.x_range:
+                self.x_range = new_range
+                changed = True
+        if resolution is not None and int(resolution) != self.resolution:
+            self.resolution = int(resolution)
+            changed = True
+        return changed
+
+    def reset_view(self) -> None:
+        """Show the whole series."""
+        self.x_range = None
+
+    def _visible_slice(self) -> Tuple[int, int]:
+        if self.x_range is None:
+            return 0, len(self.y)
+        low, high = self.x_range
+        if self.x is None:
+            start, stop = int(np.floor(low)), int(np.ceil(high)) + 1
+        else:
+            start = int(np.searchsorted(self.x, low, side="left"))
+            stop = int(np.searchsorted(self.x, high, side="right"))
+        # include one point outside the range on each side so lines reach the plot borders
+        return max(start - 1, 0), min(stop + 1, len(self.y))
+
+    def _decimated_indices(self, start: int, stop: int) -> np.ndarray:
+        count = stop - start
+        resolution = max(self.resolution, 1)
+        if count <= 2 * resolution:
+            return np.arange(start, stop)
+        bucket = -(-count // resolution)
+        buckets_per_chunk = max(self.chunk_size // bucket, 1)
+        indices = []
+        for chunk_start in range(start, stop, bucket * buckets_per_chunk):
+            chunk_stop = min(chunk_start + bucket * buckets_per_chunk, stop)
+            block = np.asarray(self.y[chunk_start:chunk_stop])
+            n_buckets = -(-len(block) // bucket)
+            # pad the last bucket with its first value so that all buckets have the same size
+            padded = np.resize(block, n_buckets * bucket) if len(block) % bucket else block
+            if len(block) % bucket:
+                padded[len(block) :] = block[(n_buckets - 1) * bucket]
+            buckets = padded.reshape(n_buckets, bucket)
+            offsets = np.arange(n_buckets) * bucket + chunk_start
+            pairs = np.stack([buckets.argmin(axis=1), buckets.argmax(axis=1)], axis=1)
+            pairs.sort(axis=1)
+            indices.append((pairs + offsets[:, None]).ravel())
+        return np.unique(np.concatenate(indices))
+
+    def decimate(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return x and y of the decimated visible range."""
+        start, stop = self._visible_slice()
+        indices = self._decimated_indices(start, stop)
+        y = np.asarray(self.y[indices])
+        x = np.asarray(self.x[indices]) if self.x is not None else indices
+        return x, y
+
+    def to_view(self) -> Dict[str, Any]:
+        """Return the representation of the series that is sent to the View."""
+        x, y = self.decimate()
+        return {
+            "x": x,
+            "y": y,
+            "x_range": list(self.x_range) if self.x_range is not None else None,
+            "resolution": self.resolution,
+            "total_points": len(self.y),
+        }
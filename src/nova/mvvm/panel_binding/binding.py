@@ -1,12 +1,18 @@
 """Binding module for the Panel framework."""
 
 import inspect
-from typing import Any
+from concurrent.futures import Executor
+from typing import Any, Callable, Optional
 
 import param
+from typing_extensions import override
 
-from .._internal.utils import rgetattr, rsetattr
-from ..interface import BindingInterface
+from .._internal import instrumentation
+from .._internal.ndarray_utils import snapshot_value, state_values_equal
+from .._internal.utils import is_path_affected, rgetattr, rsetattr
+from ..interface import BindingInterface, Worker
+from ..pydantic_utils import ObservableModel
+from .panel_worker import PanelWorker, get_executor
 
 
 def is_parameterized(var: Any) -> bool:
@@ -25,16 +31,37 @@ class Communicator:
         viewmodel_linked_object: Any = None,
         linked_object_attributes: Any = None,
         callback_after_update: Any = None,
+        batch_callbacks: bool = False,
     ) -> None:
         self.viewmodel_linked_object = viewmodel_linked_object
         self.linked_object_attributes = linked_object_attributes
         self.callback_after_update = callback_after_update
+        # call callback_after_update once per batch of widget events with a list of keys instead of once per key
+        self.batch_callbacks = batch_callbacks
 
         self._set_linked_object_attributes(linked_object_attributes, viewmodel_linked_object)
 
         self.connection: Any = None
         self.param_connect: Any = None
         self.linked_object_parameterized: Any = None
+        # number of updates not sent to the View because the widget has just sent the same value
+        self.suppressed_echoes = 0
+        # values received from widgets (per attribute) that have not been overwritten since
+        self._from_view: dict[str, Any] = {}
+        # version of the linked ObservableModel that the View shows, None if unknown (e.g. after a change by the View)
+        self._synced_version: Optional[int] = None
+        # set while the binding updates widgets, so that its own watchers ignore the changes
+        self._updating_view = False
+        # watchers registered on widgets and the objects they watch, removed by disconnect
+        self._watchers: list[tuple[Any, Any]] = []
+        self._disconnected = False
+        if isinstance(viewmodel_linked_object, ObservableModel):
+            viewmodel_linked_object.add_communicator(self)
+
+    @property
+    def name(self) -> str:
+        """Name of the binding in instrumentation events."""
+        return instrumentation.binding_name(self.viewmodel_linked_object)
 
     def _set_linked_object_attributes(self, linked_object_attributes: Any, viewmodel_linked_object: Any) -> None:
         self.linked_object_attributes = None
@@ -50,6 +77,8 @@ class Communicator:
 
     # connector can be a dictionary, function, or parameterized object
     def connect(self, connector: Any = None, param_connect: Any = None) -> Any:
+        self._disconnected = False
+        self._synced_version = None
         if is_parameterized(connector):
             self.connection = connector
             self.param_connect = param_connect
@@ -65,55 +94,103 @@ class Communicator:
             # specifying the attribute name in the viewmodel linked
             # the value should be a tuple with this format (parameterized_object, 'parameter', [optional,observers])
             if self.linked_object_attributes and isinstance(connector, dict):
+                # observed parameters of each parameterized object, with the attributes and parameters they update
+                watched: dict[int, tuple[Any, dict[str, list[tuple[str, str]]]]] = {}
                 for attribute_name, connection in connector.items():
                     if attribute_name in self.linked_object_attributes:
                         if not isinstance(connection, tuple) or len(connection) < 2:
                             raise ValueError(f"Expected tuple with at least two elements for {attribute_name}")
-                        # creates a watcher on the parameterized object, and uses a specific
-                        # parameter of the object to get and set values from
-                        if len(connection) > 2:
-                            param_observable = connection[2]
-                        else:
-                            param_observable = connection[1]
-                        try:
-                            self.connection = connector
-                            parameterized = connection[0]
-                            param_connector = connection[1]
-
-                            if is_parameterized(parameterized):
-                                parameterized.param.watch(
-                                    lambda event,
-                                    key=attribute_name,
-                                    parameter=param_connector: self._update_in_viewmodel(
-                                        events=event, key=key, parameter=parameter
-                                    ),
-                                    param_observable,
-                                )
-                            else:
-                                raise Exception(
-                                    f"Cannot create observer for attribute: "
-                                    f"{attribute_name} and parameter {param_connector}"
-                                )
-                        except Exception:
-                            raise Exception("Cannot connect", attribute_name) from None
+                        # uses a specific parameter of the object to get and set values from
+                        parameterized = connection[0]
+                        param_connector = connection[1]
+                        param_observables = connection[2] if len(connection) > 2 else connection[1]
+                        if not is_parameterized(parameterized):
+                            raise Exception("Cannot connect", attribute_name)
+                        self.connection = connector
+                        observed = watched.setdefault(id(parameterized), (parameterized, {}))[1]
+                        if isinstance(param_observables, str):
+                            param_observables = [param_observables]
+                        for param_observable in param_observables:
+                            observed.setdefault(param_observable, []).append((attribute_name, param_connector))
+                # creates a single watcher per parameterized object for all its observed parameters
+                for parameterized, observed in watched.values():
+                    try:
+                        watcher = parameterized.param.watch(
+                            lambda *events, observed=observed: self._on_widget_events(events, observed),
+                            list(observed),
+                        )
+                    except Exception:
+                        raise Exception("Cannot connect", list(observed)) from None
+                    self._watchers.append((parameterized, watcher))
+
+    # Remove the watchers of the widgets and forget the View, so that the ViewModel can be garbage collected
+    # while the widgets are still alive, update_in_view does nothing afterwards
+    def disconnect(self) -> None:
+        for parameterized, watcher in self._watchers:
+            parameterized.param.unwatch(watcher)
+        self._watchers.clear()
+        self.connection = None
+        self.param_connect = None
+        self._from_view.clear()
+        self._disconnected = True
+
+    # Update the viewmodel from a batch of events of a parameterized object, callback_after_update is called
+    # with each key of the events, or once with the list of the keys with batch_callbacks
+    def _on_widget_events(self, events: tuple[Any, ...], observed: dict[str, list[tuple[str, str]]]) -> None:
+        if self._updating_view:
+            return  # the changes were made by update_in_view
+
+        keys: list[str] = []
+        with instrumentation.span(instrumentation.VIEW_UPDATE, self.name, keys):
+            for event in events:
+                for key, parameter in observed.get(event.name, []):
+                    if event.name == parameter:
+                        instrumentation.emit(instrumentation.VIEW_INPUT, self.name, fields=[key], value=event.new)
+                        self._set_in_viewmodel(key, event.new)
+                    if key not in keys:
+                        keys.append(key)
+
+        if keys and self.callback_after_update:
+            if self.batch_callbacks:
+                self.callback_after_update(keys)
+            else:
+                for key in keys:
+                    self.callback_after_update(key)
+
+    def _call_callback_after_update(self, key: str) -> None:
+        if self.callback_after_update:
+            self.callback_after_update([key] if self.batch_callbacks else key)
 
     # Update the viewmodel based on the event triggered or the provided value
     # event parameter is expected but will default to the value parameter if not
     def _update_in_viewmodel(self, events: Any = None, key: str = "", value: Any = None, parameter: Any = None) -> None:
         # Checks to see if the event triggered is the correct event that was specified for the connection
         if events:
+            if self._updating_view:
+                return  # the change was made by update_in_view
+
             if events.name == parameter:
                 value = events.new
             else:
-                if self.callback_after_update:
-                    self.callback_after_update(key)
+                self._call_callback_after_update(key)
                 return
 
+        with instrumentation.span(instrumentation.VIEW_UPDATE, self.name, [key] if key else None):
+            instrumentation.emit(instrumentation.VIEW_INPUT, self.name, fields=[key] if key else [], value=value)
+            self._set_in_viewmodel(key, value)
+
+        self._call_callback_after_update(key)
+
+    def _set_in_viewmodel(self, key: str, value: Any) -> None:
         if not value:
             raise Exception("Could not update viewmodel due to invalid value")
 
+        # the widget may show a value that the model does not hold (e.g. if setting it fails)
+        self._synced_version = None
         if self.viewmodel_linked_object:
             if self.linked_object_attributes and key in self.linked_object_attributes:
+                # the widget already shows this value, no need to send it back
+                self._from_view[key] = snapshot_value(value)
                 if not isinstance(self.viewmodel_linked_object, dict):
                     rsetattr(self.viewmodel_linked_object, key, value)
                 else:
@@ -123,27 +200,76 @@ class Communicator:
             else:
                 raise Exception("cannot update", self.viewmodel_linked_object)
 
-        if self.callback_after_update:
-            self.callback_after_update(key)
-
     # Return the update function as a callback
     def get_callback(self) -> Any:
         return self._update_in_viewmodel
 
     # Update the view based on the provided value
     def update_in_view(self, value: Any) -> None:
+        if self._disconnected:
+            return None
+        observed = value is self.viewmodel_linked_object and isinstance(value, ObservableModel)
+        if observed and value.version == self._synced_version:
+            return value  # nothing has changed since the View was updated, checked without comparing the model
+        result = self._update_in_view(value, self.linked_object_attributes)
+        self._synced_version = value.version if observed else None
+        return result
+
+    # Update the view for the changed fields only, called by ObservableModel.flush()
+    def update_fields_in_view(self, value: Any, fields: list[str]) -> None:
+        if self._disconnected:
+            return
+        attributes = self.linked_object_attributes
+        if attributes:
+            attributes = [attribute for attribute in attributes if is_path_affected(attribute, fields)]
+        self._update_in_view(value, attributes)
+
+    def _add_widget_update(
+        self, updates: dict[int, tuple[Any, dict[str, Any]]], widget: Any, parameter: str, value: Any
+    ) -> None:
+        path, _, name = parameter.rpartition(".")
+        owner = rgetattr(widget, path) if path else widget
+        if not is_parameterized(owner) or name not in owner.param:
+            rsetattr(widget, parameter, value)
+            return
+        if state_values_equal(getattr(owner, name), value):
+            return  # unchanged, setting it would only trigger watchers
+        updates.setdefault(id(owner), (owner, {}))[1][name] = value
+
+    def _apply_widget_updates(self, updates: dict[int, tuple[Any, dict[str, Any]]]) -> None:
+        # param.update sets all parameters of an object at once and dispatches its watchers as a batch
+        self._updating_view = True
+        try:
+            for owner, values in updates.values():
+                owner.param.update(values)
+        finally:
+            self._updating_view = False
+
+    def _update_in_view(self, value: Any, attributes: Any) -> Any:
+        with instrumentation.span(instrumentation.MODEL_UPDATE, self.name, list(attributes or [])):
+            return self._send_to_view(value, attributes)
+
+    def _send_to_view(self, value: Any, attributes: Any) -> Any:
         if is_callable(self.connection):
             self.connection(value)
         elif self.viewmodel_linked_object:
             if self.linked_object_attributes:
-                for attribute_name in self.linked_object_attributes:
+                # parameter values to set, grouped by the Parameterized object they belong to
+                updates: dict[int, tuple[Any, dict[str, Any]]] = {}
+                for attribute_name in attributes:
                     if not isinstance(self.viewmodel_linked_object, dict):
                         value_to_change = rgetattr(value, attribute_name)
                     else:
                         value_to_change = self.viewmodel_linked_object[attribute_name]
+                    if attribute_name in self._from_view:
+                        if state_values_equal(self._from_view[attribute_name], value_to_change):
+                            self.suppressed_echoes += 1
+                            continue
+                        del self._from_view[attribute_name]
                     widget, param = self.connection.get(attribute_name, (None, None))[:2]
                     if widget and param:
-                        rsetattr(widget, param, value_to_change)
+                        self._add_widget_update(updates, widget, param, value_to_change)
+                self._apply_widget_updates(updates)
             elif is_callable(self.viewmodel_linked_object):
                 self.viewmodel_linked_object(value)
         else:
@@ -153,7 +279,21 @@ class Communicator:
 
 
 class PanelBinding(BindingInterface):
-    """Binding Interface implementation for Panel."""
+    """Binding Interface implementation for Panel.
+
+    Parameters
+    ----------
+    executor : concurrent.futures.Executor, optional
+        Executor used to run workers. By default, a thread pool shared by all Panel sessions in the process is used.
+    batch_callbacks : bool
+        If True, ``callback_after_update`` is called once per batch of widget events with the list of the changed
+        keys (a list with one key for direct calls of the callback returned by ``connect``). By default, it is
+        called with each changed key as a string.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, batch_callbacks: bool = False) -> None:
+        self._executor = executor
+        self._batch_callbacks = batch_callbacks
 
     def new_bind(
         self, linked_object: Any = None, linked_object_arguments: Any = None, callback_after_update: Any = None
@@ -161,4 +301,8 @@ class PanelBinding(BindingInterface):
         # each new_bind returns an object that can be used to bind a ViewModel/Model variable
         # with a corresponding GUI framework element
         # for Trame we use state to trigger GUI update and linked_object to trigger ViewModel/Model update
-        return Communicator(linked_object, linked_object_arguments, callback_after_update)
+        return Communicator(linked_object, linked_object_arguments, callback_after_update, self._batch_callbacks)
+
+    @override
+    def new_worker(self, task: Callable[..., Any], *args: Any, **kwargs: Any) -> Worker:
+        return PanelWorker(self._executor or get_executor(), task, *args, **kwargs)
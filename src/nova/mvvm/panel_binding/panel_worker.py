@@ -0,0 +1,121 @@
+"""Worker module for Panel framework."""
+
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, List, Optional
+
+import panel as pn
+from typing_extensions import override
+
+from nova.mvvm._internal import instrumentation
+from nova.mvvm._internal.progress import ProgressThrottle
+from nova.mvvm.interface import Worker
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """Return the executor shared by all Panel sessions in the process."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(thread_name_prefix="nova-mvvm-panel")
+        return _executor
+
+
+class PanelWorker(Worker):
+    """Worker class that executes a function with provided arguments in a shared executor.
+
+    Callbacks are scheduled on the document of the Panel session that started the worker
+    (with ``add_next_tick_callback``), so they can safely update widgets. Without a session
+    (e.g. in scripts and tests) they are called from the worker thread, or from a timer thread for progress
+    delivered once the throttling interval has elapsed.
+    """
+
+    def __init__(self, executor: Executor, task: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        self.executor = executor
+        self.task = task
+        self.args = args
+        self.kwargs = kwargs
+        self.kwargs["progress"] = self._emit_progress
+        self.progress_throttle = ProgressThrottle(deliver=self._deliver_progress)
+        self._queued_at = 0.0
+        self._name = instrumentation.binding_name(task)
+
+        self._doc: Any = None
+        self._on_result: List[Callable] = []
+        self._on_error: List[Callable] = []
+        self._on_finished: List[Callable] = []
+        self._on_progress: List[Callable] = []
+
+    def _run(self) -> None:
+        try:
+            with instrumentation.run_span(self._name, self._queued_at):
+                result = self.task(*self.args, **self.kwargs)
+        except Exception:
+            traceback.print_exc()
+            exctype, value = sys.exc_info()[:2]
+            self._flush_progress()
+            instrumentation.emit(instrumentation.WORKER_ERROR, self._name, value=value)
+            self._emit(self._on_error, (exctype, value, traceback.format_exc()))
+        else:
+            self._flush_progress()
+            instrumentation.emit(instrumentation.WORKER_RESULT, self._name)
+            self._emit(self._on_result, result)
+        finally:
+            instrumentation.emit(instrumentation.WORKER_FINISHED, self._name)
+            self._emit(self._on_finished)
+
+    def _emit_progress(self, message: str, progress: int) -> None:
+        if self.progress_throttle.report(message, progress):
+            self._deliver_progress(message, progress)
+
+    def _flush_progress(self) -> None:
+        pending = self.progress_throttle.flush()
+        if pending is not None:
+            self._deliver_progress(*pending)
+
+    def _deliver_progress(self, message: str, progress: int) -> None:
+        instrumentation.emit(instrumentation.WORKER_PROGRESS, self._name, fields=[message], value=progress)
+        self._emit(self._on_progress, message, progress)
+
+    def _emit(self, callbacks: List[Callable], *args: Any) -> None:
+        for callback in callbacks:
+            if self._doc is not None:
+                self._doc.add_next_tick_callback(partial(self._call, callback, *args))
+            else:
+                self._call(callback, *args)
+
+    def _call(self, callback: Callable, *args: Any) -> None:
+        try:
+            callback(*args)
+        except Exception:
+            traceback.print_exc()
+
+    @override
+    def connect_error(self, callback: Callable[[Any], None]) -> None:
+        self._on_error.append(callback)
+
+    @override
+    def connect_result(self, callback: Callable[[Any], None]) -> None:
+        self._on_result.append(callback)
+
+    @override
+    def connect_finished(self, callback: Callable[[], None]) -> None:
+        self._on_finished.append(callback)
+
+    @override
+    def connect_progress(self, callback: Callable[[str, int], None]) -> None:
+        self._on_progress.append(callback)
+
+    @override
+    def start(self) -> None:
+        self._queued_at = time.perf_counter()
+        instrumentation.emit(instrumentation.WORKER_START, self._name)
+        self._doc = pn.state.curdoc
+        self.executor.submit(self._run)
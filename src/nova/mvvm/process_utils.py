@@ -0,0 +1,174 @@
+"""Module for running tasks in other processes without copying large NumPy results.
+
+Requires NumPy to be installed (``pip install nova-mvvm[numpy]``).
+"""
+
+import multiprocessing
+import threading
+import weakref
+from concurrent.futures import Executor, ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_process_executor() -> ProcessPoolExecutor:
+    """Return the process pool shared by all workers in the process.
+
+    The processes are started with ``forkserver`` where available (``spawn`` on Windows), forking
+    the GUI process with its threads could deadlock the pool.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(mp_context=_get_mp_context())
+        return _executor
+
+
+def _get_mp_context() -> Any:
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+class SharedArray:
+    """NumPy array stored in a shared memory block, which is passed between processes without copying the data.
+
+    Pickling a ``SharedArray`` only transfers the name of the block, its shape and dtype, the receiving process
+    maps the same memory. The block lives until ``release`` is called, usually by the process that received the
+    array, whereas the memory is unmapped in each process once ``array`` and all views of it are no longer
+    referenced. Blocks that are never released are removed when the main process exits, with a warning.
+
+    Parameters
+    ----------
+    shape : Sequence[int]
+        Shape of the array.
+    dtype : Any
+        Data type of the array.
+    name : str, optional
+        Name of an existing block to attach to, a new block is created if not provided.
+
+    Example
+    -------
+    >>> shared = SharedArray.from_array(np.arange(10))  # in the worker process
+    >>> image = shared.take()  # in the main process, after the object has been sent back
+    """
+
+    def __init__(self, shape: Sequence[int], dtype: Any, name: Optional[str] = None) -> None:
+        self.shape = tuple(int(n) for n in shape)
+        self.dtype = np.dtype(dtype)
+        size = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)  # blocks cannot be empty
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self._shm = shared_memory.SharedMemory(name=name)
+        self._released = False
+        self._array: Optional[np.ndarray] = np.ndarray(self.shape, dtype=self.dtype, buffer=self._shm.buf)
+        # unmap the block once the array and its views are garbage collected, closing it earlier would fail
+        weakref.finalize(self._array, self._shm.close)
+
+    @classmethod
+    def from_array(cls, array: Any) -> "SharedArray":
+        """Copy an array into a new shared memory block."""
+        array = np.asarray(array)
+        shared = cls(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def array(self) -> np.ndarray:
+        """Array using the shared memory, without a copy."""
+        if self._array is None:
+            raise ValueError("the array has been taken")
+        return self._array
+
+    def take(self) -> np.ndarray:
+        """Return the array and release the block, the memory is freed when the array is no longer referenced."""
+        array = self.array
+        self._array = None
+        self.release()
+        return array
+
+    def release(self) -> None:
+        """Remove the shared memory block, the processes that still use the array keep their mapping."""
+        if not self._released:
+            self._released = True
+            self._shm.unlink()
+
+    def __enter__(self) -> "SharedArray":
+        """Use the shared array in a ``with`` block, which releases it at the end."""
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        """Release the block."""
+        self.release()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Pickle the name of the block only."""
+        return (SharedArray, (self.shape, self.dtype, self.name))
+
+
+def share_arrays(value: Any) -> Any:
+    """Replace NumPy arrays in a (nested) dict/list/tuple with shared arrays."""
+    if isinstance(value, np.ndarray):
+        return SharedArray.from_array(value)
+    if isinstance(value, dict):
+        return {k: share_arrays(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return _rebuild_sequence(value, [share_arrays(v) for v in value])
+    return value
+
+
+def take_arrays(value: Any) -> Any:
+    """Replace shared arrays in a (nested) dict/list/tuple with the arrays they hold, releasing the blocks."""
+    if isinstance(value, SharedArray):
+        return value.take()
+    if isinstance(value, dict):
+        return {k: take_arrays(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return _rebuild_sequence(value, [take_arrays(v) for v in value])
+    return value
+
+
+def _rebuild_sequence(value: Any, items: list) -> Any:
+    return type(value)(*items) if hasattr(value, "_fields") else type(value)(items)  # named tuples
+
+
+def _call_sharing_arrays(function: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Any:
+    return share_arrays(function(*args, **kwargs))
+
+
+def run_in_process(function: Callable[..., Any], *args: Any, executor: Optional[Executor] = None, **kwargs: Any) -> Any:
+    """Call a function in another process and return its result.
+
+    NumPy arrays in the result (also in dicts, lists and tuples) are written once into shared memory by the other
+    process and returned as arrays mapping that memory, so they are not pickled nor copied again. Meant to be called
+    from the task of a worker, the function and its arguments must be picklable.
+
+    Parameters
+    ----------
+    function : Callable
+        Function to call, must be defined at the top level of a module.
+    executor : concurrent.futures.Executor, optional
+        Process pool to use, a pool shared by all workers is used if not provided.
+
+    Example
+    -------
+    >>> def task(run_number: int, progress: Callable) -> np.ndarray:
+    ...     progress("reducing", 0)
+    ...     return run_in_process(reduce_run, run_number)
+    >>> binding.new_worker(task, 42)
+    """
+    # the processes of the pool have to share the resource tracker of this process, which then forgets the blocks
+    # released here, so it is started before the pool creates its processes
+    resource_tracker.ensure_running()
+    executor = executor or get_process_executor()
+    return take_arrays(executor.submit(_call_sharing_arrays, function, args, kwargs).result())
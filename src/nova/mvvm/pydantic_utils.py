@@ -1,14 +1,18 @@
 """Module for utilities handling nested Pydantic models."""
 
+import copy
 import logging
 import re
-from typing import Any
+import weakref
+from contextlib import contextmanager, nullcontext
+from typing import Any, ContextManager, Dict, Iterable, Iterator, List, Optional, Set
 
-from pydantic import ValidationError
+from pydantic import BaseModel, PrivateAttr, ValidationError
 from pydantic.fields import FieldInfo
+from pydantic_core import PydanticUndefined
 
 from . import bindings_map
-from ._internal.pydantic_utils import get_nested_pydantic_field
+from ._internal.pydantic_utils import DETACHED_CONTEXT, get_nested_pydantic_field
 
 logger = logging.getLogger(__name__)
 
@@ -95,3 +99,276 @@ def validate_pydantic_parameter(name: str, value: Any) -> str | bool:
             ):
                 return error["msg"]
     return True
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except ValueError:  # e.g. NumPy arrays
+        return False
+
+
+_TRACKING_ATTRIBUTES = ("_nova_dirty", "_nova_version", "_nova_parent", "_nova_parent_field", "_nova_communicators")
+
+
+class ObservableList(list):
+    """List that reports in-place modifications to the ObservableModel it belongs to."""
+
+    def __init__(self, iterable: Iterable = (), owner: Optional["ObservableModel"] = None, field: str = "") -> None:
+        super().__init__(iterable)
+        self._owner = owner
+        self._field = field
+        for item in self:
+            self._adopt(item)
+
+    def __reduce__(self) -> Any:
+        """Pickle as a plain list, the owner wraps it again."""
+        return list, (list(self),)
+
+    def __deepcopy__(self, memo: dict) -> list:
+        """Copy as a plain list, the owner wraps it again."""
+        return [copy.deepcopy(item, memo) for item in self]
+
+    def _adopt(self, item: Any) -> None:
+        if isinstance(item, ObservableModel) and item._nova_parent is not self:
+            item._set_parent(self, "")
+            # e.g. detached models validated by the bindings, their lists and sub-models are not adopted yet
+            item._adopt_fields()
+
+    def _changed(self, path: str = "") -> None:
+        if self._owner is not None:
+            self._owner._mark_dirty(path or self._field)
+
+    def _child_changed(self, child: "ObservableModel", _field: str, path: str) -> None:
+        for index, item in enumerate(self):
+            if item is child:
+                self._changed(f"{self._field}[{index}].{path}")
+                return
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        """Set item(s) and mark them as changed."""
+        super().__setitem__(index, value)
+        if isinstance(index, int):
+            self._adopt(value)
+            self._changed(f"{self._field}[{index if index >= 0 else len(self) + index}]")
+        else:
+            for item in value:
+                self._adopt(item)
+            self._changed()
+
+    def __delitem__(self, index: Any) -> None:
+        """Delete item(s) and mark the list as changed."""
+        super().__delitem__(index)
+        self._changed()
+
+    def __iadd__(self, values: Iterable) -> "ObservableList":  # type: ignore[override, misc]
+        """Extend the list and mark it as changed."""
+        self.extend(values)
+        return self
+
+    def append(self, value: Any) -> None:
+        super().append(value)
+        self._adopt(value)
+        self._changed()
+
+    def extend(self, values: Iterable) -> None:
+        values = list(values)
+        super().extend(values)
+        for item in values:
+            self._adopt(item)
+        self._changed()
+
+    def insert(self, index: Any, value: Any) -> None:
+        super().insert(index, value)
+        self._adopt(value)
+        self._changed()
+
+    def pop(self, index: Any = -1) -> Any:
+        value = super().pop(index)
+        self._changed()
+        return value
+
+    def remove(self, value: Any) -> None:
+        super().remove(value)
+        self._changed()
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self._changed()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._changed()
+
+
+class ObservableModel(BaseModel):
+    """Pydantic model that records which fields have been changed.
+
+    Assignments to fields (including fields of nested ObservableModels) and in-place modifications of list fields
+    are recorded as dirty paths in the same format as :code:`get_updated_fields` (e.g. ``ranges[1].min_value``),
+    and increment a version counter. The bindings created for the model compare the version in O(1) to skip
+    ``update_in_view`` of the model when it has not changed since the View was last updated (the PyQt binding also
+    uses it to detect values from the View that do not change the model), and ``flush()`` sends only the dirty
+    fields to the View. In-place changes of values that are not observable (e.g. plain sub-models or dicts) do not
+    change the version, assign the changed value to its field to have it sent.
+
+    Example
+    -------
+    >>> class Config(ObservableModel):
+    ...     name: str = "default"
+    >>> config = Config()
+    >>> config_bind = binding.new_bind(config)
+    >>> config.name = "new"
+    >>> config.flush()  # sends "name" to the View(s)
+    ['name']
+    """
+
+    _nova_dirty: Set[str] = PrivateAttr(default_factory=set)
+    _nova_version: int = PrivateAttr(default=0)
+    _nova_parent: Any = PrivateAttr(default=None)
+    _nova_parent_field: str = PrivateAttr(default="")
+    _nova_communicators: List[Any] = PrivateAttr(default_factory=list)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        if context != DETACHED_CONTEXT:
+            # detached models share values with a bound model, which keeps them
+            self._adopt_fields()
+
+    def _untracked_private(self) -> Optional[Dict[str, Any]]:
+        private = self.__pydantic_private__
+        if private is None:
+            return None
+        result = {k: v for k, v in private.items() if k not in _TRACKING_ATTRIBUTES and v is not PydanticUndefined}
+        result.update({"_nova_dirty": set(), "_nova_version": 0, "_nova_parent": None, "_nova_parent_field": ""})
+        result["_nova_communicators"] = []
+        return result
+
+    def __deepcopy__(self, memo: Optional[Dict[int, Any]] = None) -> "ObservableModel":
+        """Copy the model, the copy does not keep the recorded changes and is not bound to anything."""
+        cls = type(self)
+        result = cls.__new__(cls)
+        object.__setattr__(result, "__dict__", copy.deepcopy(self.__dict__, memo=memo))
+        object.__setattr__(result, "__pydantic_extra__", copy.deepcopy(self.__pydantic_extra__, memo=memo))
+        object.__setattr__(result, "__pydantic_fields_set__", copy.copy(self.__pydantic_fields_set__))
+        object.__setattr__(result, "__pydantic_private__", copy.deepcopy(self._untracked_private(), memo=memo))
+        result._adopt_fields()
+        return result
+
+    def __getstate__(self) -> Dict[Any, Any]:
+        """Get the state for pickling without the recorded changes and bindings."""
+        state = super().__getstate__()
+        state["__pydantic_private__"] = self._untracked_private()
+        return state
+
+    def __setstate__(self, state: Dict[Any, Any]) -> None:
+        """Restore a pickled model."""
+        super().__setstate__(state)
+        self._adopt_fields()
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare field values, the recorded changes are not part of the model value."""
+        if isinstance(other, ObservableModel):
+            return (
+                type(self) is type(other)
+                and self.__dict__ == other.__dict__
+                and (self.__pydantic_extra__ or {}) == (other.__pydantic_extra__ or {})
+            )
+        return super().__eq__(other)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute and mark the field as dirty if its value has changed."""
+        if name not in type(self).model_fields:
+            super().__setattr__(name, value)
+            return
+        old_value = self.__dict__.get(name)
+        super().__setattr__(name, value)
+        self._adopt_field(name)
+        if not _values_equal(old_value, self.__dict__[name]):
+            self._mark_dirty(name)
+
+    def _adopt_fields(self) -> None:
+        for name in type(self).model_fields:
+            self._adopt_field(name)
+
+    def _adopt_field(self, name: str) -> None:
+        value = self.__dict__.get(name)
+        if isinstance(value, list):
+            if not isinstance(value, ObservableList) or value._owner is not self:
+                # bypass validation, the items have already been validated
+                self.__dict__[name] = ObservableList(value, owner=self, field=name)
+        elif isinstance(value, ObservableModel):
+            if value._nova_parent is not self or value._nova_parent_field != name:
+                value._set_parent(self, name)
+                # models adopted before have adopted their fields already
+                value._adopt_fields()
+
+    def _set_parent(self, parent: Any, field: str) -> None:
+        self._nova_parent = parent
+        self._nova_parent_field = field
+
+    def _child_changed(self, _child: "ObservableModel", field: str, path: str) -> None:
+        self._mark_dirty(f"{field}.{path}")
+
+    def _mark_dirty(self, path: str) -> None:
+        self._nova_dirty.add(path)
+        self._nova_version += 1
+        if self._nova_parent is not None:
+            self._nova_parent._child_changed(self, self._nova_parent_field, path)
+
+    @property
+    def version(self) -> int:
+        """Counter incremented on every change of the model, can be used to detect changes in O(1)."""
+        return self._nova_version
+
+    @property
+    def dirty_fields(self) -> List[str]:
+        """Paths of the fields changed since the last flush."""
+        return sorted(self._nova_dirty)
+
+    @contextmanager
+    def untracked(self) -> Iterator[None]:
+        """Do not record changes made within the context as dirty, e.g. values received from the View."""
+        dirty = set(self._nova_dirty)
+        try:
+            yield
+        finally:
+            self._nova_dirty = dirty
+
+    def mark_clean(self) -> None:
+        """Forget the recorded changes without sending them to the View."""
+        self._nova_dirty.clear()
+
+    def add_communicator(self, communicator: Any) -> None:
+        """Register a communicator used by flush(), called by the bindings when the model is bound."""
+        self._nova_communicators.append(weakref.ref(communicator))
+
+    def flush(self) -> List[str]:
+        """Send the fields changed since the last flush to the View(s) of the bindings created for the model.
+
+        Returns
+        -------
+        list[str]
+            The paths of the fields that have been sent.
+        """
+        fields = self.dirty_fields
+        self._nova_dirty.clear()
+        if fields:
+            for communicator_ref in self._nova_communicators:
+                communicator = communicator_ref()
+                if communicator is not None:
+                    communicator.update_fields_in_view(self, fields)
+        return fields
+
+
+def untracked(model: Any) -> ContextManager:
+    """Return a context in which changes of the model are not recorded, a no-op for other objects."""
+    if isinstance(model, ObservableModel):
+        return model.untracked()
+    return nullcontext()
@@ -1,3 +1,4 @@
 from .binding import PyQt5Binding
+from .item_model import PydanticTableModel
 
-__all__ = ["PyQt5Binding"]
+__all__ = ["PyQt5Binding", "PydanticTableModel"]
@@ -1,12 +1,15 @@
 """Worker module for PyQt5 framework."""
 
 import sys
+import time
 import traceback
 from typing import Any, Callable
 
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 from typing_extensions import override
 
+from nova.mvvm._internal import instrumentation
+from nova.mvvm._internal.progress import ProgressThrottle
 from nova.mvvm.interface import Worker
 
 
@@ -29,23 +32,42 @@ class PyQt5Worker(QRunnable, Worker):
         self.task = task
         self.args = args
         self.kwargs = kwargs
+        self.progress_throttle = ProgressThrottle(deliver=self._deliver_progress)
+        self._queued_at = 0.0
+        self._name = instrumentation.binding_name(task)
 
         self.kwargs["progress"] = self._emit_progress
 
     @pyqtSlot()
     def run(self) -> None:
         try:
-            result = self.task(*self.args, **self.kwargs)
+            with instrumentation.run_span(self._name, self._queued_at):
+                result = self.task(*self.args, **self.kwargs)
         except Exception:
             traceback.print_exc()
             exctype, value = sys.exc_info()[:2]
+            self._flush_progress()
+            instrumentation.emit(instrumentation.WORKER_ERROR, self._name, value=value)
             self.signals.error.emit((exctype, value, traceback.format_exc()))
         else:
+            self._flush_progress()
+            instrumentation.emit(instrumentation.WORKER_RESULT, self._name)
             self.signals.result.emit(result)
         finally:
+            instrumentation.emit(instrumentation.WORKER_FINISHED, self._name)
             self.signals.finished.emit()
 
     def _emit_progress(self, message: str, progress: int) -> None:
+        if self.progress_throttle.report(message, progress):
+            self._deliver_progress(message, progress)
+
+    def _flush_progress(self) -> None:
+        pending = self.progress_throttle.flush()
+        if pending is not None:
+            self._deliver_progress(*pending)
+
+    def _deliver_progress(self, message: str, progress: int) -> None:
+        instrumentation.emit(instrumentation.WORKER_PROGRESS, self._name, fields=[message], value=progress)
         self.signals.progress.emit(message, progress)
 
     @override
@@ -66,4 +88,6 @@ class PyQt5Worker(QRunnable, Worker):
 
     @override
     def start(self) -> None:
+        self._queued_at = time.perf_counter()
+        instrumentation.emit(instrumentation.WORKER_START, self._name)
         self.thread_pool.start(self)
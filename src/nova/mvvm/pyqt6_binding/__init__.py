@@ -1,3 +1,4 @@
 from .binding import PyQt6Binding
+from .item_model import PydanticTableModel
 
-__all__ = ["PyQt6Binding"]
+__all__ = ["PyQt6Binding", "PydanticTableModel"]
@@ -1,5 +1,6 @@
 """Binding module for PyQt framework."""
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable
 
 from PyQt6.QtCore import QObject, QThreadPool, pyqtSignal  # type: ignore
@@ -24,10 +25,21 @@ class ThreadPool(QThreadPool):
 
 
 class PyQt6Binding(BindingInterface):
-    """Binding Interface implementation for PyQt."""
+    """Binding Interface implementation for PyQt.
 
-    def __init__(self) -> None:
+    Parameters
+    ----------
+    validate_in_thread : bool
+        Validate the changes of bound Pydantic models made by the View in a background thread, so that validating
+        large models does not block the GUI. The model is updated and ``callback_after_update`` is called
+        in the GUI thread when the validation has finished.
+    """
+
+    def __init__(self, validate_in_thread: bool = False) -> None:
         self.thread_pool = ThreadPool()
+        self.validation_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="nova-mvvm-validation") if validate_in_thread else None
+        )
 
     def new_bind(
         self, linked_object: Any = None, linked_object_arguments: Any = None, callback_after_update: Any = None
@@ -37,7 +49,9 @@ class PyQt6Binding(BindingInterface):
         For PyQt we use pyqtSignal to trigger GU
         I update and linked_object to trigger ViewModel/Model update
         """
-        return PyQtCommunicator(PyQtObject, linked_object, linked_object_arguments, callback_after_update)
+        return PyQtCommunicator(
+            PyQtObject, linked_object, linked_object_arguments, callback_after_update, self.validation_executor
+        )
 
     @override
     def new_worker(self, task: Callable[..., Any], *args: Any, **kwargs: Any) -> Worker:
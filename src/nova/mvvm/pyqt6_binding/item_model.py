@@ -0,0 +1,93 @@
+"""Qt item models for lists of Pydantic models in PyQt6 bindings."""
+
+from typing import Any, List, Optional
+
+from PyQt6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+from .._internal.pyqt_communicator import PyQtCommunicator
+from .._internal.pyqt_item_model import ListChanges, PydanticListAdapter
+
+
+class PydanticTableModel(QAbstractTableModel):
+    """Table model showing a list of Pydantic models from a bound model, one row per item.
+
+    Changes of the list made by the ViewModel are sent as minimal notifications (``dataChanged`` for changed rows,
+    ``rowsInserted``/``rowsRemoved`` at the end of the list) when the binding updates the View. Edits are validated
+    for the edited row only and replace the item in the bound list.
+
+    Parameters
+    ----------
+    binding : PyQtCommunicator
+        Binding created for the model that holds the list.
+    field : str
+        Path of the list in the model (e.g. ``ranges``), can be prefixed with the binding name.
+    columns : list[str], optional
+        Fields of the items shown as columns, all fields by default.
+    parent : QObject, optional
+        Parent object.
+    """
+
+    def __init__(
+        self,
+        binding: PyQtCommunicator,
+        field: str,
+        columns: Optional[List[str]] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.adapter = PydanticListAdapter(binding, field, self._apply_changes, columns)
+
+    def _apply_changes(self, changes: ListChanges) -> None:
+        if changes.reset:
+            self.beginResetModel()
+            self.adapter.sync()
+            self.endResetModel()
+            return
+        if changes.removed:
+            self.beginRemoveRows(QModelIndex(), *changes.removed)
+            self.adapter.sync()
+            self.endRemoveRows()
+        elif changes.inserted:
+            self.beginInsertRows(QModelIndex(), *changes.inserted)
+            self.adapter.sync()
+            self.endInsertRows()
+        else:
+            self.adapter.sync()
+        last_column = self.columnCount() - 1
+        for first, last in changes.changed:
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_column))
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        return 0 if parent.isValid() else len(self.adapter.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008, N802
+        return 0 if parent.isValid() else len(self.adapter.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid() or role not in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return None
+        value = self.adapter.value(index.row(), index.column())
+        return str(value) if role == Qt.ItemDataRole.DisplayRole and value is not None else value
+
+    def setData(self, index: QModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole) -> bool:  # noqa: N802
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        if not self.adapter.set_value(index.row(), index.column(), value):
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    def headerData(  # noqa: N802
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.adapter.header(section)
+        return str(section)
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        flags = super().flags(index)
+        if index.isValid() and self.adapter.is_editable(index.column()):
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
@@ -0,0 +1,240 @@
+"""Module for recording the updates made by the View and replaying them, e.g. to reproduce slowdowns of a session.
+
+Recordings are stored with ``pickle``, only load recordings from trusted sources.
+
+Example
+-------
+>>> recorder = Recorder()
+>>> recorder.start()
+>>> ...  # use the application
+>>> recorder.stop()
+>>> recorder.save("session.rec")
+>>> # later, with the same ViewModel and bindings, e.g. in a test
+>>> results = await replay_trame(load_recording("session.rec"), server.state)
+>>> print(summarize(results))
+"""
+
+import asyncio
+import gzip
+import pickle
+import threading
+import time
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+from ._internal import instrumentation
+from ._internal.instrumentation import Event
+from ._internal.pyqt_communicator import PyQtCommunicator
+from .bindings_map import bindings_map
+
+_FORMAT = ("nova-mvvm-recording", 1)
+
+
+class RecordedEvent(NamedTuple):
+    """Update made by the View."""
+
+    # seconds since the start of the recording
+    time: float
+    binding: str
+    # state variable (Trame) or path of the field (PyQt, Panel), empty if the whole object was updated
+    key: str
+    # pickled value sent by the View, copied when it was received
+    payload: bytes
+
+    @property
+    def value(self) -> Any:
+        return pickle.loads(self.payload)
+
+
+class ReplayResult(NamedTuple):
+    """Replayed event with the time the binding took to update the ViewModel, None if it did not within timeout."""
+
+    event: RecordedEvent
+    latency: Optional[float]
+
+
+def _picklable(value: Any) -> Any:
+    # buffers of encoded arrays are memoryviews, which cannot be pickled
+    if isinstance(value, memoryview):
+        return value.tobytes()
+    if isinstance(value, dict):
+        return {k: _picklable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(_picklable(v) for v in value)
+    return value
+
+
+class Recorder:
+    """Records the values sent by the View to all bindings (Trame state changes, PyQt and Panel updates).
+
+    Parameters
+    ----------
+    bindings : list[str], optional
+        Names of the bindings to record, all bindings if not provided.
+    """
+
+    def __init__(self, bindings: Optional[Sequence[str]] = None) -> None:
+        self.bindings = set(bindings) if bindings is not None else None
+        self._events: List[RecordedEvent] = []
+        self._lock = threading.Lock()
+        self._start: Optional[float] = None
+
+    def __call__(self, event: Event) -> None:
+        """Record a value received from the View, called by the bindings while recording."""
+        if event.kind != instrumentation.VIEW_INPUT or (
+            self.bindings is not None and event.binding not in self.bindings
+        ):
+            return
+        # pickled right away, the View can modify the value in place later
+        payload = pickle.dumps(_picklable(event.value), protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if self._start is None:
+                self._start = event.start
+            key = event.fields[0] if event.fields else ""
+            self._events.append(RecordedEvent(event.start - self._start, event.binding, key, payload))
+
+    def start(self) -> None:
+        instrumentation.add_sink(self)
+
+    def stop(self) -> None:
+        instrumentation.remove_sink(self)
+
+    @property
+    def events(self) -> List[RecordedEvent]:
+        with self._lock:
+            return list(self._events)
+
+    def save(self, path: str) -> None:
+        """Write the recorded events to a compressed file."""
+        with gzip.open(path, "wb") as file:
+            pickle.dump((_FORMAT, [tuple(event) for event in self.events]), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def load_recording(path: str) -> List[RecordedEvent]:
+    """Read events written by ``Recorder.save``."""
+    with gzip.open(path, "rb") as file:
+        file_format, events = pickle.load(file)
+    if file_format != _FORMAT:
+        raise ValueError(f"{path} is not a recording")
+    return [RecordedEvent(*event) for event in events]
+
+
+class _Completions:
+    """Times at which bindings have finished updating the ViewModel, from view_update events."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        self.loop = loop
+        self.ends: Dict[str, float] = {}
+        self.changed = asyncio.Event()
+
+    def __call__(self, event: Event) -> None:
+        if event.kind == instrumentation.VIEW_UPDATE and event.duration is not None:
+            self.loop.call_soon_threadsafe(self._complete, event.binding, event.start + event.duration)
+
+    def _complete(self, binding: str, end: float) -> None:
+        self.ends[binding] = end
+        self.changed.set()
+
+    async def wait(self, binding: str, after: float, timeout: float) -> Optional[float]:
+        deadline = self.loop.time() + timeout
+        while True:
+            end = self.ends.get(binding)
+            if end is not None and end >= after:
+                return end
+            self.changed.clear()
+            remaining = deadline - self.loop.time()
+            if remaining <= 0:
+                return None
+            try:
+                await asyncio.wait_for(self.changed.wait(), remaining)
+            except asyncio.TimeoutError:
+                return None
+
+
+async def _wait_until(start: float, event: RecordedEvent, speed: Optional[float]) -> None:
+    if speed:
+        delay = start + event.time / speed - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def replay_trame(
+    events: Sequence[RecordedEvent], state: Any, speed: Optional[float] = 1.0, timeout: float = 5.0
+) -> List[ReplayResult]:
+    """Replay recorded events by setting the Trame state variables, as the View did.
+
+    Events are replayed one after the other, waiting for the binding to update the ViewModel before replaying
+    the next event. Must be called from the event loop of the server.
+
+    Parameters
+    ----------
+    events : list[RecordedEvent]
+        Events to replay.
+    state : trame_server.state.State
+        State of the server with the same bindings as in the recorded session.
+    speed : float, optional
+        1 to replay at the original pace, 2 twice as fast, None to replay as fast as possible.
+    timeout : float
+        Maximum time to wait for a binding to update the ViewModel, in seconds.
+    """
+    completions = _Completions(asyncio.get_running_loop())
+    instrumentation.add_sink(completions)
+    results = []
+    try:
+        start = time.perf_counter()
+        for event in events:
+            await _wait_until(start, event, speed)
+            sent = time.perf_counter()
+            with state:
+                state[event.key] = event.value
+                state.dirty(event.key)
+            end = await completions.wait(event.binding, sent, timeout)
+            results.append(ReplayResult(event, end - sent if end is not None else None))
+    finally:
+        instrumentation.remove_sink(completions)
+    return results
+
+
+def replay_pyqt(events: Sequence[RecordedEvent], speed: Optional[float] = 1.0) -> List[ReplayResult]:
+    """Replay recorded events by calling the callbacks of the PyQt bindings, as the widgets did.
+
+    The bindings are found by name in ``bindings_map``. The latency is the time the callback took, changes
+    validated in a thread (``validate_in_thread``) are only queued by the callback.
+
+    Parameters
+    ----------
+    events : list[RecordedEvent]
+        Events to replay.
+    speed : float, optional
+        1 to replay at the original pace, 2 twice as fast, None to replay as fast as possible.
+    """
+    results = []
+    start = time.perf_counter()
+    for event in events:
+        communicator = bindings_map.get(event.binding)
+        if not isinstance(communicator, PyQtCommunicator):
+            raise KeyError(f"no PyQt binding named {event.binding}")
+        if speed:
+            time.sleep(max(start + event.time / speed - time.perf_counter(), 0))
+        sent = time.perf_counter()
+        communicator._update_viewmodel_callback(event.key or None, event.value)
+        results.append(ReplayResult(event, time.perf_counter() - sent))
+    return results
+
+
+def summarize(results: Sequence[ReplayResult]) -> Dict[str, Any]:
+    """Return the number of events, the latency statistics in seconds and the number of events that timed out."""
+    latencies = sorted(result.latency for result in results if result.latency is not None)
+    summary: Dict[str, Any] = {"count": len(results), "timed_out": len(results) - len(latencies)}
+    if latencies:
+
+        def percentile(p: float) -> float:
+            return latencies[min(int(p * len(latencies)), len(latencies) - 1)]
+
+        summary.update(
+            mean=sum(latencies) / len(latencies),
+            p50=percentile(0.5),
+            p95=percentile(0.95),
+            p99=percentile(0.99),
+            max=latencies[-1],
+        )
+    return summary
@@ -0,0 +1,140 @@
+"""Module for recording a trace of what bindings and workers do, to find what stalls the UI.
+
+The trace can be exported in the Chrome trace format and opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+Example
+-------
+>>> tracer = Tracer()
+>>> tracer.start()
+>>> ...
+>>> tracer.stop()
+>>> tracer.export("trace.json")
+"""
+
+import json
+import os
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+
+from ._internal import instrumentation
+from ._internal.instrumentation import Event
+
+
+class Tracer:
+    """Records the events of bindings and workers in a ring buffer.
+
+    Recorded events: updates of the ViewModel by the View and of the View by the ViewModel, validation, comparison
+    and serialization (with their durations), payloads, validation errors, and the lifecycle of workers (start,
+    queue and run times, progress, result or error, finished). Each event has a timestamp, the thread, the binding
+    name (or the name of the task) and the paths of the fields concerned. Only the last ``capacity`` events are kept,
+    so the tracer can run for a long time with a bounded memory.
+
+    Parameters
+    ----------
+    capacity : int
+        Maximum number of events kept.
+    """
+
+    def __init__(self, capacity: int = 100_000) -> None:
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self._events: Deque[Event] = deque(maxlen=capacity)
+
+    def __call__(self, event: Event) -> None:
+        """Record an event, called by the bindings while the tracer runs."""
+        if event.kind == instrumentation.VIEW_INPUT:
+            return  # the values received from the View are not kept, view_update events show the updates
+        self._events.append(event)  # appending to a deque is thread safe
+
+    @property
+    def running(self) -> bool:
+        return instrumentation.has_sink(self)
+
+    def start(self) -> None:
+        """Start recording, can be called at any time."""
+        instrumentation.add_sink(self)
+
+    def stop(self) -> None:
+        """Stop recording, recorded events are kept."""
+        instrumentation.remove_sink(self)
+
+    def clear(self) -> None:
+        self._events.clear()
+
+    @property
+    def events(self) -> List[Event]:
+        """Recorded events, oldest first."""
+        return list(self._events)
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """Return the recorded events in the Chrome trace format (JSON object format).
+
+        Events with a duration are complete events (``"ph": "X"``), other events are instant events.
+        Timestamps are in microseconds, from an arbitrary origin.
+        """
+        pid = os.getpid()
+        threads: Dict[int, str] = {}
+        trace: List[Dict[str, Any]] = []
+        for event in self.events:
+            threads[event.thread_id] = event.thread
+            args: Dict[str, Any] = {"binding": event.binding}
+            if event.fields is not None:
+                args["fields"] = event.fields
+            if event.size is not None:
+                args["size"] = event.size
+            if event.value is not None:
+                args["value"] = event.value if isinstance(event.value, (int, float, str)) else repr(event.value)
+            entry = {
+                "name": f"{event.kind} {event.binding}",
+                "cat": event.kind,
+                "ts": event.start * 1e6,
+                "pid": pid,
+                "tid": event.thread_id,
+                "args": args,
+            }
+            if event.duration is not None:
+                entry.update(ph="X", dur=event.duration * 1e6)
+            else:
+                entry.update(ph="i", s="t")
+            trace.append(entry)
+        names = [
+            {"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": name}}
+            for tid, name in threads.items()
+        ]
+        return {"traceEvents": names + trace, "displayTimeUnit": "ms"}
+
+    def export(self, path: str) -> None:
+        """Write the recorded events to a file in the Chrome trace format."""
+        with open(path, "w") as file:
+            json.dump(self.to_chrome_trace(), file)
+
+    def connect_trame(self, server: Any, name: str = "nova_tracer", path: Optional[str] = None) -> None:
+        """Control the tracer from the clients of a running Trame server.
+
+        Setting the state variable ``<name>_running`` starts or stops the tracer. The trigger ``<name>_export``
+        returns the trace in the Chrome trace format (and writes it to ``path`` if given).
+
+        Parameters
+        ----------
+        server : trame_server.Server
+            Trame server.
+        name : str
+            Prefix of the state variable and of the trigger.
+        path : str, optional
+            File the trace is written to on export.
+        """
+        state = server.state
+        state.setdefault(f"{name}_running", self.running)
+
+        @state.change(f"{name}_running")
+        def toggle(**kwargs: Any) -> None:
+            if kwargs[f"{name}_running"]:
+                self.start()
+            else:
+                self.stop()
+
+        @server.trigger(f"{name}_export")
+        def export() -> Dict[str, Any]:
+            if path:
+                self.export(path)
+            return self.to_chrome_trace()
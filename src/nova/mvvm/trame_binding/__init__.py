@@ -1,3 +1,4 @@
 from .binding import TrameBinding
+from .serializers import DefaultSerializer, MsgpackSerializer, OrjsonSerializer, StateSerializer
 
-__all__ = ["TrameBinding"]
+__all__ = ["TrameBinding", "StateSerializer", "DefaultSerializer", "OrjsonSerializer", "MsgpackSerializer"]
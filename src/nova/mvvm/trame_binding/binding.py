@@ -2,15 +2,44 @@
 
 import asyncio
 import inspect
-import json
-from typing import Any, Callable, List, Optional, Union, cast
+import threading
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Type, Union, cast
 
 from pydantic import BaseModel, ValidationError
 from trame_server.state import State
 from typing_extensions import override
 
-from .._internal.pydantic_utils import get_errored_fields_from_validation_error, get_updated_fields
-from .._internal.utils import check_binding, normalize_field_name, rget_list_of_fields, rgetattr, rsetattr
+from .._internal import instrumentation
+from .._internal.ndarray_utils import (
+    columns_equal,
+    deepcopy_sharing_ndarrays,
+    models_to_columns,
+    np,
+    snapshot_value,
+    state_values_equal,
+)
+from .._internal.pydantic_utils import (
+    DETACHED_CONTEXT,
+    copy_model,
+    get_errored_fields_from_validation_error,
+    get_list_item_type,
+    get_updated_fields,
+    models_equal,
+    snapshot_model,
+    update_rows_from_columns,
+    validate_list_items,
+)
+from .._internal.utils import (
+    check_binding,
+    is_path_affected,
+    normalize_field_name,
+    rget_list_of_fields,
+    rgetattr,
+    rsetattr,
+)
 from ..bindings_map import bindings_map
 from ..interface import (
     BindingInterface,
@@ -19,8 +48,12 @@ from ..interface import (
     ConnectCallbackType,
     LinkedObjectAttributesType,
     LinkedObjectType,
+    ViewWindow,
     Worker,
 )
+from ..pydantic_utils import ObservableModel, untracked
+from .callback_scheduler import CallbackPolicy, CallbackScheduler
+from .serializers import DefaultSerializer, StateSerializer
 from .trame_worker import TrameWorker
 
 
@@ -36,6 +69,37 @@ def is_callable(var: Any) -> bool:
     return inspect.isfunction(var) or inspect.ismethod(var)
 
 
+# marks attributes that have not been sent to the View yet
+_NOT_SENT = object()
+
+# event loops of the started Trame servers (None until the server is ready)
+_server_loops: "weakref.WeakKeyDictionary[Any, Optional[asyncio.AbstractEventLoop]]" = weakref.WeakKeyDictionary()
+
+
+def _track_server_loop(state: State) -> Any:
+    """Remember the event loop of the server of the state once it is ready, return the server if it is known."""
+    # trame's State does not expose its server, its commit function is a method of the server
+    server = getattr(getattr(state, "_push_state_fn", None), "__self__", None)
+    if server is None or not hasattr(server, "controller"):
+        return None
+    if server not in _server_loops:
+        _server_loops[server] = None
+        server_ref = weakref.ref(server)
+
+        def remember_loop(**_kwargs: Any) -> None:
+            ready_server = server_ref()
+            if ready_server is not None:
+                _server_loops[ready_server] = asyncio.get_running_loop()
+
+        server.controller.on_server_ready.add(remember_loop)
+    return server
+
+
+# validated model (None if not valid or not changed) and results for callback_after_update (None if not changed)
+_ValidationResult = Tuple[Optional[BaseModel], Optional[Dict[str, Any]]]
+_Validator = Callable[[BaseModel], _ValidationResult]
+
+
 class TrameCommunicator(Communicator):
     """Communicator implementation for Trame."""
 
@@ -45,12 +109,35 @@ class TrameCommunicator(Communicator):
         viewmodel_linked_object: LinkedObjectType = None,
         linked_object_attributes: LinkedObjectAttributesType = None,
         callback_after_update: CallbackAfterUpdateType = None,
+        serializer: Optional[StateSerializer] = None,
+        validation_executor: Optional[Executor] = None,
+        callback_policy: CallbackPolicy = "serial",
+        max_pending_callbacks: Optional[int] = None,
     ) -> None:
         self.state = state
+        self.serializer = serializer or DefaultSerializer()
+        self.validation_executor = validation_executor
         self.viewmodel_linked_object = viewmodel_linked_object
         self._set_linked_object_attributes(linked_object_attributes, viewmodel_linked_object)
         self.viewmodel_callback_after_update = callback_after_update
+        self.callback_scheduler = CallbackScheduler(callback_after_update, callback_policy, max_pending_callbacks)
         self.connections: List[Union[CallBackConnection, StateConnection]] = []
+        self._disconnected = False
+        # number of updates not sent to the View because it already has the values (it has just sent them)
+        self.suppressed_echoes = 0
+        # event loop of the server, updates from other threads are applied on it
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server = _track_server_loop(state)
+        self._in_loop()
+        # updates from other threads waiting for the loop, in order: [value, fields or None for all]
+        self._pending_updates: List[List[Any]] = []
+        self._pending_lock = threading.Lock()
+        # number of updates from other threads replaced by a newer update of the same value before being applied
+        self.coalesced_updates = 0
+        # version of the linked ObservableModel that the View shows, None if unknown (e.g. after a change by the View)
+        self._synced_version: Optional[int] = None
+        if isinstance(viewmodel_linked_object, ObservableModel):
+            viewmodel_linked_object.add_communicator(self)
 
     def _set_linked_object_attributes(
         self, linked_object_attributes: LinkedObjectAttributesType, viewmodel_linked_object: LinkedObjectType
@@ -61,6 +148,7 @@ class TrameCommunicator(Communicator):
             and not isinstance(viewmodel_linked_object, dict)
             and not issubclass(type(viewmodel_linked_object), BaseModel)
             and not is_callable(viewmodel_linked_object)
+            and not isinstance(viewmodel_linked_object, ViewWindow)
         ):
             if not linked_object_attributes:
                 self.linked_object_attributes = rget_list_of_fields(viewmodel_linked_object)
@@ -68,28 +156,153 @@ class TrameCommunicator(Communicator):
                 self.linked_object_attributes = linked_object_attributes
 
     @override
-    def connect(self, connector: Any = None) -> ConnectCallbackType:
+    def connect(
+        self,
+        connector: Any = None,
+        shards: Union[bool, List[str], None] = None,
+        columnar: Optional[List[str]] = None,
+    ) -> ConnectCallbackType:
+        """Connect a state variable or a callback to the binding.
+
+        Parameters
+        ----------
+        connector : str or Callable, optional
+            Name of the state variable or a function to call on update.
+        shards : bool or list of str, optional
+            Only for Pydantic models connected to a state variable. Store the given fields (all fields
+            holding sub-models if True) in separate state variables named ``<connector>_<field>``, the other fields
+            stay in ``<connector>``. An update then only sends the state variables that have changed.
+        columnar : list of str, optional
+            Only for Pydantic models connected to a state variable. Fields holding lists of Pydantic models that are
+            stored as shards in columnar form: ``{"__columns__": {<item field>: <values>}, "length": <n>}`` with
+            numeric values as typed arrays. Columns are compared with vectorized equality and only the rows
+            changed by the View are validated. Requires NumPy to be installed.
+        """
+        self._in_loop()
         new_connection: Union[CallBackConnection, StateConnection]
         if is_callable(connector):
             new_connection = CallBackConnection(self, connector)
         else:
             connector = str(connector) if connector else None
+            is_model = connector and issubclass(type(self.viewmodel_linked_object), BaseModel)
+            if shards and not is_model:
+                raise ValueError("shards can only be used for Pydantic models connected to a state variable")
+            if columnar and not is_model:
+                raise ValueError("columnar can only be used for Pydantic models connected to a state variable")
+            if columnar and np is None:
+                raise ImportError("columnar requires NumPy to be installed (pip install nova-mvvm[numpy])")
             if connector:
                 check_binding(self.viewmodel_linked_object, connector)
                 bindings_map[connector] = self
-            new_connection = StateConnection(self, connector)
+            new_connection = StateConnection(self, connector, shards, columnar)
 
         self.connections.append(new_connection)
+        self._disconnected = False
+        self._synced_version = None
 
         return new_connection.get_callback()
 
+    @override
+    def disconnect(self) -> None:
+        """Remove the state change handlers of the binding and the binding from ``bindings_map``.
+
+        The state variables keep their last values. Updates from workers not applied yet are dropped, later calls
+        of ``update_in_view`` do nothing.
+        """
+        for connection in self.connections:
+            if isinstance(connection, StateConnection):
+                connection.disconnect()
+                if connection.state_variable_name and bindings_map.get(connection.state_variable_name) is self:
+                    del bindings_map[connection.state_variable_name]
+        self.connections.clear()
+        with self._pending_lock:
+            self._pending_updates.clear()
+        self._disconnected = True
+
+    def _in_loop(self) -> bool:
+        """Check if called from the event loop and remember the loop."""
+        try:
+            self._loop = asyncio.get_running_loop()
+            return True
+        except RuntimeError:
+            return False
+
+    def _defer_to_loop(self, value: Any, fields: Optional[List[str]]) -> bool:
+        """Schedule the update on the event loop if called from another thread (e.g. a worker).
+
+        Updates are applied in the order they were made, consecutive updates of the same value are coalesced
+        until the loop applies them. Returns False if the update has to be applied now: on the loop thread,
+        or if the loop is not known (the server has not started) or not running.
+        """
+        if self._in_loop():
+            return False
+        loop = self._loop or _server_loops.get(self._server)
+        if loop is None or not loop.is_running():
+            return False
+        with self._pending_lock:
+            pending = self._pending_updates[-1] if self._pending_updates else None
+            if pending is not None and pending[0] is value:
+                self.coalesced_updates += 1
+                if pending[1] is not None and fields is not None:
+                    pending[1] = list(dict.fromkeys([*pending[1], *fields]))
+                else:
+                    pending[1] = None
+                return True
+            self._pending_updates.append([value, fields])
+        if pending is None:
+            loop.call_soon_threadsafe(self._apply_pending_updates)
+        return True
+
+    def _apply_pending_updates(self) -> None:
+        with self._pending_lock:
+            pending_updates, self._pending_updates = self._pending_updates, []
+        for value, fields in pending_updates:
+            self._send(value, fields)
+
+    def _send(self, value: Any, fields: Optional[List[str]]) -> None:
+        if fields is not None:
+            for connection in self.connections:
+                connection.update_fields_in_view(value, fields)
+            return
+        observed = value is self.viewmodel_linked_object and isinstance(value, ObservableModel)
+        if observed and value.version == self._synced_version:
+            return  # nothing has changed since the View was updated, checked without comparing the model
+        for connection in self.connections:
+            connection.update_in_view(value)
+        self._synced_version = value.version if observed else None
+
+    def _view_changed(self) -> None:
+        """Called when the View changes a value, the View may then show a value that the model does not hold."""
+        self._synced_version = None
+
     @override
     def update_in_view(self, value: Any) -> None:
+        """Update the View with the value.
+
+        Can be called from any thread, e.g. from a worker: the update is then applied on the event loop of the
+        server in the order they were made, consecutive updates of the same value made before the loop applies them
+        are sent once. For a linked ObservableModel, nothing is compared nor sent if its version has not changed
+        since the last update.
+        """
         if not self.connections:
+            if self._disconnected:
+                return
             raise ValueError("You must call connect on this binding before calling update_in_view.")
+        if self._defer_to_loop(value, None):
+            return
 
-        for connection in self.connections:
-            connection.update_in_view(value)
+        self._send(value, None)
+
+    @override
+    def update_fields_in_view(self, value: Any, fields: List[str]) -> None:
+        if not self.connections:
+            if self._disconnected:
+                return
+            raise ValueError("You must call connect on this binding before calling update_in_view.")
+        if self._defer_to_loop(value, fields):
+            return
+
+        self._send(value, fields)
 
 
 class CallBackConnection:
@@ -105,13 +318,15 @@ class CallBackConnection:
     def _update_viewmodel_callback(self, value: Any, key: Optional[str] = None) -> None:
         updates: list[str] = []
         errors: list[str] = []
+        self.communicator._view_changed()
         if self.viewmodel_linked_object and issubclass(type(self.viewmodel_linked_object), BaseModel):
-            model = self.viewmodel_linked_object.copy(deep=True)
+            model = copy_model(self.viewmodel_linked_object)
             rsetattr(model, key or "", value)
             try:
                 new_model = model.__class__(**model.model_dump(warnings=False))
-                for f, v in new_model:
-                    setattr(self.viewmodel_linked_object, f, v)
+                with untracked(self.viewmodel_linked_object):
+                    for f, v in new_model:
+                        setattr(self.viewmodel_linked_object, f, v)
             except Exception:
                 pass
         elif isinstance(self.viewmodel_linked_object, dict):
@@ -134,6 +349,9 @@ class CallBackConnection:
     def update_in_view(self, value: Any) -> None:
         self.callback(value)
 
+    def update_fields_in_view(self, value: Any, _fields: List[str]) -> None:
+        self.callback(value)
+
     def get_callback(self) -> ConnectCallbackType:
         return self._update_viewmodel_callback
 
@@ -141,38 +359,315 @@ class CallBackConnection:
 class StateConnection:
     """Connection that uses a state variable."""
 
-    def __init__(self, communicator: TrameCommunicator, state_variable_name: Optional[str]) -> None:
+    def __init__(
+        self,
+        communicator: TrameCommunicator,
+        state_variable_name: Optional[str],
+        shards: Union[bool, List[str], None] = None,
+        columnar: Optional[List[str]] = None,
+    ) -> None:
         self.state_variable_name = state_variable_name
         self.communicator = communicator
+        self.name = instrumentation.binding_name(communicator.viewmodel_linked_object, state_variable_name)
         self.state = communicator.state
+        self.serializer = communicator.serializer
+        self.validation_executor = communicator.validation_executor
+        # incremented for every value from the View validated in the executor, to discard superseded results
+        self._validation_sequence = 0
         self.viewmodel_linked_object = communicator.viewmodel_linked_object
         self.viewmodel_callback_after_update = communicator.viewmodel_callback_after_update
         self.linked_object_attributes = communicator.linked_object_attributes
+        self.shards = self._get_shards(shards)
+        # model types of the list items of the fields stored in columnar form
+        self.columnar = {field: self._get_item_type(field) for field in columnar or []}
+        self.shards += [field for field in self.columnar if field not in self.shards]
+        self._columnar_names = {self._get_shard_name(field) for field in self.columnar}
+        # values (before serialization) currently in the state for the shard variables
+        self._sent: Dict[str, Any] = {}
+        # state variable names and values last sent for linked_object_attributes, indexed by attribute position
+        self._attribute_names = [self._get_name_in_state(name) for name in self.linked_object_attributes or []]
+        self._attributes_sent: List[Any] = [_NOT_SENT] * len(self._attribute_names)
+        # state variables holding values sent by the View (not overwritten by update_in_view since)
+        self._from_view: Set[str] = set()
+        # state change handlers and the state variables they are registered for, removed by disconnect
+        self._handlers: List[Tuple[Callable, Tuple[str, ...]]] = []
         self._connect()
 
+    def _get_shards(self, shards: Union[bool, List[str], None]) -> List[str]:
+        if not shards:
+            return []
+        if isinstance(shards, list):
+            return shards
+        shard_fields = []
+        for field, value in cast(BaseModel, self.viewmodel_linked_object):
+            is_model_list = isinstance(value, list) and any(isinstance(v, BaseModel) for v in value)
+            if isinstance(value, BaseModel) or is_model_list:
+                shard_fields.append(field)
+        return shard_fields
+
+    def _get_item_type(self, field: str) -> Type[BaseModel]:
+        field_info = type(cast(BaseModel, self.viewmodel_linked_object)).model_fields.get(field)
+        item_type = get_list_item_type(field_info.annotation) if field_info else None
+        if item_type is None:
+            raise ValueError(f"{field} is not a list of Pydantic models")
+        return item_type
+
+    def _values_equal(self, name_in_state: str, a: Any, b: Any) -> bool:
+        if name_in_state in self._columnar_names:
+            return columns_equal(a, b)
+        return state_values_equal(a, b)
+
     async def _handle_callback(self, results: dict) -> None:
-        if self.viewmodel_callback_after_update:
-            if inspect.iscoroutinefunction(self.viewmodel_callback_after_update):
-                await self.viewmodel_callback_after_update(results)
-            else:
-                self.viewmodel_callback_after_update(results)
+        self.communicator._in_loop()  # bindings are often created before the server starts
+        await self.communicator.callback_scheduler.submit(results)
 
     def _on_state_update(self, attribute_name: str, name_in_state: str) -> Callable:
+        index = self._attribute_names.index(name_in_state)
+
         async def update(**_kwargs: Any) -> None:
             updates: list[str] = [attribute_name]
-            rsetattr(self.viewmodel_linked_object, attribute_name, self.state[name_in_state])
+            with instrumentation.span(instrumentation.VIEW_UPDATE, self.name, updates):
+                instrumentation.emit(
+                    instrumentation.VIEW_INPUT, self.name, fields=[name_in_state], value=self.state[name_in_state]
+                )
+                value = self.serializer.load(self.state[name_in_state])
+                # the View already has this value, no need to send it back
+                self._attributes_sent[index] = snapshot_value(value)
+                self._from_view.add(name_in_state)
+                self.communicator._view_changed()
+                rsetattr(self.viewmodel_linked_object, attribute_name, value)
             await self._handle_callback({"updated": updates, "errored": [], "error": None})
 
         return update
 
+    def _watch(self, handler: Callable, *names: str) -> None:
+        self.state.change(*names)(handler)
+        self._handlers.append((handler, names))
+
+    def disconnect(self) -> None:
+        """Remove the state change handlers registered by the connection."""
+        # Trame has no API to remove change handlers, they are stored by translated state variable name
+        change_callbacks = getattr(self.state, "_change_callbacks", {})
+        for handler, names in self._handlers:
+            for name in names:
+                key = self.state.translator.translate_key(name)
+                callbacks = change_callbacks.get(key, [])
+                callbacks[:] = [callback for callback in callbacks if callback[0] is not handler]
+        self._handlers.clear()
+
     def _set_variable_in_state(self, name_in_state: str, value: Any) -> None:
+        self._set_variables_in_state({name_in_state: value})
+
+    def _suppress_echoes(self, names: Iterable[str]) -> None:
+        self.communicator.suppressed_echoes += len(self._from_view.intersection(names))
+
+    def _set_variables_in_state(self, values: Dict[str, Any]) -> None:
+        if not values:
+            return
+        if instrumentation.enabled:
+            size = instrumentation.payload_size(values)
+            instrumentation.emit(instrumentation.PAYLOAD, self.name, fields=list(values), size=size)
+        self._from_view.difference_update(values)
         if is_async():
             with self.state:
-                self.state[name_in_state] = value
-                self.state.dirty(name_in_state)
+                self.state.update(values)
+                self.state.dirty(*values)
         else:
-            self.state[name_in_state] = value
-            self.state.dirty(name_in_state)
+            self.state.update(values)
+            self.state.dirty(*values)
+
+    def _get_shard_name(self, field: str) -> str:
+        return f"{self.state_variable_name}_{normalize_field_name(field)}"
+
+    def _split_shards(self, model: BaseModel) -> Dict[str, Any]:
+        data = model.model_dump(exclude=set(self.columnar))
+        parts = {}
+        for field in self.shards:
+            if field in self.columnar:
+                items = getattr(model, field) or []
+                value = models_to_columns(items, list(self.columnar[field].model_fields))
+            else:
+                value = data.pop(field)
+            parts[self._get_shard_name(field)] = value
+        parts[cast(str, self.state_variable_name)] = data
+        return parts
+
+    def _update_shards_in_view(self, model: BaseModel, fields: Optional[List[str]] = None) -> None:
+        parts = self._split_shards(model)
+        if fields is not None:
+            # only the shards holding the changed fields need to be compared and sent
+            touched = {field.split(".")[0].split("[")[0] for field in fields}
+            names = {self._get_shard_name(field) for field in self.shards if field in touched}
+            if touched - set(self.shards):
+                names.add(cast(str, self.state_variable_name))
+            parts = {name: value for name, value in parts.items() if name in names}
+        with instrumentation.span(instrumentation.DIFF, self.name):
+            changed = {
+                name: value
+                for name, value in parts.items()
+                if name not in self._sent or not self._values_equal(name, self._sent[name], value)
+            }
+        self._sent.update(changed)
+        self._suppress_echoes(parts.keys() - changed.keys())
+        self._set_variables_in_state(self._serialize(changed))
+
+    async def _update_model(self, validate: _Validator) -> Optional[Dict[str, Any]]:
+        """Validate the value received from the View with the given function and update the linked model.
+
+        The function compares the value with the model it is given. With a validation executor, it runs in the
+        executor with a snapshot of the linked model taken on the event loop, and the result is discarded if the
+        View has sent another value in the meantime (the newer value includes the changes of the older one).
+        Only the fields changed by the View are set, the fields changed by the ViewModel during the validation
+        are kept. Returns the results for callback_after_update, None if the model has not changed.
+        """
+        model_object = cast(BaseModel, self.viewmodel_linked_object)
+        if self.validation_executor is None:
+            model, results = self._validate(validate, model_object)
+        else:
+            self._validation_sequence += 1
+            sequence = self._validation_sequence
+            model, results = await asyncio.get_running_loop().run_in_executor(
+                self.validation_executor, self._validate, validate, snapshot_model(model_object)
+            )
+            if sequence != self._validation_sequence:
+                return None  # superseded by a newer value from the View
+        if results and results["errored"]:
+            instrumentation.emit(instrumentation.VALIDATION_ERROR, self.name, fields=results["errored"])
+        if model is not None and results:
+            fields = {update.split(".")[0].split("[")[0] for update in results["updated"]}
+            with untracked(model_object):
+                for field in fields:
+                    setattr(model_object, field, getattr(model, field))
+        return results
+
+    def _validate(self, validate: _Validator, model_object: BaseModel) -> _ValidationResult:
+        with instrumentation.span(instrumentation.VALIDATE, self.name):
+            return validate(model_object)
+
+    def _validate_model(self, state_value: Any, model_object: BaseModel) -> _ValidationResult:
+        """Validate the value received from the View against the given model, does not modify the model.
+
+        Returns the new model (None if it is not valid or has not changed) and the results for
+        callback_after_update (None if the model has not changed).
+        """
+        try:
+            model = self._validate_changed_items(state_value, model_object) or self.serializer.validate_model(
+                type(model_object), state_value
+            )
+        except ValidationError as e:
+            return None, {"updated": [], "errored": get_errored_fields_from_validation_error(e), "error": e}
+        if models_equal(model, model_object):
+            return None, None
+        with instrumentation.span(instrumentation.DIFF, self.name):
+            updates = get_updated_fields(model_object, model)
+        return model, {"updated": updates, "errored": [], "error": None}
+
+    def _validate_changed_items(self, state_value: Any, model_object: BaseModel) -> Optional[BaseModel]:
+        """Validate a state value holding Python objects, validating only the items of lists of models that differ.
+
+        The items equal to the current ones are kept. Returns None if the model has no lists of models or if the
+        validation fails, then the whole value is validated again to report the errors.
+        """
+        if not isinstance(state_value, dict):
+            return None
+        model_class = type(model_object)
+        data = dict(self.serializer.load(state_value))
+        lists = {}
+        for name, field_info in model_class.model_fields.items():
+            item_type = get_list_item_type(field_info.annotation)
+            items = getattr(model_object, name, None)
+            if item_type and isinstance(items, list) and isinstance(data.get(name), list):
+                lists[name] = (item_type, items)
+        if not lists:
+            return None
+        try:
+            for name, (item_type, items) in lists.items():
+                data[name] = validate_list_items(item_type, items, data[name])
+            return model_class.model_validate(data, context=DETACHED_CONTEXT)
+        except ValidationError:
+            return None
+
+    def _validate_columnar_model(self, data: Dict[str, Any], model_object: BaseModel) -> _ValidationResult:
+        """Validate data holding columnar values, same as _validate_model.
+
+        Only the rows changed in the columns are validated, the other items are kept.
+        """
+        column_updates: List[str] = []
+        errors: List[str] = []
+        error: Any = None
+        for field, item_type in self.columnar.items():
+            items = getattr(model_object, field) or []
+            current = models_to_columns(items, list(item_type.model_fields))
+            data[field], updates, row_errors, row_error = update_rows_from_columns(
+                items, item_type, current, data[field], field
+            )
+            column_updates += updates
+            errors += row_errors
+            error = row_error or error
+        try:
+            # unchanged items are model instances, which are not validated again
+            model = type(model_object).model_validate(data, context=DETACHED_CONTEXT)
+        except ValidationError as e:
+            errors += get_errored_fields_from_validation_error(e)
+            error = e
+        if errors:
+            return None, {"updated": [], "errored": errors, "error": error}
+        with instrumentation.span(instrumentation.DIFF, self.name):
+            updates = get_updated_fields(model_object, model, exclude=self.columnar) + column_updates
+        if not updates:
+            return None, None
+        return model, {"updated": updates, "errored": [], "error": None}
+
+    async def _on_shards_update(self, **_kwargs: Any) -> None:
+        with instrumentation.span(instrumentation.VIEW_UPDATE, self.name) as update_span:
+            results = await self._receive_shards()
+            if results is None:
+                update_span.discard()  # the View has not changed anything
+        if results:
+            await self._handle_callback(results)
+
+    async def _receive_shards(self) -> Optional[Dict[str, Any]]:
+        name = cast(str, self.state_variable_name)
+        # read the current values, the listener might run after the state has been changed again
+        parts = {key: self.serializer.load(self.state[key]) for key in [name, *map(self._get_shard_name, self.shards)]}
+        received = {
+            key: value
+            for key, value in parts.items()
+            if key not in self._sent or not self._values_equal(key, self._sent[key], value)
+        }
+        if not received:
+            return None  # nothing new, e.g. the listener was triggered by update_in_view
+        if instrumentation.enabled:
+            for key in received:
+                instrumentation.emit(instrumentation.VIEW_INPUT, self.name, fields=[key], value=self.state[key])
+        # the state now holds the values sent by the View, copy them since the View can modify them in place
+        self._sent.update(deepcopy_sharing_ndarrays(received))
+        self._from_view.update(received)
+        self.communicator._view_changed()
+        data = dict(parts[name] or {})
+        for field in self.shards:
+            data[field] = parts[self._get_shard_name(field)]
+        if self.columnar:
+            return await self._update_model(partial(self._validate_columnar_model, data))
+        return await self._update_model(partial(self._validate_model, self.serializer.dump(data)))
+
+    def _receive(self, name_in_state: str, state_value: Any) -> None:
+        # remember the value sent by the View to avoid sending it back
+        self._sent[name_in_state] = deepcopy_sharing_ndarrays(state_value)
+        self._from_view.add(name_in_state)
+        self.communicator._view_changed()
+
+    def _dump(self, value: Any) -> Any:
+        with instrumentation.span(instrumentation.SERIALIZE, self.name):
+            if issubclass(type(value), BaseModel):
+                return self.serializer.dump_model(value)
+            if isinstance(value, ViewWindow):
+                return self.serializer.dump(value.to_view())
+            return self.serializer.dump(value)
+
+    def _serialize(self, values: Dict[str, Any]) -> Dict[str, Any]:
+        with instrumentation.span(instrumentation.SERIALIZE, self.name):
+            return {name: self.serializer.dump(value) for name, value in values.items()}
 
     def _get_name_in_state(self, attribute_name: str) -> str:
         name_in_state = normalize_field_name(attribute_name)
@@ -184,11 +679,16 @@ class StateConnection:
         state_variable_name = self.state_variable_name
         # we need to make sure state variable exists on connect since if it does not - Trame will not monitor it
         if state_variable_name:
-            if self.viewmodel_linked_object:
-                if issubclass(type(self.viewmodel_linked_object), BaseModel):
-                    self.state.setdefault(state_variable_name, self.viewmodel_linked_object.model_dump())
-                elif isinstance(self.viewmodel_linked_object, dict):
-                    self.state.setdefault(state_variable_name, self.viewmodel_linked_object)
+            if self.shards:
+                for name, value in self._split_shards(cast(BaseModel, self.viewmodel_linked_object)).items():
+                    self.state.setdefault(name, self.serializer.dump(value))
+            elif self.viewmodel_linked_object:
+                if (
+                    issubclass(type(self.viewmodel_linked_object), BaseModel)
+                    or isinstance(self.viewmodel_linked_object, dict)
+                    or isinstance(self.viewmodel_linked_object, ViewWindow)
+                ):
+                    self.state.setdefault(state_variable_name, self._dump(self.viewmodel_linked_object))
                 else:
                     self.state.setdefault(state_variable_name, None)
             else:
@@ -202,61 +702,155 @@ class StateConnection:
             if self.linked_object_attributes:
                 for attribute_name in self.linked_object_attributes:
                     name_in_state = self._get_name_in_state(attribute_name)
-                    f = self._on_state_update(attribute_name, name_in_state)
-                    self.state.change(name_in_state)(f)
+                    self._watch(self._on_state_update(attribute_name, name_in_state), name_in_state)
+            elif state_variable_name and self.shards:
+                shard_names = [self._get_shard_name(field) for field in self.shards]
+                self._watch(self._on_shards_update, state_variable_name, *shard_names)
             elif state_variable_name:
 
-                @self.state.change(state_variable_name)
                 async def update_viewmodel_callback(**kwargs: dict) -> None:
                     updates: list[str] = []
                     errors: list[str] = []
                     error: Any = None
                     updated = True
-                    if self.viewmodel_linked_object and issubclass(type(self.viewmodel_linked_object), BaseModel):
-                        json_str = json.dumps(kwargs[state_variable_name])
-                        try:
-                            model = self.viewmodel_linked_object.model_validate_json(json_str)
-                            if model != self.viewmodel_linked_object:
-                                updates = get_updated_fields(self.viewmodel_linked_object, model)
-                                for field, value in model:
-                                    setattr(self.viewmodel_linked_object, field, value)
+                    with instrumentation.span(instrumentation.VIEW_UPDATE, self.name) as update_span:
+                        self._receive(state_variable_name, kwargs[state_variable_name])
+                        if self.viewmodel_linked_object and issubclass(type(self.viewmodel_linked_object), BaseModel):
+                            results = await self._update_model(
+                                partial(self._validate_model, kwargs[state_variable_name])
+                            )
+                            if results:
+                                updates, errors, error = results["updated"], results["errored"], results["error"]
+                            else:
+                                updated = False
+                        elif isinstance(self.viewmodel_linked_object, dict):
+                            self.viewmodel_linked_object.update(self.serializer.load(kwargs[state_variable_name]))
+                            updates.append(state_variable_name)
+                        elif is_callable(self.viewmodel_linked_object):
+                            cast(Callable, self.viewmodel_linked_object)(
+                                self.serializer.load(kwargs[state_variable_name])
+                            )
+                            updates.append(state_variable_name)
+                        elif isinstance(self.viewmodel_linked_object, ViewWindow):
+                            # the View requests another part, e.g. visible range on zoom or page
+                            window = self.viewmodel_linked_object
+                            if window.request_view(self.serializer.load(kwargs[state_variable_name])):
+                                self._update_window_in_view(window)
+                                updates.append(state_variable_name)
                             else:
                                 updated = False
-                        except ValidationError as e:
-                            errors = get_errored_fields_from_validation_error(e)
-                            error = e
-                            updated = True
-                    elif isinstance(self.viewmodel_linked_object, dict):
-                        self.viewmodel_linked_object.update(kwargs[state_variable_name])
-                        updates.append(state_variable_name)
-                    elif is_callable(self.viewmodel_linked_object):
-                        cast(Callable, self.viewmodel_linked_object)(kwargs[state_variable_name])
-                        updates.append(state_variable_name)
-                    else:
-                        raise Exception("cannot update", self.viewmodel_linked_object)
+                        else:
+                            raise Exception("cannot update", self.viewmodel_linked_object)
+                        if updated:
+                            instrumentation.emit(
+                                instrumentation.VIEW_INPUT,
+                                self.name,
+                                fields=[state_variable_name],
+                                value=kwargs[state_variable_name],
+                            )
+                        else:
+                            update_span.discard()  # e.g. the listener was triggered by update_in_view
                     if updated:
                         await self._handle_callback({"updated": updates, "errored": errors, "error": error})
 
+                self._watch(update_viewmodel_callback, state_variable_name)
+
+    def _update_attributes_in_view(self, value: Any, fields: Optional[List[str]] = None) -> None:
+        values = {}
+        for index, attribute_name in enumerate(cast(List[str], self.linked_object_attributes)):
+            if fields is not None and not is_path_affected(attribute_name, fields):
+                continue
+            value_to_change = rgetattr(value, attribute_name)
+            last_sent = self._attributes_sent[index]
+            if last_sent is not _NOT_SENT and state_values_equal(last_sent, value_to_change):
+                self._suppress_echoes([self._attribute_names[index]])
+                continue
+            self._attributes_sent[index] = snapshot_value(value_to_change)
+            values[self._attribute_names[index]] = value_to_change
+        self._set_variables_in_state(self._serialize(values))
+
+    def _update_window_in_view(self, window: ViewWindow) -> None:
+        name_in_state = cast(str, self.state_variable_name)
+        view = window.to_view()
+        if name_in_state in self._sent and state_values_equal(self._sent[name_in_state], view):
+            return  # the part shown in the View has not changed
+        self._sent[name_in_state] = snapshot_value(view)
+        self._set_variable_in_state(name_in_state, self._dump(view))
+
+    def _update_variable_in_view(self, name_in_state: str, value: Any) -> None:
+        if name_in_state in self._from_view and state_values_equal(self._sent[name_in_state], value):
+            self._suppress_echoes([name_in_state])
+            return
+        self._set_variable_in_state(name_in_state, value)
+
     def update_in_view(self, value: Any) -> None:
-        if issubclass(type(value), BaseModel):
-            value = value.model_dump()
+        with instrumentation.span(instrumentation.MODEL_UPDATE, self.name):
+            self._update_in_view(value)
+
+    def _update_in_view(self, value: Any) -> None:
+        if self.linked_object_attributes:
+            self._update_attributes_in_view(value)
+        elif self.shards:
+            self._update_shards_in_view(value)
+        elif self.state_variable_name and isinstance(value, ViewWindow):
+            value.refresh()
+            self._update_window_in_view(value)
+        elif self.state_variable_name:
+            self._update_variable_in_view(self.state_variable_name, self._dump(value))
+
+    def update_fields_in_view(self, value: Any, fields: List[str]) -> None:
+        with instrumentation.span(instrumentation.MODEL_UPDATE, self.name, fields):
+            self._update_fields_in_view(value, fields)
+
+    def _update_fields_in_view(self, value: Any, fields: List[str]) -> None:
         if self.linked_object_attributes:
-            for attribute_name in self.linked_object_attributes:
-                name_in_state = self._get_name_in_state(attribute_name)
-                value_to_change = rgetattr(value, attribute_name)
-                self._set_variable_in_state(name_in_state, value_to_change)
+            self._update_attributes_in_view(value, fields)
+        elif self.shards:
+            self._update_shards_in_view(value, fields)
         elif self.state_variable_name:
-            self._set_variable_in_state(self.state_variable_name, value)
+            self._update_variable_in_view(self.state_variable_name, self._dump(value))
 
     def get_callback(self) -> ConnectCallbackType:
         return None
 
 
 class TrameBinding(BindingInterface):
-    """Binding Interface implementation for Trame."""
+    """Binding Interface implementation for Trame.
+
+    Parameters
+    ----------
+    state : State
+        Trame state used by the bindings.
+    serializer : StateSerializer, optional
+        Defines how values are stored in the state (see :mod:`nova.mvvm.trame_binding.serializers`).
+        By default, values are stored as Python objects and encoded by Trame.
+    validate_in_thread : bool
+        Validate the values of bound Pydantic models received from the View in a thread pool instead of the event
+        loop, so that expensive validation does not block other clients. The model is updated on the event loop,
+        results of values superseded by a newer value from the View are discarded.
+    callback_policy : str
+        How ``callback_after_update`` is called when the View changes values faster than the callback runs:
+        ``serial`` (default), ``concurrent`` or ``latest`` (see
+        :class:`nova.mvvm.trame_binding.callback_scheduler.CallbackScheduler`). Can be set per binding in ``new_bind``.
+    max_pending_callbacks : int, optional
+        Maximum number of results queued with the ``serial`` policy.
+    """
 
-    def __init__(self, state: State) -> None:
+    def __init__(
+        self,
+        state: State,
+        serializer: Optional[StateSerializer] = None,
+        validate_in_thread: bool = False,
+        callback_policy: CallbackPolicy = "serial",
+        max_pending_callbacks: Optional[int] = None,
+    ) -> None:
         self._state = state
+        self._serializer = serializer or DefaultSerializer()
+        self._callback_policy = callback_policy
+        self._max_pending_callbacks = max_pending_callbacks
+        self._validation_executor = (
+            ThreadPoolExecutor(thread_name_prefix="nova-mvvm-validation") if validate_in_thread else None
+        )
 
     @override
     def new_bind(
@@ -264,8 +858,20 @@ class TrameBinding(BindingInterface):
         linked_object: LinkedObjectType = None,
         linked_object_arguments: LinkedObjectAttributesType = None,
         callback_after_update: CallbackAfterUpdateType = None,
+        callback_policy: Optional[CallbackPolicy] = None,
+        max_pending_callbacks: Optional[int] = None,
     ) -> TrameCommunicator:
-        return TrameCommunicator(self._state, linked_object, linked_object_arguments, callback_after_update)
+        """Create a binding, the callback policy of the TrameBinding can be overridden for this binding."""
+        return TrameCommunicator(
+            self._state,
+            linked_object,
+            linked_object_arguments,
+            callback_after_update,
+            self._serializer,
+            self._validation_executor,
+            callback_policy or self._callback_policy,
+            max_pending_callbacks if max_pending_callbacks is not None else self._max_pending_callbacks,
+        )
 
     @override
     def new_worker(self, task: Callable[..., Any], *args: Any, **kwargs: Any) -> Worker:
@@ -0,0 +1,120 @@
+"""Scheduling of callback_after_update calls for Trame bindings."""
+
+import asyncio
+import inspect
+import logging
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Literal, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+CallbackPolicy = Literal["serial", "concurrent", "latest"]
+
+
+def merge_results(older: Dict[str, Any], newer: Dict[str, Any]) -> Dict[str, Any]:
+    """Merge the results of an update that will not be processed into the results of the next update.
+
+    The updated fields of both are kept, errors are taken from the newer results since they replace the older ones.
+    """
+    updated = list(dict.fromkeys([*older.get("updated", []), *newer.get("updated", [])]))
+    return {**newer, "updated": updated}
+
+
+class CallbackScheduler:
+    """Calls callback_after_update with the results of the updates made by the View, according to a policy.
+
+    - ``serial``: one call at a time, in order. Results received while a call is running are queued; with
+      ``max_pending``, new results are merged into the last queued ones when the queue is full. Exceptions
+      raised by the callback propagate to the state change handler, as without scheduling; the results still
+      queued are then processed with the next results.
+    - ``concurrent``: a call is started for every results, without waiting for the previous calls.
+    - ``latest``: a new call cancels the call in progress (only coroutines can be cancelled), the updated fields
+      of the cancelled call are merged into the results of the new call.
+
+    With ``concurrent`` and ``latest`` the calls run in background tasks, their exceptions are logged.
+
+    Parameters
+    ----------
+    callback : Callable, optional
+        Function or coroutine function called with the results.
+    policy : str
+        One of ``serial``, ``concurrent`` or ``latest``.
+    max_pending : int, optional
+        Maximum number of queued results for the ``serial`` policy, unlimited if not provided.
+    """
+
+    def __init__(
+        self, callback: Optional[Callable], policy: CallbackPolicy = "serial", max_pending: Optional[int] = None
+    ) -> None:
+        if policy not in ("serial", "concurrent", "latest"):
+            raise ValueError(f"unknown callback policy {policy}")
+        if max_pending is not None and max_pending < 1:
+            raise ValueError("max_pending must be positive")
+        self.callback = callback
+        self.policy = policy
+        self.max_pending = max_pending
+        self._pending: Deque[Dict[str, Any]] = deque()
+        self._running = False
+        self._tasks: Set[asyncio.Future] = set()
+        self._latest: Optional[asyncio.Future] = None
+        self._latest_results: Optional[Dict[str, Any]] = None
+        # tasks cancelled by the latest policy because newer results have arrived
+        self._superseded: Set[asyncio.Future] = set()
+
+    async def submit(self, results: Dict[str, Any]) -> None:
+        """Schedule a call with the given results, waits for the call only with the ``serial`` policy."""
+        if not self.callback:
+            return
+        if self.policy == "concurrent":
+            self._start(results)
+        elif self.policy == "latest":
+            if self._latest is not None and not self._latest.done():
+                self._superseded.add(self._latest)
+                self._latest.cancel()
+                results = merge_results(self._latest_results or {}, results)
+            self._latest_results = results
+            self._latest = self._start(results)
+        else:
+            await self._run_serial(results)
+
+    async def _run_serial(self, results: Dict[str, Any]) -> None:
+        if self.max_pending is not None and len(self._pending) == self.max_pending:
+            results = merge_results(self._pending.pop(), results)
+        self._pending.append(results)
+        if self._running:
+            return  # the call in progress processes the queue
+        self._running = True
+        try:
+            while self._pending:
+                await self._call_callback(self._pending.popleft())
+        finally:
+            self._running = False
+
+    def _start(self, results: Dict[str, Any]) -> asyncio.Future:
+        task = asyncio.ensure_future(self._call(results))
+        # keep a reference until the task is done, the event loop only keeps weak references
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        task.add_done_callback(self._superseded.discard)
+        return task
+
+    async def _call(self, results: Dict[str, Any]) -> None:
+        try:
+            await self._call_callback(results)
+        except asyncio.CancelledError:
+            if asyncio.current_task() not in self._superseded:
+                raise  # e.g. the server is shutting down
+        except Exception:
+            logger.exception("callback_after_update failed")
+
+    async def _call_callback(self, results: Dict[str, Any]) -> None:
+        callback = self.callback
+        if inspect.iscoroutinefunction(callback):
+            await callback(results)
+        elif callback:
+            callback(results)
+
+    @property
+    def pending(self) -> int:
+        """Number of results waiting for a call (``serial``) or calls in progress (other policies)."""
+        return len(self._pending) if self.policy == "serial" else len(self._tasks)
@@ -0,0 +1,133 @@
+"""Serializers converting values between the ViewModel and Trame state."""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Type, TypeVar
+
+from pydantic import BaseModel
+
+from .._internal.ndarray_utils import (
+    contains_encoded_ndarrays,
+    decode_ndarray,
+    decode_ndarrays,
+    encode_ndarray,
+    encode_ndarrays,
+    is_encoded_ndarray,
+    is_ndarray,
+)
+
+ModelType = TypeVar("ModelType", bound=BaseModel)
+
+
+class StateSerializer(ABC):
+    """Abstract serializer class.
+
+    Defines how values are stored in Trame state when sent to the View and how
+    state values are converted back when the View updates them.
+    """
+
+    @abstractmethod
+    def dump(self, value: Any) -> Any:
+        """Convert a Python value to its representation in the state."""
+        raise NotImplementedError("dump() must be implemented in a subclass")
+
+    @abstractmethod
+    def load(self, value: Any) -> Any:
+        """Convert a state value back to a Python value."""
+        raise NotImplementedError("load() must be implemented in a subclass")
+
+    def dump_model(self, model: BaseModel) -> Any:
+        """Convert a Pydantic model to its representation in the state."""
+        return self.dump(model.model_dump())
+
+    def validate_model(self, model_class: Type[ModelType], value: Any) -> ModelType:
+        """Create a validated Pydantic model from a state value.
+
+        Raises
+        ------
+        ValidationError
+            If the value does not pass model validation.
+        """
+        return model_class.model_validate(self.load(value))
+
+
+class DefaultSerializer(StateSerializer):
+    """Stores plain Python values in the state and lets Trame encode them.
+
+    NumPy arrays are stored as typed arrays. Models are validated from JSON, as if they were sent by a web client.
+    """
+
+    def dump(self, value: Any) -> Any:
+        return encode_ndarrays(value)
+
+    def load(self, value: Any) -> Any:
+        return decode_ndarrays(value)
+
+    def validate_model(self, model_class: Type[ModelType], value: Any) -> ModelType:
+        if contains_encoded_ndarrays(value):
+            # typed arrays cannot go through JSON, validate them directly
+            return model_class.model_validate(decode_ndarrays(value))
+        return model_class.model_validate_json(json.dumps(value))
+
+
+class OrjsonSerializer(StateSerializer):
+    """Stores values in the state as JSON strings encoded with orjson.
+
+    Models are encoded with ``model_dump_json`` and validated with ``model_validate_json``, so
+    no intermediate Python objects are created. The View has to parse the strings (``JSON.parse``).
+    Requires orjson to be installed (``pip install nova-mvvm[orjson]``).
+    """
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def dump(self, value: Any) -> Any:
+        return self._orjson.dumps(value, option=self._orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def load(self, value: Any) -> Any:
+        if isinstance(value, (str, bytes)):
+            return self._orjson.loads(value)
+        return value
+
+    def dump_model(self, model: BaseModel) -> Any:
+        return model.model_dump_json()
+
+    def validate_model(self, model_class: Type[ModelType], value: Any) -> ModelType:
+        if isinstance(value, (str, bytes)):
+            return model_class.model_validate_json(value)
+        return model_class.model_validate(value)
+
+
+def _msgpack_default(value: Any) -> Any:
+    if is_ndarray(value):
+        return encode_ndarray(value)
+    raise TypeError(f"Cannot serialize {type(value)}")
+
+
+def _msgpack_object_hook(value: dict) -> Any:
+    if is_encoded_ndarray(value):
+        return decode_ndarray(value)
+    return value
+
+
+class MsgpackSerializer(StateSerializer):
+    """Stores values in the state as MessagePack binary data.
+
+    NumPy arrays are packed as typed arrays (raw buffer with dtype and shape), which the View can
+    read without parsing. Requires msgpack to be installed (``pip install nova-mvvm[msgpack]``).
+    """
+
+    def __init__(self) -> None:
+        import msgpack
+
+        self._msgpack = msgpack
+
+    def dump(self, value: Any) -> Any:
+        return self._msgpack.packb(value, default=_msgpack_default)
+
+    def load(self, value: Any) -> Any:
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return self._msgpack.unpackb(value, object_hook=_msgpack_object_hook)
+        return value
@@ -4,11 +4,14 @@ import asyncio
 import inspect
 import sys
 import threading
+import time
 import traceback
 from typing import Any, Awaitable, Callable, Optional, Tuple, Union
 
 from typing_extensions import override
 
+from nova.mvvm._internal import instrumentation
+from nova.mvvm._internal.progress import ProgressThrottle
 from nova.mvvm.interface import Worker
 
 ProgressCallback = Union[Callable[[str, int], None], Callable[[str, int], Awaitable[None]]]
@@ -30,6 +33,9 @@ class TrameWorker(Worker):
         self.args = args
         self.kwargs = kwargs
         self.kwargs["progress"] = self.set_progress
+        self.progress_throttle = ProgressThrottle()
+        self._queued_at = 0.0
+        self._name = instrumentation.binding_name(task)
 
         # State to be monitored
         self._progress_message: Optional[str] = None
@@ -50,13 +56,18 @@ class TrameWorker(Worker):
         self._thread = threading.Thread(target=self._run_task)
 
     def set_progress(self, message: str, value: int) -> None:
+        if self.progress_throttle.report(message, value):
+            self._store_progress(message, value)
+
+    def _store_progress(self, message: str, value: int) -> None:
         with self._progress_lock:
             self._progress_message = message
             self._progress_value = value
 
     def _run_task(self) -> None:
         try:
-            result = self.task(*self.args, **self.kwargs)
+            with instrumentation.run_span(self._name, self._queued_at):
+                result = self.task(*self.args, **self.kwargs)
         except Exception:
             traceback.print_exc()
             exctype, value = sys.exc_info()[:2]
@@ -64,24 +75,40 @@ class TrameWorker(Worker):
         else:
             self._result = result
         finally:
+            pending = self.progress_throttle.flush()
+            if pending is not None:
+                self._store_progress(*pending)
             self._done.set()
 
     async def _monitor_loop(self) -> None:
         last_progress: Tuple[Optional[str], Optional[int]] = (None, None)
 
-        while not self._done.is_set():
+        done = False
+        while not done:
             await asyncio.sleep(0.1)
+            # progress set after the last check is delivered before the result
+            done = self._done.is_set()
+            due = self.progress_throttle.due()  # skipped because it came too early, the interval has elapsed
+            if due is not None:
+                self._store_progress(*due)
             with self._progress_lock:
-                if (self._progress_message, self._progress_value) != last_progress:
-                    last_progress = (self._progress_message, self._progress_value)
-                    await self._call_callback(self._on_progress, *last_progress)
+                progress = (self._progress_message, self._progress_value)
+            if progress != last_progress:
+                last_progress = progress
+                instrumentation.emit(
+                    instrumentation.WORKER_PROGRESS, self._name, fields=[str(progress[0])], value=progress[1]
+                )
+                await self._call_callback(self._on_progress, *last_progress)
 
         # After done
         if self._error:
+            instrumentation.emit(instrumentation.WORKER_ERROR, self._name, value=self._error[1])
             await self._call_callback(self._on_error, *self._error)
         else:
+            instrumentation.emit(instrumentation.WORKER_RESULT, self._name)
             await self._call_callback(self._on_result, self._result)
 
+        instrumentation.emit(instrumentation.WORKER_FINISHED, self._name)
         await self._call_callback(self._on_finished)
 
     async def _call_callback(self, callback: Optional[Callable], *args: Any) -> None:
@@ -113,6 +140,8 @@ class TrameWorker(Worker):
 
     @override
     def start(self) -> None:
+        self._queued_at = time.perf_counter()
+        instrumentation.emit(instrumentation.WORKER_START, self._name)
         self._thread.start()
         if is_async():
             asyncio.create_task(self._monitor_loop())
@@ -1,9 +1,13 @@
 """The package contains Pydantic models uses for tests."""
 
-from typing import Any, List, Optional
+import time
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from nova.mvvm.interface import BindingInterface
+from nova.mvvm.pydantic_utils import ObservableModel
+
 
 class Range(BaseModel):
     """A Pydantic model for range with a model validation rule."""
@@ -20,6 +24,25 @@ class Range(BaseModel):
         return self
 
 
+class Bounds(BaseModel):
+    """A Pydantic model for bounds normalized by a model validator."""
+
+    lo: int = Field(default=0)
+    hi: int = Field(default=10)
+
+    @model_validator(mode="after")
+    def normalize(self) -> "Bounds":
+        if self.hi < self.lo:
+            self.hi = self.lo
+        return self
+
+
+class BoundsList(BaseModel):
+    """A Pydantic model with a list of normalized bounds."""
+
+    bounds: List[Bounds] = Field(default_factory=lambda: [Bounds(), Bounds()])
+
+
 class User(BaseModel):
     """User model for tests."""
 
@@ -49,3 +72,63 @@ class User(BaseModel):
         except Exception:
             raise ValueError("Please input comma-separated list of integers") from None
         return v
+
+
+class ObservableRange(ObservableModel):
+    """Observable range model for tests."""
+
+    min_value: int = Field(default=0, title="Min Val")
+    max_value: int = Field(default=10, title="Max Val")
+
+
+class ObservableUser(ObservableModel):
+    """Observable user model for tests."""
+
+    username: str = Field(default="default_user", min_length=2, title="User Name")
+    age: int = Field(default=30, gt=20)
+    ranges: List[ObservableRange] = Field(
+        default_factory=lambda: [ObservableRange(min_value=0, max_value=1), ObservableRange(min_value=2, max_value=3)]
+    )
+
+
+class ObservableGroup(ObservableModel):
+    """Observable model with a list of observable models for tests."""
+
+    items: List[ObservableRange] = Field(default_factory=lambda: [ObservableRange()])
+
+
+class ObservableProject(ObservableModel):
+    """Observable model nested two levels deep for tests."""
+
+    group: ObservableGroup = Field(default_factory=ObservableGroup)
+
+
+class SlowModel(BaseModel):
+    """Model with an expensive validator for tests."""
+
+    value: int = Field(default=0)
+
+    @field_validator("value")
+    @classmethod
+    def validate_slowly(cls, v: int) -> int:
+        time.sleep(0.2)
+        return v
+
+
+class SlowForm(BaseModel):
+    """Model with a slowly validated sub-model and another field for tests."""
+
+    slow: SlowModel = Field(default_factory=SlowModel)
+    other: int = Field(default=0)
+
+
+class ViewModel:
+    """ViewModel owning a bound model, its callback keeps a reference to it as in applications."""
+
+    def __init__(self, binding: BindingInterface, model: Any) -> None:
+        self.model = model
+        self.updates: List[Dict[str, Any]] = []
+        self.binding = binding.new_bind(model, callback_after_update=self.on_update)
+
+    def on_update(self, results: Dict[str, Any]) -> None:
+        self.updates.append(results)
@@ -0,0 +1,13 @@
+"""Pydantic models with NumPy arrays used for tests, requires NumPy to be installed."""
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from nova.mvvm.ndarray_utils import NDArray
+
+
+class Spectrum(BaseModel):
+    """Model with a NumPy array for tests."""
+
+    name: str = Field(default="spectrum")
+    counts: NDArray = Field(default_factory=lambda: np.arange(10, dtype=np.float64))
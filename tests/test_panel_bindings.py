@@ -0,0 +1,196 @@
+"""Test package."""
+
+import gc
+import threading
+import weakref
+from typing import Any, List
+
+import panel as pn
+
+from nova.mvvm.interface import Worker
+from nova.mvvm.panel_binding import PanelBinding
+
+from .model import ObservableUser, ViewModel
+
+
+def task(value: int, progress: Any) -> int:
+    progress("half", 50)
+    return value * 2
+
+
+def test_panel_worker() -> None:
+    # Runs a task in the shared executor and reports progress, result and finish.
+    events: List[Any] = []
+    finished = threading.Event()
+
+    worker = PanelBinding().new_worker(task, 21)
+    worker.connect_progress(lambda message, value: events.append((message, value)))
+    worker.connect_result(events.append)
+    worker.connect_finished(finished.set)
+    worker.start()
+
+    assert finished.wait(timeout=2)
+    assert events == [("half", 50), 42]
+
+
+def busy_task(progress: Any) -> None:
+    for i in range(1000):
+        progress("step", i // 10)
+
+
+def test_panel_worker_progress_throttle() -> None:
+    # Progress is coalesced with the configured interval and delta, the final value is delivered before finishing.
+    events: List[Any] = []
+    finished = threading.Event()
+
+    worker = PanelBinding().new_worker(busy_task)
+    worker.throttle_progress(min_interval=60, min_delta=10)
+    worker.connect_progress(lambda message, value: events.append((message, value)))
+    worker.connect_finished(finished.set)
+    worker.start()
+
+    assert finished.wait(timeout=2)
+    assert events == [("step", 0), ("step", 99)]
+
+
+def test_panel_worker_progress_trailing() -> None:
+    # A report skipped because it came too early is delivered once the interval has elapsed, not at the end.
+    events: List[Any] = []
+    delivered = threading.Event()
+    finished = threading.Event()
+
+    def task(progress: Any) -> bool:
+        progress("step", 10)
+        progress("step", 20)
+        return delivered.wait(timeout=2)
+
+    def on_progress(message: str, value: int) -> None:
+        events.append((message, value))
+        if value == 20:
+            delivered.set()
+
+    worker = PanelBinding().new_worker(task)
+    worker.throttle_progress(min_interval=0.1)
+    worker.connect_progress(on_progress)
+    worker.connect_result(events.append)
+    worker.connect_finished(finished.set)
+    worker.start()
+
+    assert finished.wait(timeout=3)
+    assert events == [("step", 10), ("step", 20), True]
+
+
+class Settings:
+    """Plain object for tests."""
+
+    def __init__(self) -> None:
+        self.title = "plot"
+        self.scale = 1
+
+
+def test_worker_throttle_progress_subclass() -> None:
+    # Workers that do not create a throttle themselves can still set the limits.
+    class MinimalWorker(Worker):
+        def start(self) -> None:
+            pass
+
+        def connect_result(self, callback: Any) -> None:
+            pass
+
+        def connect_error(self, callback: Any) -> None:
+            pass
+
+        def connect_finished(self, callback: Any) -> None:
+            pass
+
+        def connect_progress(self, callback: Any) -> None:
+            pass
+
+    worker = MinimalWorker()
+    worker.throttle_progress(min_interval=60, min_delta=10)
+    assert worker.progress_throttle.deliver is None
+
+
+def test_panel_binding_batched_updates() -> None:
+    # The View is updated once per widget and only with changed values, the binding ignores its own changes.
+    test_object = Settings()
+    keys: List[Any] = []
+    binding = PanelBinding(batch_callbacks=True).new_bind(test_object, callback_after_update=keys.append)
+    title = pn.widgets.TextInput(value="plot")
+    scale = pn.widgets.IntInput(value=1)
+    binding.connect({"title": (title, "value"), "scale": (scale, "value")})
+    events: List[Any] = []
+    scale.param.watch(events.append, "value")
+
+    title.value = "new"
+    assert test_object.title == "new"
+    assert keys == [["title"]]
+
+    test_object.scale = 2
+    binding.update_in_view(test_object)
+    assert scale.value == 2
+    assert len(events) == 1
+    assert keys == [["title"]]
+    assert binding.suppressed_echoes == 1  # title
+
+
+def test_panel_binding_observable_model_version() -> None:
+    # update_in_view is skipped while the version of the model does not change.
+    test_object = ObservableUser()
+    binding = PanelBinding().new_bind(test_object)
+    username = pn.widgets.TextInput(value="")
+    age = pn.widgets.IntInput(value=0)
+    binding.connect({"username": (username, "value"), "age": (age, "value")})
+    binding.update_in_view(test_object)
+    assert age.value == 30
+
+    test_object.__dict__["age"] = 40  # not recorded, so the model is not compared
+    binding.update_in_view(test_object)
+    assert age.value == 30
+
+    test_object.username = "test"
+    binding.update_in_view(test_object)
+    assert username.value == "test"
+    assert age.value == 40
+
+    # a value received from the View invalidates the version
+    age.value = 50
+    assert test_object.age == 50
+    test_object.__dict__["age"] = 60
+    binding.update_in_view(test_object)
+    assert age.value == 60
+
+
+def test_panel_binding_callback_keys() -> None:
+    # callback_after_update receives each changed key as a string, or lists of keys with batch_callbacks.
+    for batch_callbacks, expected in ((False, ["title", "scale", "title"]), (True, [["title", "scale"], ["title"]])):
+        test_object = Settings()
+        keys: List[Any] = []
+        binding = PanelBinding(batch_callbacks=batch_callbacks).new_bind(test_object, callback_after_update=keys.append)
+        widget = pn.widgets.TextInput(value="plot")
+        callback = binding.connect({"title": (widget, "value"), "scale": (widget, "width")})
+        widget.param.update(value="new", width=200)
+        binding.get_callback()(key="title", value="direct")
+        assert test_object.title == "direct"
+        assert test_object.scale == 200
+        assert keys == expected
+        assert callback is None
+
+
+def test_panel_binding_disconnect() -> None:
+    # A disposed ViewModel is garbage collected once its binding is disconnected, even if the widgets are kept.
+    view_model = ViewModel(PanelBinding(), Settings())
+    title = pn.widgets.TextInput(value="plot")
+    view_model.binding.connect({"title": (title, "value")})
+    reference = weakref.ref(view_model)
+
+    view_model.binding.disconnect()
+    title.value = "new"
+    assert view_model.model.title == "plot"
+    view_model.model.title = "changed"
+    view_model.binding.update_in_view(view_model.model)
+    assert title.value == "new"
+
+    del view_model
+    gc.collect()
+    assert reference() is None
@@ -0,0 +1,64 @@
+"""Test package."""
+
+import multiprocessing
+import pickle
+from multiprocessing import shared_memory
+from typing import Any, Dict, NamedTuple
+
+import pytest
+
+pytest.importorskip("numpy")  # process_utils requires the numpy extra
+
+import numpy as np  # noqa: E402
+
+from nova.mvvm.process_utils import SharedArray, get_process_executor, run_in_process  # noqa: E402
+
+
+class Peak(NamedTuple):
+    """Named tuple holding an array for tests."""
+
+    position: int
+    profile: np.ndarray
+
+
+def reduce_run(size: int) -> Dict[str, Any]:
+    return {
+        "image": np.arange(size, dtype=np.float32).reshape(-1, 100),
+        "counts": (np.ones(3, dtype=int),),
+        "peak": Peak(5, np.zeros(4)),
+        "run": 42,
+    }
+
+
+def test_shared_array_pickle() -> None:
+    # A pickled shared array maps the same memory, the block is removed on release.
+    shared = SharedArray.from_array(np.arange(10))
+    received = pickle.loads(pickle.dumps(shared))
+    received.array[0] = 100
+    assert shared.array[0] == 100
+
+    array = received.take()
+    assert list(array[:3]) == [100, 1, 2]
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=shared.name)
+
+
+def test_run_in_process() -> None:
+    # Arrays in the result come back through shared memory, other values are pickled.
+    result = run_in_process(reduce_run, 1_000_000)
+    assert result["run"] == 42
+    assert result["image"].shape == (10_000, 100)
+    assert result["image"][-1, -1] == 999_999
+    assert isinstance(result["counts"], tuple)
+    assert list(result["counts"][0]) == [1, 1, 1]
+    assert isinstance(result["peak"], Peak)
+    assert result["peak"].position == 5
+    assert list(result["peak"].profile) == [0, 0, 0, 0]
+
+
+def test_process_executor_start_method() -> None:
+    # The shared pool does not fork the process, which may have running threads.
+    context = get_process_executor()._mp_context
+    assert context is not None
+    expected = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    assert context.get_start_method() == expected
@@ -1,20 +1,37 @@
 """Test package."""
 
+import gc
 import time
+import tracemalloc
+import weakref
 from typing import Any, Callable, Dict, List, cast
 
 import pytest
+from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QLabel, QLineEdit, QMainWindow, QVBoxLayout, QWidget
 from pytestqt.qtbot import QtBot
 from typing_extensions import Generator
 
 from nova.mvvm import bindings_map
+from nova.mvvm._internal.pydantic_utils import DETACHED_CONTEXT
 from nova.mvvm._internal.pyqt_communicator import PyQtCommunicator
 from nova.mvvm.pydantic_utils import get_field_info
-from nova.mvvm.pyqt6_binding import PyQt6Binding
+from nova.mvvm.pyqt6_binding import PydanticTableModel, PyQt6Binding
 from nova.mvvm.pyqt6_binding.pyqt6_worker import PyQt6Worker
-
-from .model import User
+from nova.mvvm.replay import Recorder, load_recording, replay_pyqt, summarize
+
+from .model import (
+    Bounds,
+    BoundsList,
+    ObservableGroup,
+    ObservableProject,
+    ObservableRange,
+    ObservableUser,
+    Range,
+    SlowForm,
+    User,
+    ViewModel,
+)
 
 
 @pytest.fixture(scope="function")  # Default scope
@@ -139,6 +156,299 @@ def test_binding_same_object(function_scoped_fixture: str) -> None:
         binding.connect("test_object1", lambda: print("hello"))
 
 
+def test_pyqt_binding_ndarray(function_scoped_fixture: str) -> None:
+    # Arrays are passed to the View as read-only views of the same buffer and compared as a whole.
+    np = pytest.importorskip("numpy")
+    from .ndarray_model import Spectrum
+
+    test_object = Spectrum()
+    received: List[Any] = []
+    after_update_results: Dict[str, Any] = {}
+
+    binding = PyQt6Binding().new_bind(test_object, callback_after_update=after_update_results.update)
+    callback = binding.connect("spectrum", lambda value: received.append(value))
+
+    binding.update_in_view(test_object.counts)
+    assert np.shares_memory(received[0], test_object.counts)
+    assert not received[0].flags.writeable
+
+    # arrays in fields of the model are read-only views too, the model of the ViewModel is not modified
+    binding.update_in_view(test_object)
+    assert np.shares_memory(received[1].counts, test_object.counts)
+    assert not received[1].counts.flags.writeable
+    assert test_object.counts.flags.writeable
+
+    new_counts = np.ones(10)
+    callback("spectrum.counts", new_counts)  # type: ignore
+    assert after_update_results["updated"] == ["counts"]
+    assert test_object.counts is new_counts
+
+
+def test_pyqt_binding_echo_suppression(function_scoped_fixture: str) -> None:
+    # The model updated by the View is not sent back until it changes.
+    test_object = User()
+    received: List[Any] = []
+
+    def update(_results: Dict[str, Any]) -> None:
+        binding.update_in_view(test_object)
+
+    binding = PyQt6Binding().new_bind(test_object, callback_after_update=update)
+    callback = binding.connect("echo", lambda value: received.append(value))
+
+    callback("echo.username", "echo")  # type: ignore
+    assert test_object.username == "echo"
+    assert not received
+    assert binding.suppressed_echoes == 1
+
+    test_object.age = 40
+    binding.update_in_view(test_object)
+    assert received == [test_object]
+
+    # after an invalid value the View is updated with the value of the model
+    callback("echo.username", "x")  # type: ignore
+    assert test_object.username == "echo"
+    assert received == [test_object, test_object]
+    assert binding.suppressed_echoes == 1
+
+
+def test_pyqt_binding_fields(qtbot: QtBot, function_scoped_fixture: str) -> None:
+    # Slots connected to fields are only called when their field changes.
+    test_object = User()
+    edits: List[str] = []
+    ages: List[int] = []
+    edit_box = QLineEdit()
+    qtbot.addWidget(edit_box)
+
+    binding = PyQt6Binding().new_bind(test_object)
+    callback = binding.connect("fields", lambda _value: None)
+    edit_box.textChanged.connect(lambda text: callback("fields.username", text))  # type: ignore
+    edit_box.textChanged.connect(edits.append)
+    binding.connect_field("fields.username", edit_box.setText, edit_box)
+    binding.connect_field("ranges[1].max_value", ages.append)
+
+    binding.update_in_view(test_object)
+    assert edit_box.text() == "default_user"
+    assert not edits  # signals of the edit box are blocked
+    assert ages == [3]
+
+    test_object.ranges[1].max_value = 4
+    binding.update_in_view(test_object)
+    assert ages == [3, 4]
+    assert not edits
+
+    edit_box.setText("new")
+    assert test_object.username == "new"
+    assert edits == ["new"]
+    assert ages == [3, 4]
+
+
+def test_pyqt_binding_large_list(function_scoped_fixture: str) -> None:
+    # Only the changed item of a large list is validated, the other items are kept.
+    test_object = User(ranges=[Range(min_value=i, max_value=i + 1) for i in range(50_000)])
+    results: List[Dict[str, Any]] = []
+    binding = PyQt6Binding().new_bind(test_object, callback_after_update=results.append)
+    callback = cast(Callable, binding.connect("large", lambda _value: None))
+    unchanged = test_object.ranges[0]
+
+    start = time.perf_counter()
+    callback("large.ranges[30000].max_value", 40_000)
+    assert time.perf_counter() - start < 0.5
+    assert results[-1]["updated"] == ["ranges[30000].max_value"]
+    assert test_object.ranges[30_000].max_value == 40_000
+    assert test_object.ranges[0] is unchanged
+
+    callback("large.ranges[5].max_value", 0)
+    assert results[-1]["errored"] == ["ranges[5]"]
+    assert test_object.ranges[5].max_value == 6
+
+
+def test_pyqt_record_replay(tmp_path: Any, function_scoped_fixture: str) -> None:
+    # Updates made by the View are recorded to a file and replayed against a new ViewModel.
+    recorder = Recorder()
+    test_object = User()
+    callback = cast(Callable, PyQt6Binding().new_bind(test_object).connect("session", lambda _value: None))
+    recorder.start()
+    try:
+        callback("session.username", "recorded")
+        callback("session.ranges[1].max_value", 10)
+        callback("session.age", 10)  # invalid
+    finally:
+        recorder.stop()
+    callback("session.age", 60)  # not recorded
+    path = str(tmp_path / "session.rec")
+    recorder.save(path)
+
+    bindings_map.clear()  # as in a new session
+    replayed = User()
+    PyQt6Binding().new_bind(replayed).connect("session", lambda _value: None)
+    results = replay_pyqt(load_recording(path), speed=None)
+    assert [result.event.key for result in results] == [
+        "session.username",
+        "session.ranges[1].max_value",
+        "session.age",
+    ]
+    assert replayed.username == "recorded"
+    assert replayed.ranges[1].max_value == 10
+    assert replayed.age == 30
+    summary = summarize(results)
+    assert summary["count"] == 3 and summary["timed_out"] == 0 and summary["max"] > 0
+
+
+def test_pyqt_binding_validate_in_thread(qtbot: QtBot, function_scoped_fixture: str) -> None:
+    # Changes are validated in a background thread and applied in order in the GUI thread.
+    test_object = User()
+    results: List[Dict[str, Any]] = []
+    binding = PyQt6Binding(validate_in_thread=True).new_bind(test_object, callback_after_update=results.append)
+    callback = cast(Callable, binding.connect("threaded", lambda _value: None))
+
+    callback("threaded.username", "first")
+    callback("threaded.age", 50)
+    callback("threaded.age", 10)  # invalid
+    qtbot.waitUntil(lambda: len(results) == 3, timeout=2000)
+
+    assert [result["updated"] for result in results] == [["username"], ["age"], []]
+    assert results[2]["errored"] == ["age"]
+    assert test_object.username == "first"
+    assert test_object.age == 50
+
+
+def test_pyqt_binding_validate_in_thread_concurrent_change(qtbot: QtBot, function_scoped_fixture: str) -> None:
+    # Only the edited path is applied, a field changed by the ViewModel during the validation is kept.
+    test_object = SlowForm()
+    results: List[Dict[str, Any]] = []
+    binding = PyQt6Binding(validate_in_thread=True).new_bind(test_object, callback_after_update=results.append)
+    callback = cast(Callable, binding.connect("slow_form", lambda _value: None))
+
+    callback("slow_form.slow.value", 1)
+    test_object.other = 5
+    qtbot.waitUntil(lambda: len(results) == 1, timeout=2000)
+
+    assert results[0]["updated"] == ["slow.value"]
+    assert test_object.slow.value == 1
+    assert test_object.other == 5
+
+
+def test_pyqt_table_model(function_scoped_fixture: str) -> None:
+    # Changes of a list of models are sent to Qt views as minimal notifications, edits are validated per row.
+    test_object = User()
+    after_update_results: Dict[str, Any] = {}
+    binding = PyQt6Binding().new_bind(test_object, callback_after_update=after_update_results.update)
+    binding.connect("table", lambda _value: None)
+    table = PydanticTableModel(binding, "table.ranges")
+    notifications: List[Any] = []
+    table.dataChanged.connect(lambda first, last: notifications.append(("changed", first.row(), last.row())))
+    table.rowsInserted.connect(lambda _parent, first, last: notifications.append(("inserted", first, last)))
+    table.rowsRemoved.connect(lambda _parent, first, last: notifications.append(("removed", first, last)))
+
+    assert table.rowCount() == 3
+    assert table.headerData(0, Qt.Orientation.Horizontal) == "Min Val"
+    assert table.data(table.index(1, 1)) == "3"
+
+    test_object.ranges[1].max_value = 4
+    test_object.ranges.append(Range(min_value=6, max_value=7))
+    binding.update_in_view(test_object)
+    assert notifications == [("inserted", 3, 3), ("changed", 1, 1)]
+
+    notifications.clear()
+    test_object.ranges.pop()
+    binding.update_in_view(test_object)
+    assert notifications == [("removed", 3, 3)]
+
+    notifications.clear()
+    assert table.setData(table.index(2, 0), 3)
+    assert test_object.ranges[2].min_value == 3
+    assert after_update_results["updated"] == ["ranges[2].min_value"]
+    assert notifications == [("changed", 2, 2)]
+
+    assert not table.setData(table.index(2, 0), 10)  # min_value >= max_value
+    assert after_update_results["errored"] == ["ranges[2]"]
+    assert test_object.ranges[2].min_value == 3
+
+
+def test_pyqt_binding_observable_model(function_scoped_fixture: str) -> None:
+    # Unchanged values from the View are detected without comparing models, flush sends the model to the View.
+    test_object = ObservableUser()
+    received: List[Any] = []
+    after_update_results: Dict[str, Any] = {}
+
+    binding = PyQt6Binding().new_bind(test_object, callback_after_update=after_update_results.update)
+    callback = binding.connect("observable", lambda value: received.append(value))
+
+    callback("observable.age", 30)  # type: ignore
+    assert not after_update_results
+    callback("observable.ranges[0].max_value", 2)  # type: ignore
+    assert after_update_results["updated"] == ["ranges[0].max_value"]
+    assert test_object.ranges[0].max_value == 2
+    assert not test_object.dirty_fields
+
+    test_object.username = "test"
+    assert test_object.flush() == ["username"]
+    assert received == [test_object]
+
+
+@pytest.mark.parametrize("validate_in_thread", [False, True])
+def test_pyqt_binding_normalizing_validator(
+    qtbot: QtBot, function_scoped_fixture: str, validate_in_thread: bool
+) -> None:
+    # Fields changed by a model validator are set in the model and reported together with the edited field.
+    bounds = Bounds()
+    bounds_list = BoundsList()
+    results: List[Dict[str, Any]] = []
+    binding = PyQt6Binding(validate_in_thread=validate_in_thread)
+    bounds_callback = cast(
+        Callable, binding.new_bind(bounds, callback_after_update=results.append).connect("r", lambda _value: None)
+    )
+    list_callback = cast(
+        Callable, binding.new_bind(bounds_list, callback_after_update=results.append).connect("l", lambda _value: None)
+    )
+
+    bounds_callback("r.lo", 20)
+    list_callback("l.bounds[1].lo", 30)
+    qtbot.waitUntil(lambda: len(results) == 2, timeout=2000)
+
+    assert sorted(results[0]["updated"]) == ["hi", "lo"]
+    assert (bounds.lo, bounds.hi) == (20, 20)
+    assert sorted(results[1]["updated"]) == ["bounds[1].hi", "bounds[1].lo"]
+    assert (bounds_list.bounds[1].lo, bounds_list.bounds[1].hi) == (30, 30)
+    assert bounds_list.bounds[0] == Bounds()
+
+
+def test_pyqt_binding_nested_observable_model(function_scoped_fixture: str) -> None:
+    # Models nested two levels deep stay tracked after edits from the View and assignments of validated copies.
+    test_object = ObservableProject()
+    binding = PyQt6Binding().new_bind(test_object)
+    callback = cast(Callable, binding.connect("project", lambda _value: None))
+
+    callback("project.group.items[0].max_value", 2)
+    assert test_object.group.items[0].max_value == 2
+    test_object.group.items.append(ObservableRange())
+    assert test_object.dirty_fields == ["group.items"]
+    test_object.flush()
+
+    test_object.group = ObservableGroup.model_validate(test_object.group.model_dump(), context=DETACHED_CONTEXT)
+    test_object.flush()
+    test_object.group.items[0].min_value = 1
+    assert test_object.dirty_fields == ["group.items[0].min_value"]
+
+
+def test_pyqt_binding_decimated_series(function_scoped_fixture: str) -> None:
+    # The series is emitted decimated, a zoom request from the View emits the decimated visible range.
+    np = pytest.importorskip("numpy")
+    from nova.mvvm.ndarray_utils import DecimatedSeries
+
+    series = DecimatedSeries(np.arange(100_000, dtype=np.float64), resolution=100)
+    received: List[Any] = []
+
+    binding = PyQt6Binding().new_bind(series)
+    callback = binding.connect("series", lambda value: received.append(value))
+
+    binding.update_in_view(series)
+    assert len(received[-1]["x"]) == 200
+
+    callback("series.x_range", (10, 20))  # type: ignore
+    assert list(received[-1]["x"]) == list(range(9, 22))
+
+
 res = 0
 progress_value: float = -1
 
@@ -166,3 +476,58 @@ def test_pyqt_worker(qtbot: QtBot, function_scoped_fixture: str) -> None:
 
     assert res == 1
     assert progress_value == 100
+
+
+def busy_task(progress: Callable) -> None:
+    for i in range(100_000):
+        progress("step", i // 1000)
+
+
+def test_pyqt_worker_progress_throttle(qtbot: QtBot) -> None:
+    # A task reporting progress in a tight loop emits few signals, the final value is always delivered.
+    worker = PyQt6Binding().new_worker(busy_task)
+    received: List[Any] = []
+    worker.connect_progress(lambda message, value: received.append((message, value)))
+
+    with qtbot.waitSignal(cast(PyQt6Worker, worker).signals.finished, timeout=5000):
+        worker.start()
+
+    assert received[0] == ("step", 0)
+    assert received[-1] == ("step", 99)
+    assert len(received) <= 100
+    assert worker.progress_throttle.skipped > 99_000
+
+
+def test_pyqt_binding_disconnect(function_scoped_fixture: str) -> None:
+    # Disposed ViewModels are garbage collected once their bindings are disconnected, without retaining memory.
+    received: List[Any] = []
+    view_model = ViewModel(PyQt6Binding(), User())
+    view_model.binding.connect("disposed", lambda value: received.append(value))
+    cast(PyQtCommunicator, view_model.binding).connect_field("username", lambda value: received.append(value))
+    reference = weakref.ref(view_model)
+
+    view_model.binding.disconnect()
+    assert "disposed" not in bindings_map
+    view_model.binding.update_in_view(view_model.model)
+    assert not received
+    del view_model
+    gc.collect()
+    assert reference() is None
+
+    def create_and_dispose(count: int) -> None:
+        for i in range(count):
+            view_model = ViewModel(PyQt6Binding(), User())
+            view_model.binding.connect(f"disposed_{i}", lambda value: received.append(value))
+            view_model.binding.disconnect()
+
+    create_and_dispose(10)  # warm up caches
+    gc.collect()
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        create_and_dispose(200)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    assert retained / 200 < 1000
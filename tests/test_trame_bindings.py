@@ -1,7 +1,10 @@
 """Test package."""
 
 import asyncio
+import gc
+import threading
 import time
+import weakref
 from typing import Any, AsyncGenerator, Dict, List
 
 import pytest
@@ -11,10 +14,15 @@ from trame_server import Server
 
 from nova.mvvm import bindings_map
 from nova.mvvm._internal.utils import rgetattr, rsetdictvalue
-from nova.mvvm.trame_binding import TrameBinding
+from nova.mvvm.list_utils import ListWindow
+from nova.mvvm.metrics import Metrics
+from nova.mvvm.replay import Recorder, load_recording, replay_trame, summarize
+from nova.mvvm.tracing import Tracer
+from nova.mvvm.trame_binding import MsgpackSerializer, OrjsonSerializer, StateSerializer, TrameBinding
+from nova.mvvm.trame_binding.callback_scheduler import CallbackScheduler
 from nova.mvvm.trame_binding.trame_worker import ProgressCallback
 
-from .model import User
+from .model import ObservableRange, ObservableUser, Range, SlowForm, SlowModel, User, ViewModel
 
 
 @pytest_asyncio.fixture(scope="function")  # Default scope
@@ -168,6 +176,599 @@ async def test_binding_same_object(server: Server, function_scoped_fixture: str)
         binding.connect("test_object1")
 
 
+@pytest.mark.asyncio
+async def test_binding_ndarray(server: Server, function_scoped_fixture: str) -> None:
+    # NumPy arrays are sent to the state as typed arrays and updated from binary data sent by the client.
+    np = pytest.importorskip("numpy")
+    from .ndarray_model import Spectrum
+
+    after_update_results = {}
+    test_object = Spectrum()
+
+    async def after_update(results: Dict[str, Any]) -> None:
+        after_update_results.update(results)
+
+    binding = TrameBinding(server.state).new_bind(test_object, callback_after_update=after_update)
+    binding.connect("spectrum")
+
+    encoded = server.state["spectrum"]["counts"]
+    assert encoded["__ndarray__"] == np.dtype(np.float64).str
+    assert encoded["shape"] == [10]
+    assert np.array_equal(np.frombuffer(encoded["data"], dtype=np.float64), test_object.counts)
+
+    new_counts = np.ones(10)
+    server.state["spectrum"]["counts"] = {"__ndarray__": "<f8", "shape": [10], "data": new_counts.tobytes()}
+    await flush_state(server, "spectrum")
+
+    assert after_update_results["updated"] == ["counts"]
+    assert np.array_equal(test_object.counts, new_counts)
+
+
+@pytest.mark.asyncio
+async def test_binding_decimated_series(server: Server, tmp_path: Any, function_scoped_fixture: str) -> None:
+    # A memory-mapped series is sent decimated and decimated again for the range requested by the View.
+    np = pytest.importorskip("numpy")
+    from nova.mvvm.ndarray_utils import DecimatedSeries
+
+    data = np.memmap(tmp_path / "spectrum.dat", dtype=np.float64, mode="w+", shape=(1_000_000,))
+    data[:] = np.sin(np.arange(1_000_000) / 1000)
+    data[500_000] = 5  # a peak must survive decimation
+    series = DecimatedSeries(data, resolution=500)
+
+    binding = TrameBinding(server.state).new_bind(series)
+    binding.connect("series")
+
+    view = server.state["series"]
+    assert view["total_points"] == 1_000_000
+    assert view["x"]["shape"] == [1000]
+    assert np.frombuffer(view["y"]["data"]).max() == 5
+
+    server.state["series"]["x_range"] = [1000, 1999]
+    await flush_state(server, "series")
+
+    x = np.frombuffer(server.state["series"]["x"]["data"], dtype=np.int64)
+    assert series.x_range == (1000, 1999)
+    assert x[0] == 999 and x[-1] == 2000 and len(x) <= 1000
+
+
+@pytest.mark.asyncio
+async def test_binding_list_window(server: Server, function_scoped_fixture: str) -> None:
+    # Only the requested page is sent, sorted and filtered, and is not sent again if it has not changed.
+    items = [User(username=f"user{i}", email=f"user{i}@example.com") for i in range(1000)]
+    window = ListWindow(items, page_size=10, filter_fields=["username"])
+
+    binding = TrameBinding(server.state).new_bind(window)
+    binding.connect("users")
+
+    view = server.state["users"]
+    assert view["total"] == 1000
+    assert [row["username"] for row in view["rows"]] == [f"user{i}" for i in range(10)]
+
+    server.state["users"]["page"] = 2
+    await flush_state(server, "users")
+    assert server.state["users"]["indices"] == list(range(20, 30))
+
+    server.state["users"]["filter"] = "USER99"
+    server.state["users"]["sort_by"] = "username"
+    server.state["users"]["descending"] = True
+    await flush_state(server, "users")
+    view = server.state["users"]
+    assert view["total"] == 11 and view["page"] == 1
+    assert [row["username"] for row in view["rows"]] == ["user99"]  # last in descending order
+
+    def sent_keys() -> set:
+        server.state["marker"] = time.time()
+        server.state.flush()
+        binding.update_in_view(window)
+        return server.state.modified_keys - {"marker"}
+
+    items[500].username = "user500a"  # filtered out
+    assert sent_keys() == set()
+    items.append(User(username="user9999"))
+    assert sent_keys() == {"users"}
+    assert server.state["users"]["total"] == 12
+
+
+def test_list_window_sort_none_last() -> None:
+    # Rows without a value are shown after the other rows in both directions.
+    window = ListWindow([{"value": 1}, {"value": None}, {"value": 3}, {}])
+    window.set_view(sort_by="value")
+    assert window.indices == [0, 2, 1, 3]
+    window.set_view(descending=True)
+    assert window.indices == [2, 0, 1, 3]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("serializer", [OrjsonSerializer(), MsgpackSerializer()], ids=["orjson", "msgpack"])
+async def test_binding_serializer(server: Server, serializer: StateSerializer, function_scoped_fixture: str) -> None:
+    # Values are stored in the state in the serializer format and decoded when the View updates them.
+    np = pytest.importorskip("numpy")
+    from .ndarray_model import Spectrum
+
+    after_update_results = {}
+    test_object = Spectrum()
+
+    async def after_update(results: Dict[str, Any]) -> None:
+        after_update_results.update(results)
+
+    binding = TrameBinding(server.state, serializer=serializer).new_bind(
+        test_object, callback_after_update=after_update
+    )
+    name = type(serializer).__name__.lower()  # state is shared between tests
+    binding.connect(name)
+
+    value = serializer.load(server.state[name])
+    assert value["name"] == "spectrum"
+    assert np.array_equal(value["counts"], test_object.counts)
+
+    value["name"] = "new_name"
+    server.state[name] = serializer.dump(value)
+    await flush_state(server, name)
+
+    assert after_update_results["updated"] == ["name"]
+    assert test_object.name == "new_name"
+
+
+@pytest.mark.asyncio
+async def test_binding_shards(server: Server, function_scoped_fixture: str) -> None:
+    # Sub-models are stored in separate state variables and only changed variables are sent.
+    after_update_results = {}
+    test_object = User()
+
+    async def after_update(results: Dict[str, Any]) -> None:
+        after_update_results.update(results)
+
+    binding = TrameBinding(server.state).new_bind(test_object, callback_after_update=after_update)
+    binding.connect("sharded", shards=True)
+
+    assert server.state["sharded"]["username"] == "default_user"
+    assert "ranges" not in server.state["sharded"]
+    assert server.state["sharded_ranges"][1] == {"min_value": 2, "max_value": 3}
+
+    binding.update_in_view(test_object)
+    test_object.username = "test"
+    binding.update_in_view(test_object)
+    assert server.state.modified_keys == {"sharded"}
+    assert server.state["sharded"]["username"] == "test"
+
+    server.state["sharded_ranges"][1]["min_value"] = -1
+    await flush_state(server, "sharded_ranges")
+    assert after_update_results["updated"] == ["ranges[1].min_value"]
+    assert test_object.ranges[1].min_value == -1
+
+
+@pytest.mark.asyncio
+async def test_binding_columnar(server: Server, function_scoped_fixture: str) -> None:
+    # A large list of models is stored as typed arrays per field, only rows changed by the View are validated.
+    np = pytest.importorskip("numpy")
+    after_update_results: Dict[str, Any] = {}
+    test_object = User(ranges=[Range(min_value=i, max_value=i + 1) for i in range(50_000)])
+
+    async def after_update(results: Dict[str, Any]) -> None:
+        after_update_results.update(results)
+
+    binding = TrameBinding(server.state).new_bind(test_object, callback_after_update=after_update)
+    binding.connect("columnar", columnar=["ranges"])
+
+    assert "ranges" not in server.state["columnar"]
+    columns = server.state["columnar_ranges"]["__columns__"]
+    assert server.state["columnar_ranges"]["length"] == 50_000
+    assert np.frombuffer(columns["max_value"]["data"], dtype=np.int64)[30_000] == 30_001
+    binding.update_in_view(test_object)
+
+    def sent_keys() -> set:
+        server.state["marker"] = time.time()
+        server.state.flush()
+        binding.update_in_view(test_object)
+        return server.state.modified_keys - {"marker"}
+
+    assert sent_keys() == set()
+    test_object.ranges[10].max_value = 100
+    assert sent_keys() == {"columnar_ranges"}
+
+    unchanged = test_object.ranges[0]
+    columns = server.state["columnar_ranges"]["__columns__"]
+    max_values = np.arange(1, 50_001)
+    max_values[10] = 100
+    max_values[30_000] = 40_000
+    columns["max_value"] = {"__ndarray__": max_values.dtype.str, "shape": [50_000], "data": max_values.tobytes()}
+    await flush_state(server, "columnar_ranges")
+    assert after_update_results["updated"] == ["ranges[30000].max_value"]
+    assert test_object.ranges[30_000].max_value == 40_000
+    assert test_object.ranges[0] is unchanged
+
+    max_values[5] = 0  # fails the model validation of the row
+    columns["max_value"] = {"__ndarray__": max_values.dtype.str, "shape": [50_000], "data": max_values.tobytes()}
+    await flush_state(server, "columnar_ranges")
+    assert after_update_results["errored"] == ["ranges[5]"]
+    assert test_object.ranges[5].max_value == 6
+
+
+@pytest.mark.asyncio
+async def test_binding_large_list(server: Server, function_scoped_fixture: str) -> None:
+    # Only the list items changed by the View are validated, the other items are kept.
+    after_update_results: Dict[str, Any] = {}
+    test_object = User(ranges=[Range(min_value=i, max_value=i + 1) for i in range(50_000)])
+
+    async def after_update(results: Dict[str, Any]) -> None:
+        after_update_results.update(results)
+
+    binding = TrameBinding(server.state).new_bind(test_object, callback_after_update=after_update)
+    binding.connect("large")
+    unchanged = test_object.ranges[0]
+
+    server.state["large"]["ranges"][30_000]["max_value"] = 40_000
+    await flush_state(server, "large")
+    assert after_update_results["updated"] == ["ranges[30000].max_value"]
+    assert test_object.ranges[30_000].max_value == 40_000
+    assert test_object.ranges[0] is unchanged
+
+    server.state["large"]["ranges"][5]["max_value"] = 0
+    await flush_state(server, "large")
+    assert after_update_results["errored"] == ["ranges[5]"]
+    assert test_object.ranges[5].max_value == 6
+
+
+@pytest.mark.asyncio
+async def test_binding_validate_in_thread(server: Server, function_scoped_fixture: str) -> None:
+    # Values are validated in a thread, the result of a value superseded by a newer one is discarded.
+    results: List[Dict[str, Any]] = []
+    test_object = SlowModel()
+    binding = TrameBinding(server.state, validate_in_thread=True).new_bind(
+        test_object, callback_after_update=results.append
+    )
+    binding.connect("slow")
+
+    for value in (1, 2):
+        with server.state:
+            server.state["slow"]["value"] = value
+            server.state.dirty("slow")
+        await asyncio.sleep(0.05)  # the event loop is not blocked by the validation
+    await asyncio.sleep(1)
+
+    assert results == [{"updated": ["value"], "errored": [], "error": None}]
+    assert test_object.value == 2
+
+
+@pytest.mark.asyncio
+async def test_binding_validate_in_thread_concurrent_change(server: Server, function_scoped_fixture: str) -> None:
+    # The value is compared with a snapshot of the model, a field changed by the ViewModel meanwhile is kept.
+    results: List[Dict[str, Any]] = []
+    test_object = SlowForm()
+    binding = TrameBinding(server.state, validate_in_thread=True).new_bind(
+        test_object, callback_after_update=results.append
+    )
+    binding.connect("slow_form")
+
+    with server.state:
+        server.state["slow_form"]["slow"]["value"] = 1
+        server.state.dirty("slow_form")
+    await asyncio.sleep(0.05)
+    test_object.other = 5
+    await asyncio.sleep(1)
+
+    assert results == [{"updated": ["slow.value"], "errored": [], "error": None}]
+    assert test_object.slow.value == 1
+    assert test_object.other == 5
+
+
+@pytest.mark.asyncio
+async def test_callback_scheduler_latest() -> None:
+    # A new call cancels the call in progress and gets its updated fields.
+    started: List[List[str]] = []
+    finished: List[List[str]] = []
+
+    async def callback(results: Dict[str, Any]) -> None:
+        started.append(results["updated"])
+        await asyncio.sleep(0.1)
+        finished.append(results["updated"])
+
+    scheduler = CallbackScheduler(callback, "latest")
+    for field in ("a", "b", "c"):
+        await scheduler.submit({"updated": [field], "errored": [], "error": None})
+        await asyncio.sleep(0.01)
+    await asyncio.sleep(0.3)
+
+    assert started == [["a"], ["a", "b"], ["a", "b", "c"]]
+    assert finished == [["a", "b", "c"]]
+
+
+@pytest.mark.asyncio
+async def test_callback_scheduler_serial_bounded() -> None:
+    # Calls run one at a time, results exceeding the queue size are merged into the last queued ones.
+    calls: List[List[str]] = []
+
+    async def callback(results: Dict[str, Any]) -> None:
+        calls.append(results["updated"])
+        await asyncio.sleep(0.05)
+
+    scheduler = CallbackScheduler(callback, "serial", max_pending=1)
+    await asyncio.gather(*(scheduler.submit({"updated": [field]}) for field in ("a", "b", "c", "d")))
+
+    assert calls == [["a"], ["b", "c", "d"]]
+    assert scheduler.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_callback_scheduler_serial_errors() -> None:
+    # Exceptions and cancellation of the call propagate to the caller with the serial policy.
+    async def failing(_results: Dict[str, Any]) -> None:
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError):
+        await CallbackScheduler(failing, "serial").submit({"updated": ["a"]})
+
+    async def slow(_results: Dict[str, Any]) -> None:
+        await asyncio.sleep(1)
+
+    scheduler = CallbackScheduler(slow, "serial")
+    task = asyncio.ensure_future(scheduler.submit({"updated": ["a"]}))
+    await asyncio.sleep(0.05)
+    await scheduler.submit({"updated": ["b"]})  # queued, processed by the running call
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert scheduler.pending == 1
+
+
+@pytest.mark.asyncio
+async def test_binding_update_from_thread(server: Server, function_scoped_fixture: str) -> None:
+    # Updates from a worker thread are applied on the event loop, repeated updates are coalesced.
+    test_object = User()
+    binding = TrameBinding(server.state).new_bind(test_object)
+    binding.connect("threaded_view")
+
+    def work() -> None:
+        for i in range(10):
+            test_object.username = f"user{i}"
+            binding.update_in_view(test_object)
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()  # blocks the event loop, so the updates cannot be applied yet
+    assert server.state["threaded_view"]["username"] == "default_user"
+
+    await asyncio.sleep(0.1)
+    assert server.state["threaded_view"]["username"] == "user9"
+    assert binding.coalesced_updates == 9
+
+
+@pytest.mark.asyncio
+async def test_binding_update_from_thread_order(server: Server, function_scoped_fixture: str) -> None:
+    # Updates from a worker thread are applied in order, only consecutive updates of the same value are coalesced.
+    binding = TrameBinding(server.state).new_bind()
+    binding.connect("ordered_view")
+    first, second = User(username="first"), User(username="second")
+
+    def work() -> None:
+        for value in (first, first, second, first):
+            binding.update_in_view(value)
+
+    thread = threading.Thread(target=work)
+    thread.start()
+    thread.join()
+    await asyncio.sleep(0.1)
+    assert server.state["ordered_view"]["username"] == "first"
+    assert binding.coalesced_updates == 1
+
+
+def test_binding_update_from_thread_connected_before_start() -> None:
+    # The event loop is taken from the server when the binding is connected before the server starts.
+    test_server = get_server("nova_mvvm_loop_test")
+    test_object = User()
+    binding = TrameBinding(test_server.state).new_bind(test_object)
+    binding.connect("early_view")
+
+    async def run() -> None:
+        task = asyncio.create_task(test_server.start(port=0, exec_mode="coroutine", open_browser=False))
+        await asyncio.sleep(1)
+
+        def work() -> None:
+            test_object.username = "worker"
+            binding.update_in_view(test_object)
+
+        thread = threading.Thread(target=work)
+        thread.start()
+        thread.join()  # blocks the event loop, the update is applied later on it
+        assert test_server.state["early_view"]["username"] == "default_user"
+        await asyncio.sleep(0.1)
+        assert test_server.state["early_view"]["username"] == "worker"
+        await test_server.stop()
+        task.cancel()
+
+    try:
+        asyncio.run(run())
+    finally:
+        bindings_map.clear()
+
+
+@pytest.mark.asyncio
+async def test_binding_echo_suppression(server: Server, function_scoped_fixture: str) -> None:
+    # The value sent by the View is not sent back when the ViewModel updates the View from the callback.
+    test_object = User()
+    binding = TrameBinding(server.state).new_bind(test_object, callback_after_update=lambda _: update())
+    binding.connect("echo")
+
+    def update() -> None:
+        binding.update_in_view(test_object)
+
+    server.state["echo"]["username"] = "echo"
+    await flush_state(server, "echo")
+    assert test_object.username == "echo"
+    assert binding.suppressed_echoes == 1
+
+    test_object.age = 40
+    binding.update_in_view(test_object)
+    assert server.state["echo"]["age"] == 40
+    assert binding.suppressed_echoes == 1
+
+
+class Settings:
+    """Plain object for tests."""
+
+    def __init__(self) -> None:
+        self.title = "plot"
+        self.limits = [0, 10]
+        self.scale = 1.0
+
+
+@pytest.mark.asyncio
+async def test_binding_attributes_changes_only(server: Server, function_scoped_fixture: str) -> None:
+    # Only the attributes that changed since the last update are sent.
+    test_object = Settings()
+    binding = TrameBinding(server.state).new_bind(test_object)
+    binding.connect("settings")
+    binding.update_in_view(test_object)
+    assert server.state["settings_limits"] == [0, 10]
+
+    def sent_keys() -> set:
+        server.state["marker"] = time.time()
+        server.state.flush()
+        binding.update_in_view(test_object)
+        return server.state.modified_keys - {"marker"}
+
+    assert sent_keys() == set()
+    test_object.limits.append(20)  # modified in place
+    assert sent_keys() == {"settings_limits"}
+
+    # values received from the View are not sent back
+    server.state["settings_title"] = "new"
+    await flush_state(server, "settings_title")
+    assert test_object.title == "new"
+    assert sent_keys() == set()
+
+
+@pytest.mark.asyncio
+async def test_binding_observable_model(server: Server, function_scoped_fixture: str) -> None:
+    # Changes are recorded on assignment and list mutation, flush sends only the changed shards.
+    test_object = ObservableUser()
+    binding = TrameBinding(server.state).new_bind(test_object)
+    binding.connect("observable", shards=["ranges"])
+    binding.update_in_view(test_object)
+
+    test_object.ranges[1].min_value = -1
+    test_object.ranges.append(ObservableRange())
+    assert test_object.dirty_fields == ["ranges", "ranges[1].min_value"]
+    assert test_object.flush() == ["ranges", "ranges[1].min_value"]
+    assert server.state.modified_keys == {"observable_ranges"}
+    assert server.state["observable_ranges"][1]["min_value"] == -1
+    assert len(server.state["observable_ranges"]) == 3
+    assert not test_object.dirty_fields
+
+    version = test_object.version
+    test_object.age = 30  # same value
+    assert test_object.version == version
+    assert test_object.flush() == []
+
+    # changes received from the View are not recorded
+    server.state["observable"]["username"] = "test"
+    await flush_state(server, "observable")
+    assert test_object.username == "test"
+    assert not test_object.dirty_fields
+
+
+@pytest.mark.asyncio
+async def test_binding_observable_model_version(server: Server, function_scoped_fixture: str) -> None:
+    # update_in_view is skipped while the version of the model does not change.
+    test_object = ObservableUser()
+    binding = TrameBinding(server.state).new_bind(test_object)
+    binding.connect("observable")
+    binding.update_in_view(test_object)
+
+    def sent_keys() -> set:
+        server.state["marker"] = time.time()
+        server.state.flush()
+        binding.update_in_view(test_object)
+        return server.state.modified_keys - {"marker"}
+
+    assert sent_keys() == set()
+    test_object.__dict__["age"] = 40  # not recorded, so the model is not compared
+    assert sent_keys() == set()
+    assert server.state["observable"]["age"] == 30
+
+    test_object.username = "test"
+    assert sent_keys() == {"observable"}
+    assert server.state["observable"]["age"] == 40
+    assert server.state["observable"]["username"] == "test"
+
+    # a value received from the View invalidates the version
+    server.state["observable"]["age"] = 50
+    await flush_state(server, "observable")
+    assert test_object.age == 50
+    test_object.__dict__["age"] = 60
+    assert sent_keys() == {"observable"}
+    assert server.state["observable"]["age"] == 60
+
+
+@pytest.mark.asyncio
+async def test_binding_metrics(server: Server, function_scoped_fixture: str) -> None:
+    # Updates in both directions are counted per binding name with their durations, payload and validation errors.
+    metrics = Metrics()
+    test_object = User()
+    binding = TrameBinding(server.state).new_bind(test_object)
+    binding.connect("metrics_user")
+    binding.update_in_view(test_object)
+    await flush_state(server, "metrics_user")
+    assert metrics.get() == {}
+
+    metrics.enable()
+    try:
+        test_object.username = "changed"
+        binding.update_in_view(test_object)
+        server.state["metrics_user"]["age"] = 10  # invalid
+        await flush_state(server, "metrics_user")
+        server.state["metrics_user"]["age"] = 40
+        await flush_state(server, "metrics_user")
+    finally:
+        metrics.disable()
+    binding.update_in_view(test_object)  # not recorded
+
+    assert test_object.age == 40
+    user_metrics = metrics.get("metrics_user")
+    assert user_metrics["updates"]["model_to_view"] == 1
+    assert user_metrics["updates"]["view_to_model"] >= 2
+    assert user_metrics["validation_errors"] >= 1
+    assert user_metrics["payload_bytes"] > 0
+    assert user_metrics["durations"]["validate"]["count"] >= 2
+    assert {"serialize", "diff", "view_update", "model_update"} <= user_metrics["durations"].keys()
+
+    text = metrics.to_prometheus()
+    assert 'nova_mvvm_updates_total{binding="metrics_user",direction="model_to_view"} 1' in text
+    assert 'nova_mvvm_duration_seconds_bucket{binding="metrics_user",operation="validate",le="+Inf"}' in text
+    assert 'nova_mvvm_validation_errors_total{binding="metrics_user"}' in text
+
+
+@pytest.mark.asyncio
+async def test_record_replay(server: Server, tmp_path: Any, function_scoped_fixture: str) -> None:
+    # State changes made by the View are recorded to a file and replayed headlessly with their latencies.
+    test_object = User()
+    TrameBinding(server.state).new_bind(test_object).connect("recorded_user")
+    recorder = Recorder(bindings=["recorded_user"])
+    recorder.start()
+    try:
+        server.state["recorded_user"]["username"] = "recorded"
+        await flush_state(server, "recorded_user")
+        server.state["recorded_user"]["age"] = 45
+        await flush_state(server, "recorded_user")
+    finally:
+        recorder.stop()
+    path = str(tmp_path / "session.rec")
+    recorder.save(path)
+    events = load_recording(path)
+    assert [event.binding for event in events] == ["recorded_user", "recorded_user"]
+    assert [(event.value["username"], event.value["age"]) for event in events] == [("recorded", 30), ("recorded", 45)]
+    assert 0 <= events[0].time < events[1].time
+
+    bindings_map.clear()  # as in a new session
+    replayed = User()
+    TrameBinding(server.state).new_bind(replayed).connect("recorded_user")
+    results = await replay_trame(events, server.state, speed=None)
+    assert replayed.username == "recorded"
+    assert replayed.age == 45
+    summary = summarize(results)
+    assert summary["count"] == 2 and summary["timed_out"] == 0 and summary["max"] < 1
+
+
 res = 0
 progress_value: float = -1
 
@@ -192,3 +793,85 @@ async def test_trame_worker(server: Server, function_scoped_fixture: str) -> Non
     await asyncio.sleep(2)
     assert res == 1
     assert progress_value == 100
+
+
+def slow_task(progress: ProgressCallback) -> None:
+    progress("step", 10)
+    progress("step", 20)
+    time.sleep(1)
+
+
+@pytest.mark.asyncio
+async def test_trame_worker_progress_trailing(server: Server, function_scoped_fixture: str) -> None:
+    # A report skipped because it came too early is delivered by the monitor loop before the task ends.
+    received: List[Any] = []
+    worker = TrameBinding(server.state).new_worker(slow_task)
+    worker.connect_progress(lambda message, value: received.append((message, value)))
+    worker.start()
+    await asyncio.sleep(0.5)
+    assert received[-1] == ("step", 20)
+    await asyncio.sleep(1)
+    assert received.count(("step", 20)) == 1
+
+
+def traced_task(progress: ProgressCallback) -> int:
+    progress("start", 0)
+    return 1
+
+
+@pytest.mark.asyncio
+async def test_tracer(server: Server, function_scoped_fixture: str) -> None:
+    # The tracer is started from the state, records bounded events of bindings and workers and exports them.
+    tracer = Tracer(capacity=20)
+    tracer.connect_trame(server)
+    test_object = User()
+    binding = TrameBinding(server.state)
+    user_binding = binding.new_bind(test_object)
+    user_binding.connect("traced_user")
+
+    server.state.nova_tracer_running = True
+    await flush_state(server, "nova_tracer_running")
+    assert tracer.running
+    test_object.age = 50
+    user_binding.update_in_view(test_object)
+    binding.new_worker(traced_task).start()
+    await asyncio.sleep(0.5)
+    server.state.nova_tracer_running = False
+    await flush_state(server, "nova_tracer_running")
+    assert not tracer.running
+    user_binding.update_in_view(test_object)
+
+    kinds = [(event.kind, event.binding) for event in tracer.events]
+    assert ("model_update", "traced_user") in kinds
+    for kind in ["worker_start", "worker_run", "worker_progress", "worker_result", "worker_finished"]:
+        assert (kind, "traced_task") in kinds
+
+    trace = tracer.to_chrome_trace()["traceEvents"]
+    update = next(entry for entry in trace if entry["name"] == "model_update traced_user")
+    assert update["ph"] == "X" and update["dur"] > 0
+    progress = next(entry for entry in trace if entry.get("cat") == "worker_progress")
+    assert progress["ph"] == "i" and progress["args"] == {"binding": "traced_task", "fields": ["start"], "value": 0}
+
+    for _ in range(30):
+        tracer(tracer.events[0])
+    assert len(tracer.events) == 20
+
+
+@pytest.mark.asyncio
+async def test_binding_disconnect(server: Server, function_scoped_fixture: str) -> None:
+    # A disposed ViewModel is garbage collected once its binding is disconnected, the View no longer updates it.
+    view_model = ViewModel(TrameBinding(server.state), User())
+    view_model.binding.connect("disposed")
+    reference = weakref.ref(view_model)
+
+    view_model.binding.disconnect()
+    assert "disposed" not in bindings_map
+    server.state["disposed"]["username"] = "changed"
+    await flush_state(server, "disposed")
+    assert view_model.model.username == "default_user"
+    assert not view_model.updates
+    view_model.binding.update_in_view(view_model.model)  # ignored
+
+    del view_model
+    gc.collect()
+    assert reference() is None